@@ -138,18 +138,18 @@ async def analyze_gap_from_text(request: AnalyzeGapFromTextRequest):
         if not file_info:
             raise HTTPException(status_code=404, detail=f"Resume file {request.resume_id} not found")
         
-        text = file_info.get("parsed_text") or file_info.get("content", "")
+        text = file_info.parsed_text or file_info.content
         if isinstance(text, bytes):
             text = text.decode("utf-8", errors="ignore")
         
-        resume_result, error = unified_skill_extractor.extract_from_text(
+        resume_result, error = await unified_skill_extractor.extract_from_text(
             text, source_type="resume"
         )
         if error:
             raise HTTPException(status_code=400, detail=f"Resume extraction error: {error}")
         resume_skills = resume_result
     elif request.resume_text:
-        resume_result, error = unified_skill_extractor.extract_from_text(
+        resume_result, error = await unified_skill_extractor.extract_from_text(
             request.resume_text, source_type="resume"
         )
         if error:
@@ -170,18 +170,18 @@ async def analyze_gap_from_text(request: AnalyzeGapFromTextRequest):
         if not file_info:
             raise HTTPException(status_code=404, detail=f"Job description file {request.jd_id} not found")
         
-        text = file_info.get("parsed_text") or file_info.get("content", "")
+        text = file_info.parsed_text or file_info.content
         if isinstance(text, bytes):
             text = text.decode("utf-8", errors="ignore")
         
-        jd_result, error = unified_skill_extractor.extract_from_text(
+        jd_result, error = await unified_skill_extractor.extract_from_text(
             text, source_type="job_description"
         )
         if error:
             raise HTTPException(status_code=400, detail=f"Job description extraction error: {error}")
         jd_skills = jd_result
     elif request.jd_text:
-        jd_result, error = unified_skill_extractor.extract_from_text(
+        jd_result, error = await unified_skill_extractor.extract_from_text(
             request.jd_text, source_type="job_description"
         )
         if error:
@@ -3,7 +3,6 @@ Skill extraction API endpoints.
 """
 import time
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from fastapi import APIRouter, HTTPException
 from app.models.api_models import ExtractSkillsRequest, ExtractSkillsResponse
 from app.models.schemas import SkillExtractionResult
@@ -11,9 +10,6 @@ from app.services.unified_extraction import unified_skill_extractor
 
 router = APIRouter()
 
-# Thread pool for running synchronous extraction functions in parallel
-executor = ThreadPoolExecutor(max_workers=2)
-
 
 @router.post("/extract", response_model=ExtractSkillsResponse)
 async def extract_skills(request: ExtractSkillsRequest):
@@ -38,24 +34,12 @@ async def extract_skills(request: ExtractSkillsRequest):
         """Extract resume skills."""
         try:
             if request.resume_id:
-                # Run synchronous function in thread pool
-                loop = asyncio.get_event_loop()
-                result, error = await loop.run_in_executor(
-                    executor,
-                    unified_skill_extractor.extract_from_file_id,
-                    request.resume_id
-                )
+                result, error = await unified_skill_extractor.extract_from_file_id(request.resume_id)
                 if error:
                     return None, error
                 return result, None
             elif request.resume_text:
-                loop = asyncio.get_event_loop()
-                result, error = await loop.run_in_executor(
-                    executor,
-                    unified_skill_extractor.extract_from_text,
-                    request.resume_text,
-                    "resume"
-                )
+                result, error = await unified_skill_extractor.extract_from_text(request.resume_text, "resume")
                 if error:
                     return None, error
                 return result, None
@@ -68,23 +52,12 @@ async def extract_skills(request: ExtractSkillsRequest):
         """Extract job description skills."""
         try:
             if request.jd_id:
-                loop = asyncio.get_event_loop()
-                result, error = await loop.run_in_executor(
-                    executor,
-                    unified_skill_extractor.extract_from_file_id,
-                    request.jd_id
-                )
+                result, error = await unified_skill_extractor.extract_from_file_id(request.jd_id)
                 if error:
                     return None, error
                 return result, None
             elif request.job_description_text:
-                loop = asyncio.get_event_loop()
-                result, error = await loop.run_in_executor(
-                    executor,
-                    unified_skill_extractor.extract_from_text,
-                    request.job_description_text,
-                    "job_description"
-                )
+                result, error = await unified_skill_extractor.extract_from_text(request.job_description_text, "job_description")
                 if error:
                     return None, error
                 return result, None
@@ -184,7 +157,7 @@ async def extract_resume_skills(text: str):
     Returns:
         SkillExtractionResult
     """
-    result, error = unified_skill_extractor.extract_from_text(text, source_type="resume")
+    result, error = await unified_skill_extractor.extract_from_text(text, source_type="resume")
     
     if error:
         raise HTTPException(status_code=400, detail=error)
@@ -203,7 +176,7 @@ async def extract_jd_skills(text: str):
     Returns:
         SkillExtractionResult
     """
-    result, error = unified_skill_extractor.extract_from_text(text, source_type="job_description")
+    result, error = await unified_skill_extractor.extract_from_text(text, source_type="job_description")
     
     if error:
         raise HTTPException(status_code=400, detail=error)
@@ -222,7 +195,7 @@ async def extract_skills_from_file(file_id: str):
     Returns:
         SkillExtractionResult
     """
-    result, error = unified_skill_extractor.extract_from_file_id(file_id)
+    result, error = await unified_skill_extractor.extract_from_file_id(file_id)
     
     if error:
         raise HTTPException(status_code=400, detail=error)
@@ -40,20 +40,20 @@ async def parse_file(file_id: str):
     # Get updated file data
     updated_file_data = file_storage.get_file(file_id)
     
-    if not updated_file_data or not updated_file_data.get("parsed_text"):
+    if not updated_file_data or not updated_file_data.parsed_text:
         raise HTTPException(
             status_code=500,
             detail="File parsed but text not available"
         )
     
-    parsed_text = updated_file_data["parsed_text"]
+    parsed_text = updated_file_data.parsed_text
     
     return {
         "file_id": file_id,
         "status": "success",
         "text_length": len(parsed_text),
-        "filename": file_data["filename"],
-        "file_type": file_data["file_type"],
+        "filename": file_data.filename,
+        "file_type": file_data.file_type,
         "preview": parsed_text[:500] if len(parsed_text) > 500 else parsed_text,  # First 500 chars
     }
 
@@ -77,7 +77,7 @@ async def get_parsed_text(file_id: str):
             detail="File not found or session expired"
         )
     
-    parsed_text = file_data.get("parsed_text")
+    parsed_text = file_data.parsed_text
     
     if not parsed_text:
         raise HTTPException(
@@ -89,6 +89,6 @@ async def get_parsed_text(file_id: str):
         "file_id": file_id,
         "text": parsed_text,
         "text_length": len(parsed_text),
-        "filename": file_data["filename"],
+        "filename": file_data.filename,
     }
 
@@ -9,7 +9,7 @@ from app.models.schemas import SkillGapReport
 from app.services.gap_analysis import gap_analyzer
 from app.services.fit_score import fit_score_calculator
 from app.services.recommendations import recommendations_generator
-from app.services.pdf_generator import pdf_report_generator
+from app.services.pdf_generator import render_pdf_bytes_async
 from app.services.unified_extraction import unified_skill_extractor
 from app.utils.file_storage import file_storage
 
@@ -89,11 +89,11 @@ async def generate_pdf_report(request: AnalyzeGapRequest):
             version="1.0.0"
         )
         
-        # Generate PDF
-        pdf_buffer = pdf_report_generator.generate_pdf(report)
+        # Generate PDF in a worker process so concurrent requests don't serialize on the GIL
+        pdf_bytes = await render_pdf_bytes_async(report)
         
         return Response(
-            content=pdf_buffer.read(),
+            content=pdf_bytes,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": "attachment; filename=skill_gap_report.pdf"
@@ -137,8 +137,8 @@ async def generate_pdf_from_ids(
             raise HTTPException(status_code=404, detail=f"Job description file {jd_id} not found")
         
         # Extract text
-        resume_text = resume_file.get("parsed_text") or resume_file.get("content", "")
-        jd_text = jd_file.get("parsed_text") or jd_file.get("content", "")
+        resume_text = resume_file.parsed_text or resume_file.content
+        jd_text = jd_file.parsed_text or jd_file.content
         
         if isinstance(resume_text, bytes):
             resume_text = resume_text.decode("utf-8", errors="ignore")
@@ -146,13 +146,13 @@ async def generate_pdf_from_ids(
             jd_text = jd_text.decode("utf-8", errors="ignore")
         
         # Extract skills
-        resume_result, error = unified_skill_extractor.extract_from_text(
+        resume_result, error = await unified_skill_extractor.extract_from_text(
             resume_text, source_type="resume"
         )
         if error:
             raise HTTPException(status_code=400, detail=f"Resume extraction error: {error}")
         
-        jd_result, error = unified_skill_extractor.extract_from_text(
+        jd_result, error = await unified_skill_extractor.extract_from_text(
             jd_text, source_type="job_description"
         )
         if error:
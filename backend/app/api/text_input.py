@@ -87,8 +87,8 @@ async def get_text_input(text_id: str):
         "text_id": text_id,
         "text": text,
         "text_length": len(text) if text else 0,
-        "source_type": file_data.get("source_type"),
-        "filename": file_data.get("filename"),
+        "source_type": file_data.source_type,
+        "filename": file_data.filename,
         "status": "success"
     }
 
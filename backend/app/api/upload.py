@@ -95,14 +95,14 @@ async def get_file_info(file_id: str):
         )
     
     return {
-        "file_id": file_data["file_id"],
-        "filename": file_data["filename"],
-        "file_type": file_data["file_type"],
-        "file_size": file_data["file_size"],
-        "source_type": file_data["source_type"],
-        "uploaded_at": file_data["uploaded_at"].isoformat(),
-        "has_parsed_text": file_data["parsed_text"] is not None,
-        "has_parsed_data": file_data["parsed_data"] is not None,
+        "file_id": file_data.file_id,
+        "filename": file_data.filename,
+        "file_type": file_data.file_type,
+        "file_size": file_data.file_size,
+        "source_type": file_data.source_type,
+        "uploaded_at": file_data.uploaded_at.isoformat(),
+        "has_parsed_text": file_data.parsed_text is not None,
+        "has_parsed_data": file_data.parsed_data is not None,
     }
 
 
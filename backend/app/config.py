@@ -26,15 +26,28 @@ class Settings(BaseSettings):
     # File Upload Settings
     max_file_size_mb: int = 10
     allowed_extensions: str = ".pdf,.docx,.txt"
+    pdf_parse_workers: int = 4  # Worker processes extracting pages of large PDFs when PyMuPDF is missing
     
     # LLM Settings
     # Model options: gpt-4o (recommended), gpt-4-turbo, gpt-3.5-turbo
     llm_model: str = "gpt-4o"
+    llm_soft_skills_model: str = "gpt-4o-mini"  # Soft skills, education and certifications; empty uses llm_model
     llm_temperature: float = 0.3
     llm_max_tokens: int = 1500  # Reduced from 2000 to speed up responses
+    llm_requests_per_minute: int = 500  # Client-side limits, kept under the account's; 0 disables
+    llm_tokens_per_minute: int = 30000
+    llm_max_concurrency: int = 8  # API calls in flight at once per process
+    llm_cache_ttl_seconds: int = 7 * 24 * 3600  # Reuse identical temperature-0 LLM responses for a week; 0 disables
+    llm_cache_path: str = ""  # SQLite file for cached LLM responses; empty keeps them in memory
+    llm_cache_max_entries: int = 1000  # Oldest cached responses are dropped beyond this; 0 disables
     
     # NLP Settings
     spacy_model: str = "en_core_web_sm"
+    spacy_n_process: int = 1  # Worker processes for batch extraction; keep 1 under forking servers
+    
+    # Report Settings
+    use_weasyprint: bool = False  # Render PDFs from HTML with WeasyPrint instead of ReportLab
+    pdf_render_workers: int = 2  # Worker processes rendering PDFs for the API
     
     @property
     def cors_origins_list(self) -> List[str]:
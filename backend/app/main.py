@@ -1,16 +1,32 @@
 """
 Main FastAPI application entry point.
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import router as api_router
 from app.config import settings
+from app.services.llm_service import llm_service
+from app.services.pdf_generator import shutdown_pdf_process_pool
+from app.services.pdf_parser import shutdown_pdf_parse_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release pooled LLM API connections and PDF rendering and parsing workers on shutdown."""
+    yield
+    await llm_service.aclose()
+    llm_service.close()
+    shutdown_pdf_process_pool()
+    shutdown_pdf_parse_pool()
+
 
 app = FastAPI(
     title=settings.app_name,
     description="AI-powered application to analyze resume-job skill gaps, education alignment, and provide personalized recommendations",
     version=settings.app_version,
     debug=settings.debug,
+    lifespan=lifespan,
 )
 
 # CORS middleware configuration
@@ -18,6 +18,75 @@ class Skill(BaseModel):
         use_enum_values = True
 
 
+class ExtractedSkill(BaseModel):
+    """A skill as returned by the LLM's structured output."""
+    name: str = Field(..., description="Name of the skill")
+    category: SkillCategory = Field(..., description="Category of the skill")
+
+    class Config:
+        extra = "forbid"
+
+
+class SkillList(BaseModel):
+    """Structured-output schema for skill extraction responses."""
+    skills: List[ExtractedSkill] = Field(..., description="Extracted skills")
+
+    class Config:
+        extra = "forbid"
+
+
+class ExtractedEducation(BaseModel):
+    """An education entry as returned by the LLM's structured output."""
+    degree: Optional[str] = Field(..., description="Degree type (Bachelor's, Master's, PhD, etc.)")
+    field: Optional[str] = Field(..., description="Field of study")
+    required: bool = Field(..., description="Whether this education is required")
+    preferred: bool = Field(..., description="Whether this education is preferred")
+
+    class Config:
+        extra = "forbid"
+
+
+class ExtractedCertification(BaseModel):
+    """A certification as returned by the LLM's structured output."""
+    name: str = Field(..., description="Name of the certification")
+    issuer: Optional[str] = Field(..., description="Certifying organization")
+    required: bool = Field(..., description="Whether certification is required")
+    preferred: bool = Field(..., description="Whether certification is preferred")
+
+    class Config:
+        extra = "forbid"
+
+
+class CombinedExtraction(BaseModel):
+    """Structured-output schema for the combined soft skill, education and certification request."""
+    soft_skills: List[ExtractedSkill] = Field(..., description="Soft skills and methodologies")
+    education: List[ExtractedEducation] = Field(..., description="Education entries")
+    certifications: List[ExtractedCertification] = Field(..., description="Certifications")
+
+    class Config:
+        extra = "forbid"
+
+
+class ExtractedResource(BaseModel):
+    """A learning resource as returned by the LLM's JSON-mode course search."""
+    name: Optional[str] = Field("", description="Course or resource name")
+    platform: Optional[str] = Field("Unknown", description="Platform offering the resource")
+    url: Optional[str] = Field("", description="Resource URL")
+    description: Optional[str] = Field(None, description="Brief description")
+    type: Optional[str] = Field("Course", description="Course, Certification or Tutorial")
+
+    class Config:
+        extra = "ignore"
+
+
+class ResourceList(BaseModel):
+    """Schema for learning resource search responses."""
+    resources: List[ExtractedResource] = Field(default_factory=list, description="Suggested resources")
+
+    class Config:
+        extra = "ignore"
+
+
 class Education(BaseModel):
     """Education requirement or qualification."""
     degree: Optional[str] = Field(None, description="Degree type (Bachelor's, Master's, PhD, etc.)")
@@ -2,6 +2,7 @@
 Skill taxonomy and categories.
 """
 from enum import Enum
+from typing import Dict, Tuple
 
 
 class SkillCategory(str, Enum):
@@ -75,3 +76,80 @@ SKILL_CATEGORY_DESCRIPTIONS = {
     SkillCategory.OTHER: "Other skills",
 }
 
+
+
+# Skills recognized by keyword in a short bare skills list, which then skips the LLM.
+# Names that are also everyday English words (Go, R, Swift, Rust, Chef, Slack, Express, ...) are left out
+KNOWN_TECHNICAL_SKILLS: Dict[SkillCategory, Tuple[str, ...]] = {
+    SkillCategory.PROGRAMMING_LANGUAGES: (
+        "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Ruby", "PHP", "Kotlin", "Scala", "MATLAB",
+    ),
+    SkillCategory.FRAMEWORKS_LIBRARIES: (
+        "React", "Django", "Spring Boot", "Flask", "Angular", "Vue", "Node.js", "TensorFlow", "PyTorch",
+        "Keras", "Pandas", "NumPy",
+    ),
+    SkillCategory.DATABASES: (
+        "PostgreSQL", "MySQL", "MongoDB", "Redis", "Cassandra", "SQLite", "DynamoDB", "Elasticsearch",
+    ),
+    SkillCategory.CLOUD_SERVICES: ("AWS", "Azure", "GCP", "Google Cloud", "Heroku", "Vercel", "Netlify"),
+    SkillCategory.DEVOPS: (
+        "Kubernetes", "Docker", "Terraform", "Jenkins", "GitLab CI", "GitHub Actions", "Ansible",
+    ),
+    SkillCategory.TOOLS_PLATFORMS: ("Git", "Jira", "Confluence", "VS Code", "IntelliJ"),
+    SkillCategory.MACHINE_LEARNING: (
+        "Machine Learning", "Deep Learning", "Neural Networks", "NLP", "Computer Vision", "Reinforcement Learning",
+    ),
+    SkillCategory.BLOCKCHAIN: ("Blockchain", "Solidity", "Ethereum", "Smart Contracts", "Web3", "DeFi"),
+}
+
+# Unambiguous spellings of the known skills, taken from the skill matcher's synonyms
+KNOWN_SKILL_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "JavaScript": ("js", "ecmascript"),
+    "C++": ("cpp",),
+    "C#": ("csharp",),
+    "React": ("reactjs", "react.js"),
+    "Angular": ("angularjs", "angular.js"),
+    "Vue": ("vuejs", "vue.js"),
+    "Node.js": ("nodejs",),
+    "Spring Boot": ("springboot",),
+    "AWS": ("amazon web services",),
+    "Azure": ("microsoft azure",),
+    "GCP": ("google cloud platform",),
+    "Kubernetes": ("k8s",),
+    "PostgreSQL": ("postgres",),
+    "MongoDB": ("mongo",),
+}
+
+# Lowercased names of soft skills and methodologies, shared by the LLM category
+# inference and the spaCy keyword fallback
+KNOWN_SOFT_SKILLS: Dict[SkillCategory, Tuple[str, ...]] = {
+    SkillCategory.LEADERSHIP: (
+        "leadership", "team management", "mentoring", "strategic planning", "managing", "supervision",
+        "team leadership", "people management",
+    ),
+    SkillCategory.COMMUNICATION: (
+        "communication", "technical writing", "presentations", "public speaking", "written communication",
+        "verbal communication", "documentation",
+    ),
+    SkillCategory.COLLABORATION: (
+        "collaboration", "teamwork", "pair programming", "code reviews", "cross-functional", "cooperation",
+        "agile collaboration",
+    ),
+    SkillCategory.PROBLEM_SOLVING: (
+        "problem solving", "debugging", "troubleshooting", "critical thinking", "analytical problem solving",
+        "troubleshoot",
+    ),
+    SkillCategory.ANALYTICAL_THINKING: (
+        "analytical thinking", "data analysis", "root cause analysis", "logical reasoning", "analysis",
+        "analytical skills",
+    ),
+    SkillCategory.AGILE: ("agile", "agile development", "agile methodologies", "agile practices"),
+    SkillCategory.SCRUM: (
+        "scrum", "scrum master", "sprint", "scrum practices", "sprint planning", "daily standup",
+        "sprint retrospective",
+    ),
+    SkillCategory.CI_CD: (
+        "ci/cd", "continuous integration", "continuous deployment", "continuous delivery", "ci", "cd",
+        "pipeline", "devops pipeline",
+    ),
+}
@@ -5,7 +5,7 @@ import io
 from typing import Tuple, Optional
 from docx import Document
 import docx2txt
-from app.utils.text_cleaning import clean_text, normalize_whitespace, remove_encoding_issues
+from app.utils.text_cleaning import clean_extracted_text
 
 
 class DOCXParser:
@@ -61,9 +61,7 @@ class DOCXParser:
                 return "", "No text could be extracted from the DOCX file"
             
             # Clean and normalize text
-            cleaned_text = remove_encoding_issues(combined_text)
-            cleaned_text = normalize_whitespace(cleaned_text)
-            cleaned_text = clean_text(cleaned_text)
+            cleaned_text = clean_extracted_text(combined_text)
             
             return cleaned_text, None
             
@@ -134,9 +132,7 @@ class DOCXParser:
                 return "", "No text could be extracted from the DOCX file", metadata
             
             # Clean text
-            cleaned_text = remove_encoding_issues(combined_text)
-            cleaned_text = normalize_whitespace(cleaned_text)
-            cleaned_text = clean_text(cleaned_text)
+            cleaned_text = clean_extracted_text(combined_text)
             
             return cleaned_text, None, metadata
             
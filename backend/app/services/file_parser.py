@@ -28,11 +28,11 @@ class FileParserService:
             return False, "File not found or session expired"
         
         # Check if already parsed
-        if file_data.get("parsed_text"):
+        if file_data.parsed_text:
             return True, None
         
-        file_type = file_data["file_type"].lower()
-        content = file_data["content"]
+        file_type = file_data.file_type.lower()
+        content = file_data.content
         
         # Route to appropriate parser
         if file_type == "pdf":
@@ -60,14 +60,11 @@ class GapAnalyzer:
         resume_skill_list = resume_skills.skills
         jd_skill_list = jd_skills.skills
         
-        # Find matches
-        matched_skills = skill_matcher.find_matches(resume_skill_list, jd_skill_list)
-        
-        # Find missing skills (in JD but not in resume)
-        missing_skills = skill_matcher.find_missing_skills(resume_skill_list, jd_skill_list)
-        
-        # Find extra skills (in resume but not in JD)
-        extra_skills = skill_matcher.find_extra_skills(resume_skill_list, jd_skill_list)
+        # Find matches, missing skills (in JD but not in resume) and extra skills
+        # (in resume but not in JD) in one pass
+        matched_skills, missing_skills, extra_skills = skill_matcher.match_all(
+            resume_skill_list, jd_skill_list
+        )
         
         # Generate category breakdown
         category_breakdown = GapAnalyzer._generate_category_breakdown(
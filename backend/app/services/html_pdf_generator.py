@@ -0,0 +1,298 @@
+"""
+PDF Report Generation Service using WeasyPrint (HTML to PDF).
+
+Alternative to the ReportLab generator, enabled with the USE_WEASYPRINT setting.
+"""
+from collections import Counter
+from html import escape
+from typing import BinaryIO, List, Optional
+from weasyprint import HTML, default_url_fetcher
+from weasyprint.text.fonts import FontConfiguration
+
+from app.models.schemas import SkillGapReport, FitScoreBreakdown, GapAnalysis
+from app.services.pdf_generator import PDFReportGenerator
+
+
+# Mirrors the ReportLab stylesheet and table colors
+_REPORT_CSS = """
+@page { size: letter; margin: 72pt 72pt 18pt 72pt; }
+body { font-family: Helvetica, Arial, sans-serif; font-size: 11pt; }
+h1 { font-size: 24pt; color: #1e40af; text-align: center; margin-bottom: 30pt; }
+h2 { font-size: 16pt; color: #1e40af; margin: 20pt 0 12pt; }
+h3 { font-size: 13pt; color: #475569; margin: 12pt 0 8pt; }
+p { text-align: justify; margin: 0 0 7pt; }
+table { border-collapse: collapse; margin-bottom: 14pt; }
+th { color: white; font-weight: bold; padding: 6pt; text-align: center; }
+td { border: 1px solid black; padding: 4pt; text-align: center; }
+td:first-child { text-align: left; }
+tr:nth-child(odd) td { background: lightgrey; }
+table.blue th { background: #1e40af; }
+table.slate th { background: #475569; }
+table.green th { background: #059669; }
+table.lblue th { background: #3b82f6; }
+.footer { font-size: 9pt; text-align: center; }
+"""
+
+# Font lookups are cached per FontConfiguration, so one is shared per process
+_font_config: Optional[FontConfiguration] = None
+
+
+def _get_font_config() -> FontConfiguration:
+    """Get the shared WeasyPrint font configuration, creating it on first use."""
+    global _font_config
+    if _font_config is None:
+        _font_config = FontConfiguration()
+    return _font_config
+
+
+def _report_url_fetcher(url: str, timeout: int = 10, ssl_context=None) -> dict:
+    """
+    Fetch only inline data: URLs; reports never reference files or network resources.
+
+    Raises:
+        ValueError: For any other URL scheme; WeasyPrint logs it and skips the resource
+    """
+    if url.startswith("data:"):
+        return default_url_fetcher(url, timeout=timeout, ssl_context=ssl_context)
+    raise ValueError(f"Refusing to fetch {url} while rendering a report")
+
+
+def _table(rows: List[List[str]], css_class: str) -> str:
+    """Render a header row plus data rows as an HTML table."""
+    header = "".join(f"<th>{escape(cell)}</th>" for cell in rows[0])
+    body = "".join(
+        "<tr>" + "".join(f"<td>{escape(cell)}</td>" for cell in row) + "</tr>"
+        for row in rows[1:]
+    )
+    return f'<table class="{css_class}"><tr>{header}</tr>{body}</table>'
+
+
+def _name_list(names: List[str], limit: int = 30) -> str:
+    """Join up to limit names, noting how many were left out."""
+    text = escape(", ".join(names[:limit]))
+    if len(names) > limit:
+        text += f" ... and {len(names) - limit} more"
+    return text
+
+
+class HTMLReportGenerator:
+    """Generate PDF reports by rendering HTML with WeasyPrint."""
+
+    def generate_pdf_to_stream(self, report: SkillGapReport, stream: BinaryIO) -> None:
+        """
+        Generate PDF report from SkillGapReport into a caller-provided stream.
+
+        Args:
+            report: SkillGapReport object
+            stream: Writable binary file-like object that receives the PDF
+        """
+        html = self.render_html(report)
+        HTML(string=html, url_fetcher=_report_url_fetcher).write_pdf(stream, font_config=_get_font_config())
+
+    def render_html(self, report: SkillGapReport) -> str:
+        """
+        Render the report as a standalone HTML document.
+
+        Args:
+            report: SkillGapReport object
+
+        Returns:
+            HTML document string
+        """
+        match_types = Counter(m.match_type for m in report.gap_analysis.matched_skills)
+        sections = [
+            self._header(report),
+            self._executive_summary(report),
+            self._input_summaries(report),
+            self._fit_score(report.fit_score),
+            self._skill_breakdown(report.gap_analysis),
+            self._match_quality(report.gap_analysis, match_types),
+            self._recommendations(report.recommendations),
+            self._action_items(report, match_types),
+            self._learning_resources(report.learning_resources or []),
+            f'<p class="footer"><i>Report Version: {escape(report.version)} | Generated by SkilledU</i></p>',
+        ]
+        return (
+            f"<!DOCTYPE html><html><head><meta charset=\"utf-8\"><style>{_REPORT_CSS}</style></head>"
+            f"<body>{''.join(sections)}</body></html>"
+        )
+
+    def _header(self, report: SkillGapReport) -> str:
+        """Render report title and timestamp."""
+        date_str = report.generated_at.strftime(PDFReportGenerator._DATE_FORMAT)
+        return f"<h1>Skill Gap Analysis Report</h1><p>Generated: {date_str}</p>"
+
+    def _executive_summary(self, report: SkillGapReport) -> str:
+        """Render executive summary section."""
+        fit_score = report.fit_score
+        overall_score = fit_score.overall_score
+        interpretation = PDFReportGenerator.score_interpretation(overall_score)
+        return (
+            "<h2>Executive Summary</h2>"
+            f"<p><b>Overall Fit Score: {overall_score:.1f}%</b></p>"
+            "<p>This comprehensive report analyzes the alignment between your resume and the target job description. "
+            f"You have achieved a <b>{overall_score:.1f}%</b> overall fit score, with <b>{fit_score.matched_count}</b> matched skills, "
+            f"<b>{fit_score.missing_count}</b> missing skills, and <b>{len(report.gap_analysis.extra_skills)}</b> extra skills.</p>"
+            f"<p><i>{interpretation}</i></p>"
+        )
+
+    def _input_summaries(self, report: SkillGapReport) -> str:
+        """Render resume and job description overview tables."""
+        if not report.resume_summary and not report.job_description_summary:
+            return ""
+
+        parts = ["<h2>Input Summary</h2>"]
+        overviews = [
+            ("Resume Overview", report.resume_summary, "lblue",
+             ["Total Skills", "Education Entries", "Certifications"]),
+            ("Job Description Overview", report.job_description_summary, "green",
+             ["Required Skills", "Education Requirements", "Certification Requirements"]),
+        ]
+        for title, summary, css_class, labels in overviews:
+            if not summary:
+                continue
+            counts = [
+                summary.get("total_skills", 0),
+                summary.get("total_education", 0),
+                summary.get("total_certifications", 0),
+            ]
+            rows = [["Metric", "Value"]] + [[label, str(n)] for label, n in zip(labels, counts)]
+            categories = summary.get("skill_categories", [])
+            if categories:
+                rows.append(["Skill Categories", f"{len(categories)} categories"])
+            parts.append(f"<h3>{title}</h3>{_table(rows, css_class)}")
+
+        return "".join(parts)
+
+    def _fit_score(self, fit_score: FitScoreBreakdown) -> str:
+        """Render fit score breakdown tables."""
+        score_rows = [
+            ["Category", "Score (%)", "Weight"],
+            ["Technical Skills", f"{fit_score.technical_score:.1f}%", f"{fit_score.technical_weight * 100:.0f}%"],
+            ["Soft Skills", f"{fit_score.soft_skills_score:.1f}%", f"{fit_score.soft_skills_weight * 100:.0f}%"],
+        ]
+        if fit_score.education_score is not None:
+            score_rows.append(["Education", f"{fit_score.education_score:.1f}%", "N/A"])
+        if fit_score.certification_score is not None:
+            score_rows.append(["Certifications", f"{fit_score.certification_score:.1f}%", "N/A"])
+
+        stats_rows = [
+            ["Metric", "Count"],
+            ["Matched Skills", str(fit_score.matched_count)],
+            ["Missing Skills", str(fit_score.missing_count)],
+            ["Total JD Skills", str(fit_score.total_jd_skills)],
+        ]
+        return f"<h2>Fit Score Breakdown</h2>{_table(score_rows, 'blue')}{_table(stats_rows, 'slate')}"
+
+    def _skill_breakdown(self, gap_analysis: GapAnalysis) -> str:
+        """Render matched, missing and extra skill lists plus the category table."""
+        if not (
+            gap_analysis.matched_skills
+            or gap_analysis.missing_skills
+            or gap_analysis.extra_skills
+            or gap_analysis.category_breakdown
+        ):
+            return ""
+
+        parts = ["<h2>Skill Breakdown</h2>"]
+        if gap_analysis.matched_skills:
+            parts.append(
+                "<h3>Matched Skills</h3>"
+                f"<p>You have <b>{len(gap_analysis.matched_skills)}</b> skills that match the job requirements.</p>"
+                f"<p>{_name_list([m.skill.name for m in gap_analysis.matched_skills])}</p>"
+            )
+        if gap_analysis.missing_skills:
+            parts.append(
+                "<h3>Missing Skills</h3>"
+                f"<p>The following <b>{len(gap_analysis.missing_skills)}</b> skills are required or preferred for this position "
+                "but were not found in your resume:</p>"
+                f"<p>{_name_list([s.name for s in gap_analysis.missing_skills])}</p>"
+            )
+        if gap_analysis.extra_skills:
+            parts.append(
+                "<h3>Extra Skills</h3>"
+                f"<p>You have <b>{len(gap_analysis.extra_skills)}</b> skills in your resume that are not explicitly mentioned "
+                "in the job description. These can be valuable differentiators:</p>"
+                f"<p>{_name_list([s.name for s in gap_analysis.extra_skills])}</p>"
+            )
+        if gap_analysis.category_breakdown:
+            rows = [["Category", "Matched", "Missing", "Extra"]]
+            for category, counts in list(gap_analysis.category_breakdown.items())[:10]:
+                rows.append([
+                    category.replace("_", " ").title(),
+                    str(counts.get("matched", 0)),
+                    str(counts.get("missing", 0)),
+                    str(counts.get("extra", 0)),
+                ])
+            parts.append(f"<h3>Category Breakdown</h3>{_table(rows, 'slate')}")
+
+        return "".join(parts)
+
+    def _match_quality(self, gap_analysis: GapAnalysis, match_types: Counter) -> str:
+        """Render match type distribution table."""
+        if not gap_analysis.matched_skills:
+            return ""
+
+        total_matches = sum(match_types.values())
+        rows = [["Match Type", "Count", "Percentage"]]
+        for match_type, count in match_types.most_common():
+            rows.append([match_type.capitalize(), str(count), f"{count / total_matches * 100:.1f}%"])
+
+        parts = [
+            "<h2>Match Quality Analysis</h2>",
+            "<p>Your skills matched the job requirements with the following quality distribution:</p>",
+            _table(rows, "slate"),
+        ]
+
+        exact_matches = match_types.get("exact", 0)
+        if exact_matches > 0:
+            exact_percentage = exact_matches / total_matches * 100
+            if exact_percentage >= 70:
+                insight = "Excellent! Most of your skills match exactly with the job requirements."
+            elif exact_percentage >= 50:
+                insight = "Good match quality. Consider updating your resume terminology to match the job description more closely."
+            else:
+                insight = "Consider refining your resume to use terminology that matches the job description more closely."
+            parts.append(f"<p><i>{insight}</i></p>")
+
+        return "".join(parts)
+
+    def _recommendations(self, recommendations: List[str]) -> str:
+        """Render numbered recommendations."""
+        if not recommendations:
+            return "<h2>Recommendations</h2><p>No specific recommendations available at this time.</p>"
+
+        items = "".join(f"<p><b>{i}.</b> {escape(rec)}</p>" for i, rec in enumerate(recommendations, 1))
+        return f"<h2>Recommendations</h2>{items}"
+
+    def _action_items(self, report: SkillGapReport, match_types: Counter) -> str:
+        """Render numbered action items."""
+        # Action items carry <b> labels around already escaped skill names
+        action_items = PDFReportGenerator.build_action_items(report, match_types)
+        items = "".join(f"<p><b>{i}.</b> {item}</p>" for i, item in enumerate(action_items, 1))
+        return f"<h2>Action Items</h2>{items}"
+
+    def _learning_resources(self, learning_resources: list) -> str:
+        """Render up to 10 learning resources."""
+        if not learning_resources:
+            return ""
+
+        parts = [
+            "<h2>Learning Resources</h2>",
+            "<p>Here are some recommended learning resources to help you close the skill gaps:</p>",
+        ]
+        for i, resource in enumerate(learning_resources[:10], 1):
+            text = (
+                f"<b>{i}. {escape(resource.get('name', 'Resource'))}</b> "
+                f"({escape(resource.get('type', 'Course'))})<br/>{escape(resource.get('description', ''))}"
+            )
+            url = resource.get("url", "")
+            if url:
+                text += f"<br/><i>URL: {escape(url)}</i>"
+            parts.append(f"<p>{text}</p>")
+
+        return "".join(parts)
+
+
+# Global HTML report generator instance
+html_report_generator = HTMLReportGenerator()
@@ -3,7 +3,7 @@ Learning Resources Service - Provides course recommendations based on missing sk
 Uses LLM to intelligently find courses from Coursera, freeCodeCamp, Udemy, and similar platforms.
 """
 from typing import List, Dict, Any, Optional
-from app.models.schemas import Skill, GapAnalysis
+from app.models.schemas import Skill, GapAnalysis, ResourceList
 from app.models.skill_taxonomy import SkillCategory
 from app.services.llm_service import llm_service
 
@@ -87,27 +87,23 @@ Important:
                 max_tokens=1000
             )
             
-            content = response.get("content", "")
+            content = response.content
             if not content:
                 return []
             
-            # Parse JSON response
-            data = llm_service.extract_json_response(content)
-            resources = data.get("resources", [])
+            # Parse JSON response and validate every resource in one pass
+            data = ResourceList.model_validate(llm_service.extract_json_response(content))
             
-            # Validate and format resources
+            # Format resources
             formatted_resources = []
-            for resource in resources:
-                if not isinstance(resource, dict):
-                    continue
-                    
+            for resource in data.resources:
                 # Ensure required fields
                 formatted_resource = {
-                    "name": resource.get("name", ""),
-                    "platform": resource.get("platform", "Unknown"),
-                    "url": resource.get("url", ""),
-                    "description": resource.get("description", f"Learn {skill.name}"),
-                    "type": resource.get("type", "Course"),
+                    "name": resource.name,
+                    "platform": resource.platform,
+                    "url": resource.url,
+                    "description": resource.description or f"Learn {skill.name}",
+                    "type": resource.type,
                     "skill_category": skill.category.value,
                     "source": "llm"
                 }
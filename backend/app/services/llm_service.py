@@ -1,11 +1,101 @@
 """
 LLM service wrapper for OpenAI API integration.
 """
+import asyncio
+import hashlib
 import json
+import random
+import sqlite3
+import threading
 import time
+import weakref
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
 from typing import Dict, List, Optional, Any
-from openai import OpenAI, RateLimitError, APIError, APIConnectionError
+import httpx
+from openai import AsyncOpenAI, OpenAI, RateLimitError, APIError, APIConnectionError
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2 support)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    # Fallback to HTTP/1.1 keep-alive connections if h2 not available
+    _HTTP2_AVAILABLE = False
 from app.config import settings
+from app.services.prompts import SkillExtractionPrompts
+
+
+@dataclass(slots=True, frozen=True)
+class LLMResponse:
+    """Immutable result of a single chat completion call."""
+    content: str
+    model: str
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+    finish_reason: str
+
+
+class _TokenBucket:
+    """Thread-safe token bucket that refills continuously up to a per-minute budget."""
+    
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _take(self, amount: float) -> float:
+        """Take amount tokens if available; otherwise return the seconds until they will be."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return 0.0
+            return (amount - self.tokens) / self.rate
+    
+    def acquire(self, amount: float) -> None:
+        """Block until amount tokens are available, then take them."""
+        if self.capacity <= 0:
+            return
+        # A single oversized request would otherwise wait forever
+        amount = min(amount, self.capacity)
+        while True:
+            wait = self._take(amount)
+            if not wait:
+                return
+            time.sleep(wait)
+    
+    async def acquire_async(self, amount: float) -> None:
+        """Wait without blocking the event loop until amount tokens are available, then take them."""
+        if self.capacity <= 0:
+            return
+        amount = min(amount, self.capacity)
+        while True:
+            wait = self._take(amount)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+
+class _LoopState:
+    """Async client, concurrency cap and in-flight requests bound to one event loop."""
+    
+    def __init__(self, api_key: str, max_concurrency: int):
+        # Async client for coroutine callers, so concurrent calls share the event loop instead of threads
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            ),
+        )
+        # Same cap as the thread semaphore, for coroutines on this loop
+        self.concurrency = asyncio.Semaphore(max_concurrency)
+        # Async callers coalesce on a shared task (singleflight)
+        self.inflight: Dict[str, asyncio.Task] = {}
 
 
 class LLMService:
@@ -20,66 +110,118 @@ class LLMService:
         self.temperature = settings.llm_temperature
         self.max_tokens = settings.llm_max_tokens
         
-        # Rate limiting
-        self.rate_limit_delay = 0.1  # Reduced to 0.1 seconds - OpenAI API can handle parallel requests
-        self.last_request_time = 0
+        # Rate limiting, shared by every thread that calls the API
+        self._request_bucket = _TokenBucket(settings.llm_requests_per_minute)
+        self._token_bucket = _TokenBucket(settings.llm_tokens_per_minute)
+        # Caps concurrent requests however many threads fan out calls
+        self._concurrency = threading.BoundedSemaphore(max(1, settings.llm_max_concurrency))
         self.max_retries = 3
-        self.retry_delay = 2.0  # Seconds to wait before retry
+        self.retry_delay = 2.0  # Minimum seconds to wait before retry
+        self.max_retry_delay = 30.0
+        
+        # In-flight requests keyed by request hash (singleflight)
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        # Async client and state per event loop, created on first use there; asyncio
+        # primitives and httpx.AsyncClient cannot be shared across loops
+        self._loop_states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = (
+            weakref.WeakKeyDictionary()
+        )
+        
+        # Completed responses keyed by request hash; opened on first use
+        self.cache_ttl = settings.llm_cache_ttl_seconds
+        self.cache_max_entries = settings.llm_cache_max_entries
+        self._cache_db: Optional[sqlite3.Connection] = None
+        self._cache_lock = threading.Lock()
         
         # Initialize client if API key is available
         if self.api_key and self.api_key != "your_openai_api_key_here":
-            self.client = OpenAI(api_key=self.api_key)
+            # One pooled HTTP client shared by every thread, so calls reuse warm TLS connections;
+            # with HTTP/2 concurrent calls multiplex over a single connection
+            self.client = OpenAI(
+                api_key=self.api_key,
+                http_client=httpx.Client(
+                    http2=_HTTP2_AVAILABLE,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                ),
+            )
         else:
             # Use mock mode for development without API key
             self.client = None
     
+    def _loop_state(self) -> _LoopState:
+        """Async client and request state for the running event loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        state = self._loop_states.get(loop)
+        if state is None:
+            state = _LoopState(self.api_key, max(1, settings.llm_max_concurrency))
+            self._loop_states[loop] = state
+        return state
+    
     def get_model(self):
         """Get current model from settings (allows runtime updates)."""
         return settings.llm_model
     
-    def _rate_limit(self):
-        """Apply rate limiting by delaying requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+    @staticmethod
+    def _token_cost(params: Dict[str, Any]) -> float:
+        """Estimate the tokens a request counts against the per-minute budget."""
+        # About 4 characters per token; the API reserves max_tokens against the limit too
+        prompt_chars = sum(len(message.get("content") or "") for message in params["messages"])
+        return prompt_chars / 4 + params["max_tokens"]
+    
+    def _rate_limit(self, params: Dict[str, Any]):
+        """
+        Wait until the request fits in the per-minute request and token budgets.
         
-        if time_since_last < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - time_since_last)
+        Args:
+            params: Request parameters for chat.completions.create
+        """
+        self._request_bucket.acquire(1)
+        self._token_bucket.acquire(self._token_cost(params))
+    
+    async def _rate_limit_async(self, params: Dict[str, Any]):
+        """
+        Wait without blocking the event loop until the request fits in the per-minute budgets.
         
-        self.last_request_time = time.time()
+        Args:
+            params: Request parameters for chat.completions.create
+        """
+        await self._request_bucket.acquire_async(1)
+        await self._token_bucket.acquire_async(self._token_cost(params))
+    
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with random jitter so concurrent retries spread out."""
+        ceiling = min(self.max_retry_delay, self.retry_delay * (2 ** attempt))
+        return random.uniform(self.retry_delay, ceiling)
     
     def _handle_api_error(self, error: Exception, attempt: int) -> Optional[str]:
         """
-        Handle API errors with retry logic.
+        Decide whether an API error should be retried.
         
         Args:
             error: The exception that occurred
             attempt: Current attempt number
             
         Returns:
-            Error message if should retry, None if should fail
+            Error message if should fail, None if should retry after backoff
         """
         if isinstance(error, RateLimitError):
             if attempt < self.max_retries:
-                # Exponential backoff for rate limits
-                wait_time = self.retry_delay * (2 ** attempt)
-                time.sleep(wait_time)
                 return None  # Retry
             return "Rate limit exceeded. Please try again later."
         
         elif isinstance(error, APIConnectionError):
             if attempt < self.max_retries:
-                time.sleep(self.retry_delay)
                 return None  # Retry
             return "Connection error. Please check your internet connection."
         
         elif isinstance(error, APIError):
-            if error.status_code == 429:  # Rate limit
+            status_code = getattr(error, "status_code", None)
+            if status_code == 429 or (status_code or 0) >= 500:  # Rate limit or transient server error
                 if attempt < self.max_retries:
-                    wait_time = self.retry_delay * (2 ** attempt)
-                    time.sleep(wait_time)
                     return None
             # Check for quota errors
-            if "insufficient_quota" in str(error).lower() or error.status_code == 429:
+            if "insufficient_quota" in str(error).lower() or status_code == 429:
                 if "insufficient_quota" in str(error).lower():
                     return "OpenAI API quota exceeded. Please check your billing and quota at https://platform.openai.com/account/billing"
                 return f"Rate limit exceeded. Please try again later. Error: {error.message}"
@@ -94,8 +236,8 @@ class LLMService:
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
-        response_format: Optional[Dict[str, str]] = None
-    ) -> Dict[str, Any]:
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> LLMResponse:
         """
         Make API call to LLM with error handling and rate limiting.
         
@@ -104,10 +246,10 @@ class LLMService:
             model: Model name (optional, uses default if not provided)
             temperature: Temperature setting (optional)
             max_tokens: Max tokens (optional)
-            response_format: Response format (e.g., {"type": "json_object"})
+            response_format: Response format (e.g., {"type": "json_object"} or a json_schema format)
             
         Returns:
-            API response dictionary
+            LLMResponse with content, model, token usage and finish reason
             
         Raises:
             Exception: If API call fails after retries
@@ -118,44 +260,328 @@ class LLMService:
                 "Please set OPENAI_API_KEY in your .env file."
             )
         
+        params = self.build_params(messages, model, temperature, max_tokens, response_format)
+        
+        # Coalesce identical concurrent requests: the first caller issues the
+        # API call, later callers wait on the same future (singleflight)
+        key = self._request_key(params)
+        cached = self._cache_get(key, params)
+        if cached is not None:
+            return cached
+        
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_leader:
+            return future.result()
+        
+        try:
+            result = self._call_with_retries(params)
+            # Truncated responses are usually unparseable JSON; let the next call retry
+            if result.finish_reason == "stop":
+                self._cache_put(key, params, result)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
+    async def call_api_async(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> LLMResponse:
+        """
+        Make API call to LLM on the event loop, without tying up a thread.
+        
+        Shares the response cache with call_api; identical concurrent calls
+        await a single request.
+        
+        Args:
+            messages: List of message dictionaries
+            model: Model name (optional, uses default if not provided)
+            temperature: Temperature setting (optional)
+            max_tokens: Max tokens (optional)
+            response_format: Response format (e.g., {"type": "json_object"} or a json_schema format)
+            
+        Returns:
+            LLMResponse with content, model, token usage and finish reason
+            
+        Raises:
+            Exception: If API call fails after retries
+        """
+        if not self.client:
+            raise Exception(
+                "OpenAI API key not configured. "
+                "Please set OPENAI_API_KEY in your .env file."
+            )
+        
+        params = self.build_params(messages, model, temperature, max_tokens, response_format)
+        
+        key = self._request_key(params)
+        cached = self._cache_get(key, params)
+        if cached is not None:
+            return cached
+        
+        inflight = self._loop_state().inflight
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._call_and_cache_async(key, params))
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        
+        # Shielded so one cancelled caller does not cancel the request for the others
+        return await asyncio.shield(task)
+    
+    async def _call_and_cache_async(self, key: str, params: Dict[str, Any]) -> LLMResponse:
+        """Issue an async request and cache it when complete."""
+        result = await self._call_with_retries_async(params)
+        # Truncated responses are usually unparseable JSON; let the next call retry
+        if result.finish_reason == "stop":
+            self._cache_put(key, params, result)
+        return result
+    
+    def build_params(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build chat completion request parameters, filling in the configured defaults.
+        
+        Args:
+            messages: List of message dictionaries
+            model: Model name (optional, uses default if not provided)
+            temperature: Temperature setting (optional)
+            max_tokens: Max tokens (optional)
+            response_format: Response format (optional)
+            
+        Returns:
+            Request parameters for chat.completions.create
+        """
         model = model or self.get_model()  # Use dynamic getter to read current settings
         temperature = temperature if temperature is not None else self.temperature
         max_tokens = max_tokens if max_tokens is not None else self.max_tokens
         
+        # Prepare request parameters
+        params = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        
+        if response_format:
+            params["response_format"] = response_format
+        
+        return params
+    
+    def submit_batch(self, requests: Dict[str, Dict[str, Any]]) -> str:
+        """
+        Submit chat completion requests to the Batch API without waiting for them.
+        
+        Batched requests cost half as much and use a separate rate limit pool,
+        but may take up to 24 hours, so this is for bulk jobs rather than
+        interactive requests. Fetch the results later with collect_batch.
+        
+        Args:
+            requests: Request parameters from build_params, keyed by a caller-chosen custom ID
+            
+        Returns:
+            Batch ID
+            
+        Raises:
+            Exception: If the API key is missing, requests is empty or the upload fails
+        """
+        if not self.client:
+            raise Exception(
+                "OpenAI API key not configured. "
+                "Please set OPENAI_API_KEY in your .env file."
+            )
+        if not requests:
+            raise Exception("No requests to submit")
+        
+        # The installed SDK predates the batches resource, so the batch endpoints
+        # go through its generic request methods (same auth, base URL and retries)
+        lines = [
+            json.dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": params})
+            for custom_id, params in requests.items()
+        ]
+        input_file = self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = self.client.post(
+            "/batches",
+            body={
+                "input_file_id": input_file.id,
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            },
+            cast_to=httpx.Response,
+        ).json()
+        print(f"[LLM] Submitted batch {batch['id']} with {len(requests)} requests")
+        return batch["id"]
+    
+    def collect_batch(
+        self, batch_id: str, requests: Dict[str, Dict[str, Any]]
+    ) -> Optional[Dict[str, LLMResponse]]:
+        """
+        Check a submitted batch once and return its results if it has finished.
+        
+        Successful responses also go into the response cache, so a later
+        call_api with the same parameters is served locally.
+        
+        Args:
+            batch_id: ID returned by submit_batch
+            requests: The requests passed to submit_batch, keyed by custom ID
+            
+        Returns:
+            LLMResponse keyed by custom ID for every request that succeeded,
+            or None while the batch is still running
+            
+        Raises:
+            Exception: If the batch failed, expired or was cancelled
+        """
+        if not self.client:
+            raise Exception(
+                "OpenAI API key not configured. "
+                "Please set OPENAI_API_KEY in your .env file."
+            )
+        
+        batch = self.client.get(f"/batches/{batch_id}", cast_to=httpx.Response).json()
+        if batch["status"] in ("failed", "expired", "cancelled"):
+            raise Exception(f"Batch {batch_id} ended with status {batch['status']}")
+        if batch["status"] != "completed":
+            return None
+        if not batch.get("output_file_id"):
+            return {}
+        
+        results = {}
+        output = self.client.files.content(batch["output_file_id"]).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                continue
+            
+            body = response["body"]
+            choice = body["choices"][0]
+            usage = body["usage"]
+            result = LLMResponse(
+                content=choice["message"]["content"] or "",
+                model=body["model"],
+                prompt_tokens=usage["prompt_tokens"],
+                completion_tokens=usage["completion_tokens"],
+                total_tokens=usage["total_tokens"],
+                finish_reason=choice["finish_reason"],
+            )
+            
+            custom_id = record["custom_id"]
+            params = requests.get(custom_id)
+            if result.finish_reason == "stop" and params is not None:
+                self._cache_put(self._request_key(params), params, result)
+            results[custom_id] = result
+        
+        return results
+    
+    @staticmethod
+    def _request_key(params: Dict[str, Any]) -> str:
+        """Build a stable key identifying a request by its parameters."""
+        payload = json.dumps(params, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _cache_connection(self) -> sqlite3.Connection:
+        """Get the response cache database, creating it on first use."""
+        if self._cache_db is None:
+            self._cache_db = sqlite3.connect(settings.llm_cache_path or ":memory:", check_same_thread=False)
+            self._cache_db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            # Expiry purges and the size cap walk entries by expiry time
+            self._cache_db.execute("CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)")
+        return self._cache_db
+    
+    def _cacheable(self, params: Dict[str, Any]) -> bool:
+        """Whether a request's response may be cached; sampled (non-zero temperature) calls are not."""
+        return self.cache_ttl > 0 and self.cache_max_entries > 0 and params.get("temperature") == 0
+    
+    def _cache_get(self, key: str, params: Dict[str, Any]) -> Optional[LLMResponse]:
+        """Return an unexpired cached response for a request key."""
+        if not self._cacheable(params):
+            return None
+        try:
+            with self._cache_lock:
+                row = self._cache_connection().execute(
+                    "SELECT response FROM responses WHERE key = ? AND expires_at > ?",
+                    (key, time.time())
+                ).fetchone()
+        except sqlite3.Error:
+            # The cache is an optimization; fall through to the API
+            return None
+        return LLMResponse(**json.loads(row[0])) if row else None
+    
+    def _cache_put(self, key: str, params: Dict[str, Any], response: LLMResponse) -> None:
+        """Store a response, dropping expired entries and the oldest beyond cache_max_entries."""
+        if not self._cacheable(params):
+            return
+        now = time.time()
+        try:
+            with self._cache_lock:
+                db = self._cache_connection()
+                with db:
+                    db.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+                    db.execute(
+                        "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                        (key, json.dumps(asdict(response)), now + self.cache_ttl)
+                    )
+                    # Every entry has the same TTL, so the earliest expiring are the oldest
+                    db.execute(
+                        "DELETE FROM responses WHERE expires_at < "
+                        "(SELECT expires_at FROM responses ORDER BY expires_at DESC LIMIT 1 OFFSET ?)",
+                        (self.cache_max_entries - 1,)
+                    )
+        except sqlite3.Error:
+            pass
+    
+    def _call_with_retries(self, params: Dict[str, Any]) -> LLMResponse:
+        """
+        Issue a chat completion request with rate limiting and retries.
+        
+        Args:
+            params: Request parameters for chat.completions.create
+            
+        Returns:
+            LLMResponse for the request
+        """
         # Apply rate limiting
-        self._rate_limit()
+        self._rate_limit(params)
         
         # Retry logic
         last_error = None
         for attempt in range(1, self.max_retries + 1):
             try:
-                # Prepare request parameters
-                params = {
-                    "model": model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                }
-                
-                if response_format:
-                    params["response_format"] = response_format
+                # Make API call; the slot is released before any retry backoff
+                with self._concurrency:
+                    response = self.client.chat.completions.create(**params)
                 
-                # Make API call
-                response = self.client.chat.completions.create(**params)
-                
-                # Extract response content
-                content = response.choices[0].message.content
-                
-                return {
-                    "content": content,
-                    "model": response.model,
-                    "usage": {
-                        "prompt_tokens": response.usage.prompt_tokens,
-                        "completion_tokens": response.usage.completion_tokens,
-                        "total_tokens": response.usage.total_tokens,
-                    },
-                    "finish_reason": response.choices[0].finish_reason,
-                }
+                return self._to_llm_response(response)
                 
             except (RateLimitError, APIConnectionError, APIError) as e:
                 last_error = e
@@ -164,7 +590,8 @@ class LLMService:
                 if error_msg:
                     # Should not retry
                     raise Exception(error_msg) from e
-                # Otherwise, continue to retry
+                # Otherwise, back off and retry
+                time.sleep(self._backoff(attempt))
                 
             except Exception as e:
                 # Unexpected error - don't retry
@@ -173,6 +600,55 @@ class LLMService:
         # If we get here, all retries failed
         raise Exception(f"API call failed after {self.max_retries} attempts: {str(last_error)}")
     
+    async def _call_with_retries_async(self, params: Dict[str, Any]) -> LLMResponse:
+        """
+        Issue a chat completion request on the async client with rate limiting and retries.
+        
+        Args:
+            params: Request parameters for chat.completions.create
+            
+        Returns:
+            LLMResponse for the request
+        """
+        await self._rate_limit_async(params)
+        state = self._loop_state()
+        
+        last_error = None
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                async with state.concurrency:
+                    response = await state.client.chat.completions.create(**params)
+                
+                return self._to_llm_response(response)
+                
+            except (RateLimitError, APIConnectionError, APIError) as e:
+                last_error = e
+                error_msg = self._handle_api_error(e, attempt)
+                
+                if error_msg:
+                    raise Exception(error_msg) from e
+                await asyncio.sleep(self._backoff(attempt))
+                
+            except Exception as e:
+                raise Exception(f"Unexpected error: {str(e)}") from e
+        
+        raise Exception(f"API call failed after {self.max_retries} attempts: {str(last_error)}")
+    
+    @staticmethod
+    def _to_llm_response(response: Any) -> LLMResponse:
+        """Convert a chat completion into an LLMResponse."""
+        choice = response.choices[0]
+        usage = response.usage
+        
+        return LLMResponse(
+            content=choice.message.content or "",
+            model=response.model,
+            prompt_tokens=usage.prompt_tokens,
+            completion_tokens=usage.completion_tokens,
+            total_tokens=usage.total_tokens,
+            finish_reason=choice.finish_reason,
+        )
+    
     def extract_json_response(self, content: str) -> Dict[str, Any]:
         """
         Extract JSON from LLM response.
@@ -185,14 +661,14 @@ class LLMService:
         """
         # Try to parse as JSON directly
         try:
-            return json.loads(content)
+            return SkillExtractionPrompts.parse_response(content)
         except json.JSONDecodeError:
             # Try to extract JSON from markdown code blocks
             import re
             json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
             if json_match:
                 try:
-                    return json.loads(json_match.group(1))
+                    return SkillExtractionPrompts.parse_response(json_match.group(1))
                 except json.JSONDecodeError:
                     pass
             
@@ -200,13 +676,28 @@ class LLMService:
             json_match = re.search(r'\{.*\}', content, re.DOTALL)
             if json_match:
                 try:
-                    return json.loads(json_match.group(0))
+                    return SkillExtractionPrompts.parse_response(json_match.group(0))
                 except json.JSONDecodeError:
                     pass
             
             # If all else fails, return error
             raise ValueError(f"Could not parse JSON from response: {content[:200]}")
     
+    def close(self) -> None:
+        """Close pooled HTTP connections and the response cache; call on application shutdown."""
+        if self.client is not None:
+            self.client.close()
+        with self._cache_lock:
+            if self._cache_db is not None:
+                self._cache_db.close()
+                self._cache_db = None
+    
+    async def aclose(self) -> None:
+        """Close the running loop's async client; call on application shutdown, before close."""
+        state = self._loop_states.pop(asyncio.get_running_loop(), None)
+        if state is not None:
+            await state.client.close()
+    
     def is_configured(self) -> bool:
         """Check if LLM service is properly configured."""
         return self.client is not None and self.api_key and self.api_key != "your_openai_api_key_here"
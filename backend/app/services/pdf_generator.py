@@ -1,11 +1,20 @@
 """
 PDF Report Generation Service using ReportLab.
 """
+import asyncio
+import copy
+import hashlib
+import multiprocessing
+import threading
+from collections import Counter, OrderedDict
+from html import escape
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from io import BytesIO
-from typing import Optional
-from datetime import datetime
+from itertools import chain
+from typing import BinaryIO, List, Optional
 from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, A4
+from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import (
@@ -14,69 +23,216 @@ from reportlab.platypus import (
     Spacer,
     Table,
     TableStyle,
-    PageBreak,
-    Image,
 )
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-from reportlab.pdfgen import canvas
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab import rl_config
 
+from app.config import settings
 from app.models.schemas import SkillGapReport, FitScoreBreakdown, GapAnalysis
 
+# Skip ReportLab's per-attribute validation; all styles here are static
+rl_config.shapeChecking = 0
+
+# Report colors, resolved once at import
+_COLOR_BLUE = colors.HexColor("#1e40af")
+_COLOR_SLATE = colors.HexColor("#475569")
+_COLOR_GREEN = colors.HexColor("#059669")
+_COLOR_LBLUE = colors.HexColor("#3b82f6")
+_ROW_BANDS = [colors.white, colors.lightgrey]
+
 
 class PDFReportGenerator:
     """Generate PDF reports from skill gap analysis data."""
 
+    # Header timestamp, e.g. "January 02, 2024 at 03:04 AM"
+    _DATE_FORMAT = "%B %d, %Y at %I:%M %p"
+
+    # Table styles are stateless once built, so they are shared by all reports
+    _SCORE_TABLE_STYLE = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), _COLOR_BLUE),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), 12),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+            ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
+            ("GRID", (0, 0), (-1, -1), 1, colors.black),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), _ROW_BANDS),
+        ]
+    )
+
+    _STATS_TABLE_STYLE = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), _COLOR_SLATE),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), 12),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+            ("GRID", (0, 0), (-1, -1), 1, colors.black),
+        ]
+    )
+
+    _CATEGORY_TABLE_STYLE = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), _COLOR_SLATE),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("ALIGN", (1, 0), (-1, -1), "CENTER"),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), 10),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+            ("GRID", (0, 0), (-1, -1), 1, colors.black),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), _ROW_BANDS),
+        ]
+    )
+
+    _RESUME_TABLE_STYLE = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), _COLOR_LBLUE),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), 11),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+            ("GRID", (0, 0), (-1, -1), 1, colors.black),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), _ROW_BANDS),
+        ]
+    )
+
+    _JD_TABLE_STYLE = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), _COLOR_GREEN),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), 11),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+            ("GRID", (0, 0), (-1, -1), 1, colors.black),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), _ROW_BANDS),
+        ]
+    )
+
+    _QUALITY_TABLE_STYLE = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), _COLOR_SLATE),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("ALIGN", (1, 0), (-1, -1), "CENTER"),
+            ("ALIGN", (2, 0), (-1, -1), "CENTER"),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), 11),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+            ("GRID", (0, 0), (-1, -1), 1, colors.black),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), _ROW_BANDS),
+        ]
+    )
+
+    # Stylesheet shared by all instances, built on first use
+    _shared_styles = None
+
+    # Static headings and boilerplate, parsed into Paragraphs once at init
+    _STATIC_PARAGRAPHS = (
+        ("Skill Gap Analysis Report", "CustomTitle"),
+        ("Executive Summary", "SectionHeader"),
+        ("Input Summary", "SectionHeader"),
+        ("Fit Score Breakdown", "SectionHeader"),
+        ("Skill Breakdown", "SectionHeader"),
+        ("Match Quality Analysis", "SectionHeader"),
+        ("Recommendations", "SectionHeader"),
+        ("Action Items", "SectionHeader"),
+        ("Learning Resources", "SectionHeader"),
+        ("Resume Overview", "SubsectionHeader"),
+        ("Job Description Overview", "SubsectionHeader"),
+        ("Matched Skills", "SubsectionHeader"),
+        ("Missing Skills", "SubsectionHeader"),
+        ("Extra Skills", "SubsectionHeader"),
+        ("Category Breakdown", "SubsectionHeader"),
+        ("No specific recommendations available at this time.", "ReportBodyText"),
+        (
+            "Your skills matched the job requirements with the following quality distribution:",
+            "ReportBodyText",
+        ),
+        (
+            "Here are some recommended learning resources to help you close the skill gaps:",
+            "ReportBodyText",
+        ),
+    )
+
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        self.styles = type(self)._get_shared_styles()
+        self._static_paragraphs = {
+            text: Paragraph(text, self.styles[style_name])
+            for text, style_name in self._STATIC_PARAGRAPHS
+        }
 
-    def _setup_custom_styles(self):
+    def _static(self, text: str) -> Paragraph:
+        """
+        Get a pre-parsed static paragraph for use in a story.
+        
+        doc.build records layout state (e.g. _postponed) on each flowable,
+        so every report gets a shallow copy that shares the parsed text.
+        """
+        return copy.copy(self._static_paragraphs[text])
+
+    @classmethod
+    def _get_shared_styles(cls):
+        """Build the stylesheet once per process and reuse it."""
+        if cls._shared_styles is None:
+            styles = getSampleStyleSheet()
+            cls._setup_custom_styles(styles)
+            cls._shared_styles = styles
+        return cls._shared_styles
+
+    @staticmethod
+    def _setup_custom_styles(styles):
         """Setup custom paragraph styles."""
         # Title style
-        if "CustomTitle" not in self.styles.byName:
-            self.styles.add(
+        if "CustomTitle" not in styles.byName:
+            styles.add(
                 ParagraphStyle(
                     name="CustomTitle",
-                    parent=self.styles["Heading1"],
+                    parent=styles["Heading1"],
                     fontSize=24,
-                    textColor=colors.HexColor("#1e40af"),
+                    textColor=_COLOR_BLUE,
                     spaceAfter=30,
                     alignment=TA_CENTER,
                 )
             )
 
         # Section header style
-        if "SectionHeader" not in self.styles.byName:
-            self.styles.add(
+        if "SectionHeader" not in styles.byName:
+            styles.add(
                 ParagraphStyle(
                     name="SectionHeader",
-                    parent=self.styles["Heading2"],
+                    parent=styles["Heading2"],
                     fontSize=16,
-                    textColor=colors.HexColor("#1e40af"),
+                    textColor=_COLOR_BLUE,
                     spaceAfter=12,
                     spaceBefore=20,
                 )
             )
 
         # Subsection header style
-        if "SubsectionHeader" not in self.styles.byName:
-            self.styles.add(
+        if "SubsectionHeader" not in styles.byName:
+            styles.add(
                 ParagraphStyle(
                     name="SubsectionHeader",
-                    parent=self.styles["Heading3"],
+                    parent=styles["Heading3"],
                     fontSize=14,
-                    textColor=colors.HexColor("#475569"),
+                    textColor=_COLOR_SLATE,
                     spaceAfter=8,
                     spaceBefore=12,
                 )
             )
 
         # Custom body text style (use different name to avoid conflict)
-        if "ReportBodyText" not in self.styles.byName:
-            self.styles.add(
+        if "ReportBodyText" not in styles.byName:
+            styles.add(
                 ParagraphStyle(
                     name="ReportBodyText",
-                    parent=self.styles["Normal"],
+                    parent=styles["Normal"],
                     fontSize=11,
                     spaceAfter=12,
                     alignment=TA_JUSTIFY,
@@ -84,13 +240,13 @@ class PDFReportGenerator:
             )
 
         # Score style
-        if "ScoreText" not in self.styles.byName:
-            self.styles.add(
+        if "ScoreText" not in styles.byName:
+            styles.add(
                 ParagraphStyle(
                     name="ScoreText",
-                    parent=self.styles["Normal"],
+                    parent=styles["Normal"],
                     fontSize=32,
-                    textColor=colors.HexColor("#059669"),
+                    textColor=_COLOR_GREEN,
                     alignment=TA_CENTER,
                     fontName="Helvetica-Bold",
                 )
@@ -106,9 +262,31 @@ class PDFReportGenerator:
         Returns:
             BytesIO buffer containing PDF data
         """
-        buffer = BytesIO()
+        key = _pdf_cache_key(report)
+        pdf_bytes = _pdf_cache_get(key)
+        if pdf_bytes is None:
+            pdf_bytes = _generate_pdf_bytes(report.model_dump_json())
+            _pdf_cache_put(key, pdf_bytes)
+        return BytesIO(pdf_bytes)
+
+    def generate_pdf_to_stream(self, report: SkillGapReport, stream: BinaryIO) -> None:
+        """
+        Generate PDF report from SkillGapReport into a caller-provided stream.
+        
+        Args:
+            report: SkillGapReport object
+            stream: Writable binary file-like object that receives the PDF
+        """
+        if settings.use_weasyprint:
+            # Imported lazily so WeasyPrint's native libraries are only needed when enabled
+            from app.services.html_pdf_generator import html_report_generator
+            html_report_generator.generate_pdf_to_stream(report, stream)
+            return
+
+        # ReportLab serializes the whole document and hands it to the stream in
+        # a single write(), so a buffer grows once and needs no preallocation
         doc = SimpleDocTemplate(
-            buffer,
+            stream,
             pagesize=letter,
             rightMargin=72,
             leftMargin=72,
@@ -116,109 +294,73 @@ class PDFReportGenerator:
             bottomMargin=18,
         )
 
-        story = []
-
-        # Header
-        story.extend(self._create_header(report))
-
-        # Executive Summary
-        story.extend(self._create_executive_summary(report))
-
-        # Input Summaries Section
-        story.extend(self._create_input_summaries_section(report))
-
-        # Fit Score Section
-        story.extend(self._create_fit_score_section(report.fit_score))
-
-        # Skill Breakdown Section
-        story.extend(self._create_skill_breakdown_section(report.gap_analysis))
-
-        # Match Quality Analysis
-        story.extend(self._create_match_quality_section(report.gap_analysis))
-
-        # Recommendations Section
-        story.extend(self._create_recommendations_section(report.recommendations))
-
-        # Action Items Section
-        story.extend(self._create_action_items_section(report))
-
-        # Learning Resources Section (if available)
-        if report.learning_resources:
-            story.extend(self._create_learning_resources_section(report.learning_resources))
-
-        # Footer
-        story.extend(self._create_footer(report))
+        # Match types feed both the quality table and the action items
+        match_types = Counter(m.match_type for m in report.gap_analysis.matched_skills)
+
+        story = list(
+            chain(
+                self._create_header(report),
+                self._create_executive_summary(report),
+                self._create_input_summaries_section(report),
+                self._create_fit_score_section(report.fit_score),
+                self._create_skill_breakdown_section(report.gap_analysis),
+                self._create_match_quality_section(report.gap_analysis, match_types),
+                self._create_recommendations_section(report.recommendations),
+                self._create_action_items_section(report, match_types),
+                # Learning resources are optional
+                self._create_learning_resources_section(report.learning_resources)
+                if report.learning_resources
+                else (),
+                self._create_footer(report),
+            )
+        )
 
         # Build PDF
         doc.build(story)
-        buffer.seek(0)
-        return buffer
 
     def _create_header(self, report: SkillGapReport) -> list:
         """Create report header."""
-        elements = []
-
-        # Title
-        title = Paragraph("Skill Gap Analysis Report", self.styles["CustomTitle"])
-        elements.append(title)
-        elements.append(Spacer(1, 0.2 * inch))
-
-        # Date
-        date_str = report.generated_at.strftime("%B %d, %Y at %I:%M %p")
+        date_str = report.generated_at.strftime(self._DATE_FORMAT)
         date_para = Paragraph(f"Generated: {date_str}", self.styles["Normal"])
-        elements.append(date_para)
-        elements.append(Spacer(1, 0.3 * inch))
 
-        return elements
+        return [
+            self._static("Skill Gap Analysis Report"),
+            Spacer(1, 0.2 * inch),
+            date_para,
+            Spacer(1, 0.3 * inch),
+        ]
 
     def _create_executive_summary(self, report: SkillGapReport) -> list:
         """Create executive summary section."""
-        elements = []
-
-        # Section header
-        header = Paragraph("Executive Summary", self.styles["SectionHeader"])
-        elements.append(header)
-
         # Overall score
         overall_score = report.fit_score.overall_score
         score_text = f"<b>Overall Fit Score: {overall_score:.1f}%</b>"
         score_para = Paragraph(score_text, self.styles["ReportBodyText"])
-        elements.append(score_para)
-        elements.append(Spacer(1, 0.1 * inch))
 
         # Summary text
-        summary_text = f"""
-        This comprehensive report analyzes the alignment between your resume and the target job description.
-        You have achieved a <b>{overall_score:.1f}%</b> overall fit score, with <b>{report.fit_score.matched_count}</b> matched skills,
-        <b>{report.fit_score.missing_count}</b> missing skills, and <b>{len(report.gap_analysis.extra_skills)}</b> extra skills.
-        """
+        summary_text = (
+            "This comprehensive report analyzes the alignment between your resume and the target job description. "
+            f"You have achieved a <b>{overall_score:.1f}%</b> overall fit score, with <b>{report.fit_score.matched_count}</b> matched skills, "
+            f"<b>{report.fit_score.missing_count}</b> missing skills, and <b>{len(report.gap_analysis.extra_skills)}</b> extra skills."
+        )
         summary_para = Paragraph(summary_text, self.styles["ReportBodyText"])
-        elements.append(summary_para)
-        elements.append(Spacer(1, 0.1 * inch))
 
         # Score interpretation
-        if overall_score >= 80:
-            interpretation = "Excellent match! Your skills align very well with the job requirements."
-        elif overall_score >= 60:
-            interpretation = "Good match! You have a solid foundation with room for improvement."
-        elif overall_score >= 40:
-            interpretation = "Moderate match. Focus on developing the missing skills identified below."
-        else:
-            interpretation = "Significant gaps identified. Consider whether this role aligns with your career goals or if you're willing to invest in substantial skill development."
-
+        interpretation = self.score_interpretation(overall_score)
         interpretation_para = Paragraph(f"<i>{interpretation}</i>", self.styles["ReportBodyText"])
-        elements.append(interpretation_para)
-        elements.append(Spacer(1, 0.2 * inch))
 
-        return elements
+        return [
+            self._static("Executive Summary"),
+            score_para,
+            Spacer(1, 0.1 * inch),
+            summary_para,
+            Spacer(1, 0.1 * inch),
+            interpretation_para,
+            Spacer(1, 0.2 * inch),
+        ]
 
     def _create_fit_score_section(self, fit_score: FitScoreBreakdown) -> list:
         """Create fit score breakdown section."""
-        elements = []
-
-        header = Paragraph("Fit Score Breakdown", self.styles["SectionHeader"])
-        elements.append(header)
-
         # Score table
         score_data = [
             ["Category", "Score (%)", "Weight"],
@@ -244,24 +386,9 @@ class PDFReportGenerator:
                 ["Certifications", f"{fit_score.certification_score:.1f}%", "N/A"]
             )
 
-        score_table = Table(score_data, colWidths=[3 * inch, 1.5 * inch, 1.5 * inch])
-        score_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1e40af")),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 12),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                    ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-                ]
-            )
+        score_table = Table(
+            score_data, colWidths=[3 * inch, 1.5 * inch, 1.5 * inch], style=self._SCORE_TABLE_STYLE
         )
-        elements.append(score_table)
-        elements.append(Spacer(1, 0.2 * inch))
 
         # Statistics
         stats_data = [
@@ -271,105 +398,90 @@ class PDFReportGenerator:
             ["Total JD Skills", str(fit_score.total_jd_skills)],
         ]
 
-        stats_table = Table(stats_data, colWidths=[3 * inch, 3 * inch])
-        stats_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#475569")),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 12),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                ]
-            )
+        stats_table = Table(
+            stats_data, colWidths=[3 * inch, 3 * inch], style=self._STATS_TABLE_STYLE
         )
-        elements.append(stats_table)
-        elements.append(Spacer(1, 0.3 * inch))
 
-        return elements
+        return [
+            self._static("Fit Score Breakdown"),
+            score_table,
+            Spacer(1, 0.2 * inch),
+            stats_table,
+            Spacer(1, 0.3 * inch),
+        ]
 
     def _create_skill_breakdown_section(self, gap_analysis: GapAnalysis) -> list:
         """Create skill breakdown section."""
-        elements = []
+        if not (
+            gap_analysis.matched_skills
+            or gap_analysis.missing_skills
+            or gap_analysis.extra_skills
+            or gap_analysis.category_breakdown
+        ):
+            return []
 
-        header = Paragraph("Skill Breakdown", self.styles["SectionHeader"])
-        elements.append(header)
+        elements = [self._static("Skill Breakdown")]
+        body_style = self.styles["ReportBodyText"]
 
         # Matched Skills
         if gap_analysis.matched_skills:
-            matched_header = Paragraph(
-                "Matched Skills", self.styles["SubsectionHeader"]
-            )
-            elements.append(matched_header)
-
-            matched_text = f"""
-            You have <b>{len(gap_analysis.matched_skills)}</b> skills that match the job requirements.
-            """
-            matched_intro = Paragraph(matched_text, self.styles["ReportBodyText"])
-            elements.append(matched_intro)
-            elements.append(Spacer(1, 0.1 * inch))
-
-            matched_skills = [match.skill.name for match in gap_analysis.matched_skills]
-            matched_list = ", ".join(matched_skills[:30])  # Increased limit
-            if len(matched_skills) > 30:
-                matched_list += f" ... and {len(matched_skills) - 30} more"
-            matched_para = Paragraph(matched_list, self.styles["ReportBodyText"])
-            elements.append(matched_para)
-            elements.append(Spacer(1, 0.15 * inch))
+            matched_text = f"You have <b>{len(gap_analysis.matched_skills)}</b> skills that match the job requirements."
+
+            total = len(gap_analysis.matched_skills)
+            matched_list = ", ".join(m.skill.name for m in gap_analysis.matched_skills[:30])  # Increased limit
+            if total > 30:
+                matched_list += f" ... and {total - 30} more"
+
+            elements.extend([
+                self._static("Matched Skills"),
+                Paragraph(matched_text, body_style),
+                Spacer(1, 0.1 * inch),
+                Paragraph(matched_list, body_style),
+                Spacer(1, 0.15 * inch),
+            ])
 
         # Missing Skills
         if gap_analysis.missing_skills:
-            missing_header = Paragraph(
-                "Missing Skills", self.styles["SubsectionHeader"]
+            missing_text = (
+                f"The following <b>{len(gap_analysis.missing_skills)}</b> skills are required or preferred for this position "
+                "but were not found in your resume:"
             )
-            elements.append(missing_header)
-
-            missing_text = f"""
-            The following <b>{len(gap_analysis.missing_skills)}</b> skills are required or preferred for this position 
-            but were not found in your resume:
-            """
-            missing_intro = Paragraph(missing_text, self.styles["ReportBodyText"])
-            elements.append(missing_intro)
-            elements.append(Spacer(1, 0.1 * inch))
-
-            missing_skills = [skill.name for skill in gap_analysis.missing_skills]
-            missing_list = ", ".join(missing_skills[:30])
-            if len(missing_skills) > 30:
-                missing_list += f" ... and {len(missing_skills) - 30} more"
-            missing_para = Paragraph(missing_list, self.styles["ReportBodyText"])
-            elements.append(missing_para)
-            elements.append(Spacer(1, 0.15 * inch))
+
+            total = len(gap_analysis.missing_skills)
+            missing_list = ", ".join(s.name for s in gap_analysis.missing_skills[:30])
+            if total > 30:
+                missing_list += f" ... and {total - 30} more"
+
+            elements.extend([
+                self._static("Missing Skills"),
+                Paragraph(missing_text, body_style),
+                Spacer(1, 0.1 * inch),
+                Paragraph(missing_list, body_style),
+                Spacer(1, 0.15 * inch),
+            ])
 
         # Extra Skills
         if gap_analysis.extra_skills:
-            extra_header = Paragraph("Extra Skills", self.styles["SubsectionHeader"])
-            elements.append(extra_header)
-
-            extra_text = f"""
-            You have <b>{len(gap_analysis.extra_skills)}</b> skills in your resume that are not explicitly mentioned 
-            in the job description. These can be valuable differentiators:
-            """
-            extra_intro = Paragraph(extra_text, self.styles["ReportBodyText"])
-            elements.append(extra_intro)
-            elements.append(Spacer(1, 0.1 * inch))
-
-            extra_skills = [skill.name for skill in gap_analysis.extra_skills]
-            extra_list = ", ".join(extra_skills[:30])
-            if len(extra_skills) > 30:
-                extra_list += f" ... and {len(extra_skills) - 30} more"
-            extra_para = Paragraph(extra_list, self.styles["ReportBodyText"])
-            elements.append(extra_para)
-            elements.append(Spacer(1, 0.15 * inch))
+            extra_text = (
+                f"You have <b>{len(gap_analysis.extra_skills)}</b> skills in your resume that are not explicitly mentioned "
+                "in the job description. These can be valuable differentiators:"
+            )
+
+            total = len(gap_analysis.extra_skills)
+            extra_list = ", ".join(s.name for s in gap_analysis.extra_skills[:30])
+            if total > 30:
+                extra_list += f" ... and {total - 30} more"
+
+            elements.extend([
+                self._static("Extra Skills"),
+                Paragraph(extra_text, body_style),
+                Spacer(1, 0.1 * inch),
+                Paragraph(extra_list, body_style),
+                Spacer(1, 0.15 * inch),
+            ])
 
         # Category Breakdown
         if gap_analysis.category_breakdown:
-            category_header = Paragraph(
-                "Category Breakdown", self.styles["SubsectionHeader"]
-            )
-            elements.append(category_header)
-
             category_data = [["Category", "Matched", "Missing", "Extra"]]
             for category, counts in list(gap_analysis.category_breakdown.items())[:10]:
                 category_data.append(
@@ -382,47 +494,31 @@ class PDFReportGenerator:
                 )
 
             category_table = Table(
-                category_data, colWidths=[2.5 * inch, 1.5 * inch, 1.5 * inch, 1.5 * inch]
-            )
-            category_table.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#475569")),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                        ("ALIGN", (1, 0), (-1, -1), "CENTER"),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, 0), 10),
-                        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-                    ]
-                )
+                category_data, colWidths=[2.5 * inch, 1.5 * inch, 1.5 * inch, 1.5 * inch], style=self._CATEGORY_TABLE_STYLE
             )
-            elements.append(category_table)
-            elements.append(Spacer(1, 0.3 * inch))
+
+            elements.extend([
+                self._static("Category Breakdown"),
+                category_table,
+                Spacer(1, 0.3 * inch),
+            ])
 
         return elements
 
     def _create_recommendations_section(self, recommendations: list) -> list:
         """Create recommendations section."""
-        elements = []
-
-        header = Paragraph("Recommendations", self.styles["SectionHeader"])
-        elements.append(header)
+        elements = [self._static("Recommendations")]
 
         if not recommendations:
-            no_recs = Paragraph(
-                "No specific recommendations available at this time.",
-                self.styles["ReportBodyText"],
+            elements.append(
+                self._static("No specific recommendations available at this time.")
             )
-            elements.append(no_recs)
         else:
+            body_style = self.styles["ReportBodyText"]
+            gap = 0.1 * inch
             for i, rec in enumerate(recommendations, 1):
-                rec_text = f"<b>{i}.</b> {rec}"
-                rec_para = Paragraph(rec_text, self.styles["ReportBodyText"])
-                elements.append(rec_para)
-                elements.append(Spacer(1, 0.1 * inch))
+                rec_text = f"<b>{i}.</b> {escape(rec, quote=False)}"
+                elements.extend([Paragraph(rec_text, body_style), Spacer(1, gap)])
 
         elements.append(Spacer(1, 0.3 * inch))
 
@@ -430,16 +526,13 @@ class PDFReportGenerator:
 
     def _create_input_summaries_section(self, report: SkillGapReport) -> list:
         """Create input summaries section."""
-        elements = []
+        if not report.resume_summary and not report.job_description_summary:
+            return []
 
-        header = Paragraph("Input Summary", self.styles["SectionHeader"])
-        elements.append(header)
+        elements = [self._static("Input Summary")]
 
         # Resume Summary
         if report.resume_summary:
-            resume_header = Paragraph("Resume Overview", self.styles["SubsectionHeader"])
-            elements.append(resume_header)
-
             resume_data = [
                 ["Metric", "Value"],
                 ["Total Skills", str(report.resume_summary.get("total_skills", 0))],
@@ -451,29 +544,18 @@ class PDFReportGenerator:
             if categories:
                 resume_data.append(["Skill Categories", f"{len(categories)} categories"])
 
-            resume_table = Table(resume_data, colWidths=[3 * inch, 3 * inch])
-            resume_table.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#3b82f6")),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, 0), 11),
-                        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-                    ]
-                )
+            resume_table = Table(
+                resume_data, colWidths=[3 * inch, 3 * inch], style=self._RESUME_TABLE_STYLE
             )
-            elements.append(resume_table)
-            elements.append(Spacer(1, 0.2 * inch))
+
+            elements.extend([
+                self._static("Resume Overview"),
+                resume_table,
+                Spacer(1, 0.2 * inch),
+            ])
 
         # Job Description Summary
         if report.job_description_summary:
-            jd_header = Paragraph("Job Description Overview", self.styles["SubsectionHeader"])
-            elements.append(jd_header)
-
             jd_data = [
                 ["Metric", "Value"],
                 ["Required Skills", str(report.job_description_summary.get("total_skills", 0))],
@@ -485,106 +567,107 @@ class PDFReportGenerator:
             if categories:
                 jd_data.append(["Skill Categories", f"{len(categories)} categories"])
 
-            jd_table = Table(jd_data, colWidths=[3 * inch, 3 * inch])
-            jd_table.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#059669")),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, 0), 11),
-                        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-                    ]
-                )
+            jd_table = Table(
+                jd_data, colWidths=[3 * inch, 3 * inch], style=self._JD_TABLE_STYLE
             )
-            elements.append(jd_table)
-            elements.append(Spacer(1, 0.3 * inch))
+
+            elements.extend([
+                self._static("Job Description Overview"),
+                jd_table,
+                Spacer(1, 0.3 * inch),
+            ])
 
         return elements
 
-    def _create_match_quality_section(self, gap_analysis: GapAnalysis) -> list:
+    def _create_match_quality_section(
+        self, gap_analysis: GapAnalysis, match_types: Counter
+    ) -> list:
         """Create match quality analysis section."""
-        elements = []
-
-        header = Paragraph("Match Quality Analysis", self.styles["SectionHeader"])
-        elements.append(header)
-
-        # Analyze match types
-        match_types = {}
-        for match in gap_analysis.matched_skills:
-            match_type = match.match_type
-            match_types[match_type] = match_types.get(match_type, 0) + 1
-
-        if match_types:
-            quality_text = "Your skills matched the job requirements with the following quality distribution:"
-            quality_para = Paragraph(quality_text, self.styles["ReportBodyText"])
-            elements.append(quality_para)
-            elements.append(Spacer(1, 0.1 * inch))
-
-            quality_data = [["Match Type", "Count", "Percentage"]]
-            total_matches = sum(match_types.values())
-            for match_type, count in sorted(match_types.items(), key=lambda x: x[1], reverse=True):
-                percentage = (count / total_matches * 100) if total_matches > 0 else 0
-                quality_data.append([
-                    match_type.capitalize(),
-                    str(count),
-                    f"{percentage:.1f}%"
-                ])
-
-            quality_table = Table(quality_data, colWidths=[2 * inch, 2 * inch, 2 * inch])
-            quality_table.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#475569")),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                        ("ALIGN", (1, 0), (-1, -1), "CENTER"),
-                        ("ALIGN", (2, 0), (-1, -1), "CENTER"),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, 0), 11),
-                        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-                    ]
-                )
-            )
-            elements.append(quality_table)
-            elements.append(Spacer(1, 0.2 * inch))
-
-            # Match quality insights
-            exact_matches = match_types.get("exact", 0)
-            if exact_matches > 0:
-                exact_percentage = (exact_matches / total_matches * 100) if total_matches > 0 else 0
-                if exact_percentage >= 70:
-                    insight = "Excellent! Most of your skills match exactly with the job requirements."
-                elif exact_percentage >= 50:
-                    insight = "Good match quality. Consider updating your resume terminology to match the job description more closely."
-                else:
-                    insight = "Consider refining your resume to use terminology that matches the job description more closely."
-
-                insight_para = Paragraph(f"<i>{insight}</i>", self.styles["ReportBodyText"])
-                elements.append(insight_para)
+        if not gap_analysis.matched_skills:
+            return []
+
+        elements = [self._static("Match Quality Analysis")]
+
+        quality_data = [["Match Type", "Count", "Percentage"]]
+        total_matches = sum(match_types.values())
+        for match_type, count in match_types.most_common():
+            percentage = (count / total_matches * 100) if total_matches > 0 else 0
+            quality_data.append([
+                match_type.capitalize(),
+                str(count),
+                f"{percentage:.1f}%"
+            ])
+
+        quality_table = Table(
+            quality_data, colWidths=[2 * inch, 2 * inch, 2 * inch], style=self._QUALITY_TABLE_STYLE
+        )
+
+        elements.extend([
+            self._static(
+                "Your skills matched the job requirements with the following quality distribution:"
+            ),
+            Spacer(1, 0.1 * inch),
+            quality_table,
+            Spacer(1, 0.2 * inch),
+        ])
+
+        # Match quality insights
+        exact_matches = match_types.get("exact", 0)
+        if exact_matches > 0:
+            exact_percentage = (exact_matches / total_matches * 100) if total_matches > 0 else 0
+            if exact_percentage >= 70:
+                insight = "Excellent! Most of your skills match exactly with the job requirements."
+            elif exact_percentage >= 50:
+                insight = "Good match quality. Consider updating your resume terminology to match the job description more closely."
+            else:
+                insight = "Consider refining your resume to use terminology that matches the job description more closely."
+
+            elements.append(Paragraph(f"<i>{insight}</i>", self.styles["ReportBodyText"]))
 
         elements.append(Spacer(1, 0.3 * inch))
 
         return elements
 
-    def _create_action_items_section(self, report: SkillGapReport) -> list:
-        """Create actionable items section."""
-        elements = []
-
-        header = Paragraph("Action Items", self.styles["SectionHeader"])
-        elements.append(header)
+    @staticmethod
+    def score_interpretation(overall_score: float) -> str:
+        """
+        Describe what an overall fit score means for the candidate.
+        
+        Args:
+            overall_score: Overall fit score (0-100)
+            
+        Returns:
+            One-sentence interpretation
+        """
+        if overall_score >= 80:
+            return "Excellent match! Your skills align very well with the job requirements."
+        elif overall_score >= 60:
+            return "Good match! You have a solid foundation with room for improvement."
+        elif overall_score >= 40:
+            return "Moderate match. Focus on developing the missing skills identified below."
+        else:
+            return "Significant gaps identified. Consider whether this role aligns with your career goals or if you're willing to invest in substantial skill development."
 
+    @staticmethod
+    def build_action_items(
+        report: SkillGapReport, match_types: Optional[Counter] = None
+    ) -> List[str]:
+        """
+        Build the action item texts for a report.
+        
+        Args:
+            report: SkillGapReport object
+            match_types: Optional precomputed counts of matched skills per match type
+            
+        Returns:
+            List of action items with inline markup; skill names are escaped
+        """
         action_items = []
 
         # Based on missing skills
         if report.gap_analysis.missing_skills:
             top_missing = report.gap_analysis.missing_skills[:5]
-            missing_names = ", ".join([skill.name for skill in top_missing])
+            missing_names = escape(", ".join([skill.name for skill in top_missing]), quote=False)
             action_items.append(
                 f"<b>Priority:</b> Focus on learning these top missing skills: {missing_names}"
             )
@@ -604,8 +687,17 @@ class PDFReportGenerator:
 
         # Based on match quality
         matched_skills = report.gap_analysis.matched_skills
-        fuzzy_matches = [m for m in matched_skills if m.match_type == "fuzzy"]
-        if len(fuzzy_matches) > len(matched_skills) * 0.3:
+        threshold = len(matched_skills) * 0.3
+        if match_types is not None:
+            fuzzy_count = match_types["fuzzy"]
+        else:
+            fuzzy_count = 0
+            for m in matched_skills:
+                if m.match_type == "fuzzy":
+                    fuzzy_count += 1
+                    if fuzzy_count > threshold:
+                        break
+        if fuzzy_count > threshold:
             action_items.append(
                 "<b>Resume Optimization:</b> Update your resume to use the exact terminology "
                 "from the job description to improve keyword matching."
@@ -624,11 +716,20 @@ class PDFReportGenerator:
                 "your skill alignment."
             )
 
+        return action_items
+
+    def _create_action_items_section(
+        self, report: SkillGapReport, match_types: Counter
+    ) -> list:
+        """Create actionable items section."""
+        action_items = self.build_action_items(report, match_types)
+
+        elements = [self._static("Action Items")]
+        body_style = self.styles["ReportBodyText"]
+        gap = 0.1 * inch
         for i, item in enumerate(action_items, 1):
             item_text = f"<b>{i}.</b> {item}"
-            item_para = Paragraph(item_text, self.styles["ReportBodyText"])
-            elements.append(item_para)
-            elements.append(Spacer(1, 0.1 * inch))
+            elements.extend([Paragraph(item_text, body_style), Spacer(1, gap)])
 
         elements.append(Spacer(1, 0.3 * inch))
 
@@ -636,50 +737,209 @@ class PDFReportGenerator:
 
     def _create_learning_resources_section(self, learning_resources: list) -> list:
         """Create learning resources section."""
-        elements = []
-
-        header = Paragraph("Learning Resources", self.styles["SectionHeader"])
-        elements.append(header)
-
-        intro_text = "Here are some recommended learning resources to help you close the skill gaps:"
-        intro_para = Paragraph(intro_text, self.styles["ReportBodyText"])
-        elements.append(intro_para)
-        elements.append(Spacer(1, 0.1 * inch))
-
+        # All resources go into a single Paragraph, separated by blank lines
+        parts = []
         for i, resource in enumerate(learning_resources[:10], 1):  # Limit to 10
             resource_name = resource.get("name", "Resource")
             resource_type = resource.get("type", "Course")
             resource_url = resource.get("url", "")
             resource_description = resource.get("description", "")
 
-            resource_text = f"""
-            <b>{i}. {resource_name}</b> ({resource_type})<br/>
-            {resource_description}
-            """
+            resource_text = f"<b>{i}. {resource_name}</b> ({resource_type})<br/>{resource_description}"
             if resource_url:
                 resource_text += f"<br/><i>URL: {resource_url}</i>"
-
-            resource_para = Paragraph(resource_text, self.styles["ReportBodyText"])
-            elements.append(resource_para)
-            elements.append(Spacer(1, 0.15 * inch))
-
-        elements.append(Spacer(1, 0.3 * inch))
-
-        return elements
+            parts.append(resource_text)
+
+        resources_para = Paragraph("<br/><br/>".join(parts), self.styles["ReportBodyText"])
+
+        return [
+            self._static("Learning Resources"),
+            self._static(
+                "Here are some recommended learning resources to help you close the skill gaps:"
+            ),
+            Spacer(1, 0.1 * inch),
+            resources_para,
+            Spacer(1, 0.3 * inch),
+        ]
 
     def _create_footer(self, report: SkillGapReport) -> list:
         """Create report footer."""
-        elements = []
+        footer_text = f"<i>Report Version: {report.version} | Generated by SkilledU</i>"
 
-        footer_text = f"""
-        <i>Report Version: {report.version} | Generated by SkilledU</i>
-        """
-        footer_para = Paragraph(footer_text, self.styles["Normal"])
-        elements.append(footer_para)
-
-        return elements
+        return [Paragraph(footer_text, self.styles["Normal"])]
 
 
 # Global PDF generator instance
 pdf_report_generator = PDFReportGenerator()
 
+
+def _generate_pdf_bytes(report_json: str) -> bytes:
+    """
+    Render a serialized report to PDF bytes.
+
+    Args:
+        report_json: SkillGapReport serialized with model_dump_json()
+
+    Returns:
+        PDF file contents
+    """
+    report = SkillGapReport.model_validate_json(report_json)
+    buffer = BytesIO()
+    pdf_report_generator.generate_pdf_to_stream(report, buffer)
+    return buffer.getvalue()
+
+
+# Rendered PDFs keyed by report content, kept in the serving process so
+# re-downloads skip the pool entirely
+_PDF_CACHE_MAX_ENTRIES = 128
+_pdf_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+_pdf_cache_lock = threading.Lock()
+
+
+def _pdf_cache_key(report: SkillGapReport) -> bytes:
+    """
+    Digest a report as it appears in the PDF.
+
+    generated_at is set per request, so it counts only as the minute printed
+    in the header; the same report requested again within that minute
+    renders identically.
+    """
+    generated = report.generated_at.strftime(PDFReportGenerator._DATE_FORMAT)
+    payload = report.model_dump_json(exclude={"generated_at"}) + generated
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+def _pdf_cache_get(key: bytes) -> Optional[bytes]:
+    """Return a cached PDF and mark it most recently used."""
+    with _pdf_cache_lock:
+        pdf_bytes = _pdf_cache.get(key)
+        if pdf_bytes is not None:
+            _pdf_cache.move_to_end(key)
+        return pdf_bytes
+
+
+def _pdf_cache_put(key: bytes, pdf_bytes: bytes) -> None:
+    """Store a PDF, evicting the least recently used entry when full."""
+    with _pdf_cache_lock:
+        _pdf_cache[key] = pdf_bytes
+        _pdf_cache.move_to_end(key)
+        if len(_pdf_cache) > _PDF_CACHE_MAX_ENTRIES:
+            _pdf_cache.popitem(last=False)
+
+
+# Process pool for rendering; doc.build is pure Python and holds the GIL
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def get_pdf_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared process pool used for PDF rendering, creating it on first use.
+
+    Workers are spawned rather than forked, so they don't inherit the server's
+    threads, locks, HTTP connection pools or database handles.
+
+    Returns:
+        ProcessPoolExecutor with settings.pdf_render_workers workers
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=max(1, settings.pdf_render_workers),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _process_pool
+
+
+def _discard_pdf_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next render starts a fresh one."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False)
+
+
+def shutdown_pdf_process_pool() -> None:
+    """Stop the rendering workers; call on application shutdown."""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
+
+
+def render_pdf_bytes(report_json: str) -> bytes:
+    """
+    Render a serialized report to PDF bytes inside a worker process.
+
+    The report travels as JSON so workers never unpickle model internals.
+    Each worker builds its stylesheet once, when this module is imported.
+
+    Args:
+        report_json: SkillGapReport serialized with model_dump_json()
+
+    Returns:
+        PDF file contents
+    """
+    return _generate_pdf_bytes(report_json)
+
+
+async def render_pdf_bytes_async(report: SkillGapReport) -> bytes:
+    """
+    Render a report in the process pool without blocking the event loop.
+
+    Cached renders are returned without touching the pool. A worker that
+    dies (crash, OOM kill) breaks the whole pool; it is replaced so only the
+    request that hit it fails.
+
+    Args:
+        report: SkillGapReport object
+
+    Returns:
+        PDF file contents
+    """
+    key = _pdf_cache_key(report)
+    pdf_bytes = _pdf_cache_get(key)
+    if pdf_bytes is not None:
+        return pdf_bytes
+
+    pool = get_pdf_process_pool()
+    try:
+        pdf_bytes = await asyncio.get_running_loop().run_in_executor(
+            pool, render_pdf_bytes, report.model_dump_json()
+        )
+    except BrokenProcessPool:
+        _discard_pdf_process_pool(pool)
+        raise
+    _pdf_cache_put(key, pdf_bytes)
+    return pdf_bytes
+
+
+def generate_pdfs_bulk(reports: List[SkillGapReport]) -> List[bytes]:
+    """
+    Render several reports in parallel across the process pool.
+
+    Args:
+        reports: List of SkillGapReport objects
+
+    Returns:
+        List of PDF file contents, in the same order as reports
+    """
+    keys = [_pdf_cache_key(report) for report in reports]
+    results = [_pdf_cache_get(key) for key in keys]
+    missing = [index for index, pdf_bytes in enumerate(results) if pdf_bytes is None]
+    if not missing:
+        return results
+
+    pool = get_pdf_process_pool()
+    try:
+        rendered = list(pool.map(render_pdf_bytes, [reports[index].model_dump_json() for index in missing]))
+    except BrokenProcessPool:
+        _discard_pdf_process_pool(pool)
+        raise
+    for index, pdf_bytes in zip(missing, rendered):
+        _pdf_cache_put(keys[index], pdf_bytes)
+        results[index] = pdf_bytes
+    return results
@@ -1,14 +1,314 @@
 """
-PDF parsing service using pdfplumber.
+PDF parsing service using PyMuPDF, with pdfplumber as fallback.
 """
+import gc
+import hashlib
 import io
-from typing import Optional, Tuple
+import mmap
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from itertools import repeat
+from typing import Iterator, List, Optional, Tuple, Union
 import pdfplumber
-from app.utils.text_cleaning import clean_text, normalize_whitespace, remove_encoding_issues
+from pdfminer.pdftypes import resolve1
+try:
+    import pymupdf
+except ImportError:
+    # Fallback to pdfplumber if PyMuPDF not available
+    pymupdf = None
+from app.config import settings
+from app.utils.text_cleaning import clean_extracted_text
+
+
+# Parsed text keyed by (method, content digest); PDFs are immutable so entries never go stale
+_CACHE_MAX_ENTRIES = 128
+_text_cache: "OrderedDict[Tuple[str, bytes], tuple]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+# Long pdfplumber runs force a collection this often to keep fragmentation in check
+_GC_EVERY_PAGES = 100
+
+# Documents with fewer pages are parsed in-process; pool startup would dominate
+_PARALLEL_MIN_PAGES = 8
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def _parse_workers() -> int:
+    """Number of page-extraction worker processes: settings.pdf_parse_workers, at most one per CPU."""
+    return max(1, min(settings.pdf_parse_workers, os.cpu_count() or 1))
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared page-extraction process pool, creating it on first use.
+    
+    Workers are spawned rather than forked, so they don't inherit the server's
+    threads, locks or open connections.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=_parse_workers(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _process_pool
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next large PDF starts a fresh one."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False)
+
+
+def shutdown_pdf_parse_pool() -> None:
+    """Stop the page-extraction workers; call on application shutdown."""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
+
+
+def _cache_key(method: str, pdf_content: Union[bytes, mmap.mmap]) -> Tuple[str, bytes]:
+    """Build a cache key from the method name and a digest of the PDF bytes."""
+    return method, hashlib.blake2b(pdf_content, digest_size=16).digest()
+
+
+def _cache_get(key: Tuple[str, bytes]) -> Optional[tuple]:
+    """Return a cached result and mark it most recently used."""
+    with _cache_lock:
+        result = _text_cache.get(key)
+        if result is not None:
+            _text_cache.move_to_end(key)
+        return result
+
+
+def _cache_put(key: Tuple[str, bytes], result: tuple) -> None:
+    """Store a result, evicting the least recently used entry when full."""
+    with _cache_lock:
+        _text_cache[key] = result
+        _text_cache.move_to_end(key)
+        if len(_text_cache) > _CACHE_MAX_ENTRIES:
+            _text_cache.popitem(last=False)
+
+
+@contextmanager
+def _open_pymupdf(pdf_source: Union[bytes, str]) -> Iterator["pymupdf.Document"]:
+    """Open a PDF held in memory, or by path so MuPDF reads only what it needs."""
+    if isinstance(pdf_source, str):
+        doc = pymupdf.open(pdf_source, filetype="pdf")
+    else:
+        doc = pymupdf.open(stream=pdf_source, filetype="pdf")
+    try:
+        yield doc
+    finally:
+        doc.close()
+
+
+@contextmanager
+def _open_pdfplumber(pdf_source: Union[bytes, str]) -> Iterator[pdfplumber.PDF]:
+    """Open a PDF held in memory, or memory-map it by path so the OS pages it in on demand."""
+    if isinstance(pdf_source, str):
+        with open(pdf_source, "rb") as pdf_file, \
+                mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with pdfplumber.open(mapped) as pdf:
+                yield pdf
+    else:
+        with pdfplumber.open(io.BytesIO(pdf_source)) as pdf:
+            yield pdf
+
+
+def _page_count(pdf: pdfplumber.PDF) -> int:
+    """Read the page count recorded at the page tree root, walking pdf.pages only if it's missing."""
+    page_tree = resolve1(pdf.doc.catalog.get("Pages"))
+    total_pages = resolve1(page_tree.get("Count")) if isinstance(page_tree, dict) else None
+    if not isinstance(total_pages, int):
+        total_pages = len(pdf.pages)
+    return total_pages
 
 
 class PDFParser:
-    """PDF parsing service using pdfplumber."""
+    """PDF parsing service using PyMuPDF, with pdfplumber as fallback."""
+    
+    @staticmethod
+    def _iter_pages_pymupdf(
+        pdf_source: Union[bytes, str], layout: bool = False, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[Optional[str]]:
+        """
+        Yield the text of each page with PyMuPDF.
+        
+        Args:
+            pdf_source: PDF file content as bytes, or a path to the file
+            layout: Order text blocks top-to-bottom, left-to-right
+            start: Index of the first page to extract
+            stop: Index after the last page to extract (None for all)
+        
+        Yields:
+            Page text, or None for pages that failed to parse
+        """
+        with _open_pymupdf(pdf_source) as doc:
+            for page in doc.pages(start, stop):
+                try:
+                    if layout:
+                        # Blocks are (x0, y0, x1, y1, text, block_no, block_type); type 0 is text
+                        blocks = [b for b in page.get_text("blocks") if b[6] == 0]
+                        blocks.sort(key=lambda b: (b[1], b[0]))
+                        page_text = "\n".join(b[4].rstrip() for b in blocks)
+                        
+                        # Pages without text blocks (e.g. scans) have nothing for a second pass
+                        if blocks and not page_text.strip():
+                            page_text = page.get_text("text")
+                    else:
+                        page_text = page.get_text("text")
+                except Exception:
+                    # Continue with other pages
+                    page_text = None
+                
+                yield page_text
+    
+    @staticmethod
+    def _iter_pages_pdfplumber(
+        pdf_source: Union[bytes, str], layout: bool = False, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[Optional[str]]:
+        """
+        Yield the text of each page with pdfplumber.
+        
+        Args:
+            pdf_source: PDF file content as bytes, or a path to the file
+            layout: Preserve layout (handles multi-column layouts better)
+            start: Index of the first page to extract
+            stop: Index after the last page to extract (None for all)
+        
+        Yields:
+            Page text, or None for pages that failed to parse
+        """
+        with _open_pdfplumber(pdf_source) as pdf:
+            for page_num, page in enumerate(pdf.pages[start:stop], 1):
+                try:
+                    if not page.chars:
+                        # Image-only page (e.g. a scan); skip layout analysis entirely
+                        page_text = ""
+                    else:
+                        # Pick the extraction mode from the characters up front so each page is
+                        # laid out once; layout mode only pays off on multi-column pages
+                        use_layout = layout and PDFParser._is_multi_column(page.chars, page.width)
+                        page_text = page.extract_text(layout=use_layout)
+                        
+                        if use_layout and (not page_text or not page_text.strip()):
+                            # Fallback to regular extraction
+                            page_text = page.extract_text()
+                except Exception:
+                    # Continue with other pages
+                    page_text = None
+                
+                # Drop parsed page objects so memory stays flat across pages
+                page.flush_cache()
+                if hasattr(page, "close"):
+                    # Newer pdfplumber releases also free the page's layout objects
+                    page.close()
+                if page_num % _GC_EVERY_PAGES == 0:
+                    gc.collect()
+                yield page_text
+    
+    @staticmethod
+    def _is_multi_column(chars: list, page_width: float) -> bool:
+        """
+        Guess whether a page is laid out in two columns.
+        
+        Two columns leave a gutter: a band around the page center that almost no
+        characters start in, with substantial text on both sides of it.
+        
+        Args:
+            chars: pdfplumber character objects for the page
+            page_width: Page width in points
+            
+        Returns:
+            True if the character x-positions look bimodal around the center
+        """
+        center = page_width / 2
+        gutter = page_width * 0.05
+        left = right = middle = 0
+        for char in chars:
+            x0 = char["x0"]
+            if x0 < center - gutter:
+                left += 1
+            elif x0 > center + gutter:
+                right += 1
+            else:
+                middle += 1
+        
+        total = left + right + middle
+        return (
+            total > 0
+            and middle < total * 0.02
+            and left > total * 0.2
+            and right > total * 0.2
+        )
+    
+    @staticmethod
+    def _count_pages(pdf_source: Union[bytes, str]) -> int:
+        """Count pages without extracting any text."""
+        if pymupdf is not None:
+            with _open_pymupdf(pdf_source) as doc:
+                return doc.page_count
+        with _open_pdfplumber(pdf_source) as pdf:
+            return _page_count(pdf)
+    
+    @staticmethod
+    def _iter_page_range(
+        pdf_source: Union[bytes, str], layout: bool = False, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[Optional[str]]:
+        """Yield the text of a range of pages with the fastest available backend."""
+        if pymupdf is not None:
+            return PDFParser._iter_pages_pymupdf(pdf_source, layout, start, stop)
+        return PDFParser._iter_pages_pdfplumber(pdf_source, layout, start, stop)
+    
+    @staticmethod
+    def _iter_pages(pdf_source: Union[bytes, str], layout: bool = False) -> Iterator[Optional[str]]:
+        """
+        Yield the text of each page, fanning large pdfplumber jobs out across processes.
+        
+        Args:
+            pdf_source: PDF file content as bytes, or a path to the file
+            layout: Preserve layout where the backend supports it
+        
+        Yields:
+            Page text in page order, or None for pages that failed to parse
+        """
+        workers = _parse_workers()
+        # PyMuPDF parses in C faster than the pool can ship the PDF to workers
+        if pymupdf is None and workers > 1:
+            total_pages = PDFParser._count_pages(pdf_source)
+            if total_pages >= _PARALLEL_MIN_PAGES:
+                # One contiguous page range per worker; each worker opens the PDF itself,
+                # so a path source ships only the path
+                step = -(-total_pages // workers)
+                starts = range(0, total_pages, step)
+                stops = [min(begin + step, total_pages) for begin in starts]
+                pool = _get_process_pool()
+                try:
+                    for chunk in pool.map(
+                        _extract_page_range, repeat(pdf_source), starts, stops, repeat(layout)
+                    ):
+                        yield from chunk
+                except BrokenProcessPool:
+                    # A worker died; later documents get a fresh pool
+                    _discard_process_pool(pool)
+                    raise
+                return
+        
+        yield from PDFParser._iter_page_range(pdf_source, layout)
     
     @staticmethod
     def extract_text(pdf_content: bytes) -> Tuple[str, Optional[str]]:
@@ -17,46 +317,63 @@ class PDFParser:
         
         Args:
             pdf_content: PDF file content as bytes
-            
+        
+        Returns:
+            Tuple of (extracted_text, error_message)
+        """
+        return PDFParser._extract_text(pdf_content, _cache_key("text", pdf_content))
+    
+    @staticmethod
+    def extract_text_from_path(path: str) -> Tuple[str, Optional[str]]:
+        """
+        Extract text from a PDF file on disk without reading it all into memory.
+        
+        The file is memory-mapped (or opened directly by PyMuPDF), so only the
+        parts the parser seeks into are paged in.
+        
+        Args:
+            path: Path to the PDF file
+        
         Returns:
             Tuple of (extracted_text, error_message)
         """
         try:
-            # Create file-like object from bytes
-            pdf_file = io.BytesIO(pdf_content)
-            
-            # Extract text from all pages
-            full_text = []
-            
-            with pdfplumber.open(pdf_file) as pdf:
-                # Iterate through all pages
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    try:
-                        # Extract text from page
-                        page_text = page.extract_text()
-                        
-                        if page_text:
-                            full_text.append(page_text)
-                        
-                    except Exception as e:
-                        # Log error but continue with other pages
-                        error_msg = f"Error extracting text from page {page_num}: {str(e)}"
-                        # Continue with other pages
-                        continue
+            # Hash the mapped file so the cache is shared with extract_text
+            with open(path, "rb") as pdf_file, \
+                    mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                key = _cache_key("text", mapped)
+        except (OSError, ValueError) as e:
+            return "", f"Error reading PDF: {str(e)}"
+        
+        return PDFParser._extract_text(path, key)
+    
+    @staticmethod
+    def _extract_text(pdf_source: Union[bytes, str], key: Tuple[str, bytes]) -> Tuple[str, Optional[str]]:
+        """Extract and clean the text of every page, consulting the cache first."""
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            # Extract text from all pages, writing each one as it is parsed
+            buffer = io.StringIO()
+            for page_text in PDFParser._iter_pages(pdf_source):
+                if page_text:
+                    if buffer.tell():
+                        buffer.write("\n\n")
+                    buffer.write(page_text)
             
-            # Combine all pages
-            combined_text = "\n\n".join(full_text)
+            combined_text = buffer.getvalue()
             
             if not combined_text or combined_text.strip() == "":
                 return "", "No text could be extracted from the PDF"
             
             # Clean and normalize text
-            cleaned_text = remove_encoding_issues(combined_text)
-            cleaned_text = normalize_whitespace(cleaned_text)
-            cleaned_text = clean_text(cleaned_text)
+            cleaned_text = clean_extracted_text(combined_text)
             
+            _cache_put(key, (cleaned_text, None))
             return cleaned_text, None
-            
+        
         except Exception as e:
             error_message = f"Error parsing PDF: {str(e)}"
             return "", error_message
@@ -68,57 +385,45 @@ class PDFParser:
         
         Args:
             pdf_content: PDF file content as bytes
-            
+        
         Returns:
             Tuple of (extracted_text, error_message, metadata)
         """
+        key = _cache_key("layout", pdf_content)
+        cached = _cache_get(key)
+        if cached is not None:
+            cleaned_text, metadata = cached
+            return cleaned_text, None, dict(metadata)
+        
         try:
-            pdf_file = io.BytesIO(pdf_content)
-            
-            full_text = []
+            buffer = io.StringIO()
             metadata = {
                 "total_pages": 0,
                 "pages_with_text": 0,
                 "pages_without_text": 0,
             }
             
-            with pdfplumber.open(pdf_file) as pdf:
-                metadata["total_pages"] = len(pdf.pages)
-                
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    try:
-                        # Try to extract text preserving layout
-                        # This handles multi-column layouts better
-                        page_text = page.extract_text(layout=True)
-                        
-                        if page_text and page_text.strip():
-                            full_text.append(page_text)
-                            metadata["pages_with_text"] += 1
-                        else:
-                            # Fallback to regular extraction
-                            page_text = page.extract_text()
-                            if page_text and page_text.strip():
-                                full_text.append(page_text)
-                                metadata["pages_with_text"] += 1
-                            else:
-                                metadata["pages_without_text"] += 1
-                                
-                    except Exception as e:
-                        metadata["pages_without_text"] += 1
-                        continue
+            for page_text in PDFParser._iter_pages(pdf_content, layout=True):
+                metadata["total_pages"] += 1
+                if page_text and page_text.strip():
+                    if buffer.tell():
+                        buffer.write("\n\n")
+                    buffer.write(page_text)
+                    metadata["pages_with_text"] += 1
+                else:
+                    metadata["pages_without_text"] += 1
             
-            combined_text = "\n\n".join(full_text)
+            combined_text = buffer.getvalue()
             
             if not combined_text or combined_text.strip() == "":
                 return "", "No text could be extracted from the PDF", metadata
             
             # Clean text
-            cleaned_text = remove_encoding_issues(combined_text)
-            cleaned_text = normalize_whitespace(cleaned_text)
-            cleaned_text = clean_text(cleaned_text)
+            cleaned_text = clean_extracted_text(combined_text)
             
+            _cache_put(key, (cleaned_text, dict(metadata)))
             return cleaned_text, None, metadata
-            
+        
         except Exception as e:
             error_message = f"Error parsing PDF: {str(e)}"
             return "", error_message, {}
@@ -130,7 +435,7 @@ class PDFParser:
         
         Args:
             pdf_content: PDF file content as bytes
-            
+        
         Returns:
             Dictionary with PDF metadata
         """
@@ -139,12 +444,12 @@ class PDFParser:
             
             with pdfplumber.open(pdf_file) as pdf:
                 metadata = {
-                    "total_pages": len(pdf.pages),
+                    "total_pages": _page_count(pdf),
                     "metadata": pdf.metadata or {},
                 }
                 
                 return metadata
-                
+        
         except Exception as e:
             return {
                 "error": str(e),
@@ -153,6 +458,12 @@ class PDFParser:
             }
 
 
+def _extract_page_range(
+    pdf_source: Union[bytes, str], start: int, stop: int, layout: bool
+) -> List[Optional[str]]:
+    """Extract a range of pages inside a worker process (parser objects aren't picklable)."""
+    return list(PDFParser._iter_page_range(pdf_source, layout, start, stop))
+
+
 # Global PDF parser instance
 pdf_parser = PDFParser()
-
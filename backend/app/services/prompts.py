@@ -1,44 +1,212 @@
 """
 Prompt templates for skill extraction from resumes and job descriptions.
 """
-from typing import Dict, List
+import functools
+import json
+import re
+from typing import Any, Dict, List, Type, Union
+try:
+    import orjson
+except ImportError:
+    # Fallback to the standard library if orjson not available
+    orjson = None
+try:
+    import tiktoken
+except ImportError:
+    # Fallback to a 4-characters-per-token estimate if tiktoken not available
+    tiktoken = None
+from pydantic import BaseModel
+from app.models.schemas import SkillList
 from app.models.skill_taxonomy import SkillCategory, SKILL_CATEGORY_DESCRIPTIONS
 
 
-class SkillExtractionPrompts:
-    """Prompt templates for skill extraction using LLM."""
+# Examples shown next to each category in the extraction system prompt.
+# Categories without an entry fall back to their taxonomy description.
+_CATEGORY_EXAMPLES = {
+    SkillCategory.PROGRAMMING_LANGUAGES: "Python, Java, JavaScript, C++, Go, Rust, TypeScript, etc.",
+    SkillCategory.FRAMEWORKS_LIBRARIES: "React, Django, Spring Boot, TensorFlow, PyTorch, etc.",
+    SkillCategory.TOOLS_PLATFORMS: "Git, Docker, Jira, VS Code, AWS, Azure, etc.",
+    SkillCategory.DATABASES: "PostgreSQL, MongoDB, Redis, MySQL, Cassandra, etc.",
+    SkillCategory.CLOUD_SERVICES: "AWS, Azure, GCP, Heroku, etc.",
+    SkillCategory.DEVOPS: "Kubernetes, Terraform, Jenkins, CI/CD, Docker Swarm, etc.",
+    SkillCategory.SOFTWARE_ARCHITECTURE: "Microservices, REST APIs, Design Patterns, System Design, etc.",
+    SkillCategory.MACHINE_LEARNING: "Neural Networks, NLP, Computer Vision, Deep Learning, etc.",
+    SkillCategory.BLOCKCHAIN: "Solidity, Ethereum, Smart Contracts, Web3, etc.",
+    SkillCategory.CYBERSECURITY: "Penetration Testing, Security Protocols, Encryption, etc.",
+    SkillCategory.DATA_SCIENCE: "Data Analysis, Statistics, Visualization, ETL, etc.",
+    SkillCategory.LEADERSHIP: "Team Management, Mentoring, Strategic Planning, etc.",
+    SkillCategory.COMMUNICATION: "Technical Writing, Presentations, Cross-functional Collaboration, etc.",
+    SkillCategory.COLLABORATION: "Teamwork, Pair Programming, Code Reviews, etc.",
+    SkillCategory.PROBLEM_SOLVING: "Debugging, Troubleshooting, Critical Thinking, etc.",
+    SkillCategory.ANALYTICAL_THINKING: "Data Analysis, Root Cause Analysis, Logical Reasoning, etc.",
+    SkillCategory.AGILE: "Agile Development, Sprint Planning, User Stories, etc.",
+    SkillCategory.SCRUM: "Scrum Master, Sprint Retrospectives, Daily Standups, etc.",
+    SkillCategory.CI_CD: "Continuous Integration, Continuous Deployment, Pipeline Automation, etc.",
+    SkillCategory.DESIGN_THINKING: "User-Centered Design, Prototyping, User Research, etc.",
+    SkillCategory.FINTECH: "Payment Systems, Banking Software, Financial APIs, etc.",
+    SkillCategory.HEALTHCARE_IT: "EHR Systems, HIPAA Compliance, Medical Software, etc.",
+    SkillCategory.E_COMMERCE: "Online Retail, Payment Processing, Inventory Management, etc.",
+    SkillCategory.OTHER: "Any skills that don't fit the above categories",
+}
+
+# Education and certifications are extracted as their own sections, not as skill categories
+_PROMPT_CATEGORIES = [
+    category for category in SkillCategory
+    if category not in (SkillCategory.EDUCATION, SkillCategory.CERTIFICATIONS)
+]
+
+_CATEGORY_BLOCK = "\n".join(
+    f"- {category.value}: {_CATEGORY_EXAMPLES.get(category, SKILL_CATEGORY_DESCRIPTIONS[category])}"
+    for category in _PROMPT_CATEGORIES
+)
+_CATEGORY_BLOCK_COMPACT = ", ".join(category.value for category in _PROMPT_CATEGORIES)
+
+# Longer inputs are reduced to their skill-bearing lines (technical prompts) or truncated
+# (other prompts) before being sent to the LLM
+_MAX_PROMPT_CHARS = 12_000
+
+# Per-request input budget for chunked extraction, and trailing characters repeated
+# between chunks so a skill listed across a chunk boundary is still seen whole
+_MAX_PROMPT_TOKENS = _MAX_PROMPT_CHARS // 4
+_CHUNK_OVERLAP_CHARS = 300
+
+# Cleaned text usually arrives as one line; long lines are split after sentence punctuation
+_SENTENCE_END = re.compile(r"(?<=[.!?;])\s+")
+
+
+def _skill_keywords() -> List[str]:
+    """Collect the skill names listed in the category examples and descriptions."""
+    # Descriptions list their examples in parentheses; example strings are bare lists
+    sources = list(_CATEGORY_EXAMPLES.values()) + [
+        description[description.find("(") + 1:description.rfind(")")]
+        for description in SKILL_CATEGORY_DESCRIPTIONS.values()
+        if "(" in description
+    ]
+    keywords = set()
+    for source in sources:
+        for name in source.split(","):
+            name = name.strip().rstrip(".")
+            if name and name != "etc" and len(name.split()) <= 3:
+                keywords.add(name.lower())
+    return sorted(keywords, key=len, reverse=True)
+
+
+# Lines naming a known skill or a typical requirement phrase; everything else in a long
+# document (addresses, dates, boilerplate) is dropped before prompting
+_RELEVANT_LINE = re.compile(
+    r"(?<!\w)(?:"
+    + "|".join(map(re.escape, _skill_keywords()))
+    + r"|experience|proficien\w*|degree|certifi\w*|skills?|required|preferred|knowledge|familiar\w*"
+    + r")(?!\w)",
+    re.IGNORECASE,
+)
+
+
+def _truncate(text: str) -> str:
+    """
+    Cap text at _MAX_PROMPT_CHARS, cutting at a line boundary.
     
-    # System prompt with taxonomy guidelines
-    SYSTEM_PROMPT = """You are an expert at extracting and categorizing skills from resumes and job descriptions. 
+    Args:
+        text: Text to interpolate into a prompt
+        
+    Returns:
+        Text unchanged if it fits, otherwise its leading whole lines
+    """
+    if len(text) <= _MAX_PROMPT_CHARS:
+        return text
+    
+    # Cut at a line boundary so the last entry isn't split
+    cut = text.rfind("\n", 0, _MAX_PROMPT_CHARS)
+    return text[:cut if cut > 0 else _MAX_PROMPT_CHARS]
+
+
+def _prefilter(text: str) -> str:
+    """
+    Shrink long input to the lines likely to mention technical skills, capped at _MAX_PROMPT_CHARS.
+    
+    Text that already fits is returned unchanged. Only the technical skill prompts
+    use this; education, certifications and soft skills appear on lines the
+    keyword filter would drop, so their prompts use _truncate instead.
+    
+    Args:
+        text: Resume or job description text
+        
+    Returns:
+        Text to interpolate into the prompt
+    """
+    if len(text) <= _MAX_PROMPT_CHARS:
+        return text
+    
+    filtered = "\n".join(line for line in text.splitlines() if _RELEVANT_LINE.search(line))
+    return _truncate(filtered or text)
+
+
+def _split_long_line(line: str, limit: int) -> List[str]:
+    """
+    Split a line into pieces of at most limit characters.
+    
+    Cuts after sentence punctuation first, then at whitespace inside sentences
+    that are still too long; only a single word longer than limit is cut mid-word.
+    
+    Args:
+        line: Line of text
+        limit: Maximum characters per piece
+        
+    Returns:
+        List of pieces, in order
+    """
+    pieces = []
+    for sentence in _SENTENCE_END.split(line):
+        if len(sentence) <= limit:
+            pieces.append(sentence)
+            continue
+        current = ""
+        for word in sentence.split():
+            while len(word) > limit:
+                if current:
+                    pieces.append(current)
+                    current = ""
+                pieces.append(word[:limit])
+                word = word[limit:]
+            if current and len(current) + 1 + len(word) > limit:
+                pieces.append(current)
+                current = word
+            else:
+                current = f"{current} {word}" if current else word
+        if current:
+            pieces.append(current)
+    return pieces
+
+
+@functools.lru_cache(maxsize=None)
+def _encoding_for(model: str):
+    """tiktoken encoding for model, or None to count tokens by the character estimate."""
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Unknown model name; cl100k_base is close enough for budgeting
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Encoding files are downloaded on first use; fall back when offline
+        return None
+
+
+def _count_tokens(text: str, encoding) -> int:
+    """Count tokens with encoding, or estimate them at 4 characters per token."""
+    if encoding is None:
+        return (len(text) + 3) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+_SYSTEM_PROMPT_INTRO = """You are an expert at extracting and categorizing skills from resumes and job descriptions. 
 Your task is to identify technical skills, soft skills, education requirements, and certifications from text.
 
-SKILL CATEGORIES:
-- programming_languages: Python, Java, JavaScript, C++, Go, Rust, TypeScript, etc.
-- frameworks_libraries: React, Django, Spring Boot, TensorFlow, PyTorch, etc.
-- tools_platforms: Git, Docker, Jira, VS Code, AWS, Azure, etc.
-- databases: PostgreSQL, MongoDB, Redis, MySQL, Cassandra, etc.
-- cloud_services: AWS, Azure, GCP, Heroku, etc.
-- devops: Kubernetes, Terraform, Jenkins, CI/CD, Docker Swarm, etc.
-- software_architecture: Microservices, REST APIs, Design Patterns, System Design, etc.
-- machine_learning: Neural Networks, NLP, Computer Vision, Deep Learning, etc.
-- blockchain: Solidity, Ethereum, Smart Contracts, Web3, etc.
-- cybersecurity: Penetration Testing, Security Protocols, Encryption, etc.
-- data_science: Data Analysis, Statistics, Visualization, ETL, etc.
-- leadership: Team Management, Mentoring, Strategic Planning, etc.
-- communication: Technical Writing, Presentations, Cross-functional Collaboration, etc.
-- collaboration: Teamwork, Pair Programming, Code Reviews, etc.
-- problem_solving: Debugging, Troubleshooting, Critical Thinking, etc.
-- analytical_thinking: Data Analysis, Root Cause Analysis, Logical Reasoning, etc.
-- agile: Agile Development, Sprint Planning, User Stories, etc.
-- scrum: Scrum Master, Sprint Retrospectives, Daily Standups, etc.
-- ci_cd: Continuous Integration, Continuous Deployment, Pipeline Automation, etc.
-- design_thinking: User-Centered Design, Prototyping, User Research, etc.
-- fintech: Payment Systems, Banking Software, Financial APIs, etc.
-- healthcare_it: EHR Systems, HIPAA Compliance, Medical Software, etc.
-- e_commerce: Online Retail, Payment Processing, Inventory Management, etc.
-- other: Any skills that don't fit the above categories
-
-IMPORTANT GUIDELINES:
+"""
+
+_SYSTEM_PROMPT_GUIDELINES = """IMPORTANT GUIDELINES:
 1. Extract only concrete, verifiable skills mentioned in the text
 2. Do not infer skills that are not explicitly mentioned
 3. Use the exact skill names as they appear in the text (case-insensitive matching)
@@ -49,8 +217,189 @@ IMPORTANT GUIDELINES:
 8. Be precise and avoid duplication
 9. Return results in valid JSON format only"""
 
-    # Few-shot examples for better accuracy
-    FEW_SHOT_EXAMPLES = [
+
+# Output instructions for each prompt. They sit in the system message, ahead of the input,
+# so the prompt prefix is byte-identical across calls
+_SOFT_SKILL_PROMPT_CATEGORIES = ", ".join(category.value for category in (
+    SkillCategory.LEADERSHIP,
+    SkillCategory.COMMUNICATION,
+    SkillCategory.COLLABORATION,
+    SkillCategory.PROBLEM_SOLVING,
+    SkillCategory.ANALYTICAL_THINKING,
+    SkillCategory.AGILE,
+    SkillCategory.SCRUM,
+    SkillCategory.CI_CD,
+    SkillCategory.DESIGN_THINKING,
+))
+
+_GENERAL_INSTRUCTIONS = """The user message is a resume or job description, labeled as such. Extract all skills, education requirements, and certifications from it.
+
+Return the results in JSON format with this structure:
+{
+    "skills": [
+        {"name": "skill_name", "category": "category_name"},
+        ...
+    ],
+    "education": [
+        {"degree": "degree_type", "field": "field_of_study", "required": true/false, "preferred": false},
+        ...
+    ],
+    "certifications": [
+        {"name": "certification_name", "issuer": "issuer_name", "required": false, "preferred": false},
+        ...
+    ]
+}
+
+- Extract all technical and soft skills mentioned
+- For job descriptions, mark skills as required if explicitly stated as "required" or "must have"
+- Mark skills as preferred if stated as "preferred", "nice to have", or "bonus"
+- Extract degree requirements (Bachelor's, Master's, PhD, etc.)
+- Extract field of study if mentioned
+- Extract certification names and issuers if mentioned
+
+Return only valid JSON, no additional text or explanation."""
+
+_TECHNICAL_INSTRUCTIONS = """Extract all technical skills from the text in the user message.
+Include: programming languages, frameworks, libraries, tools, platforms, databases, cloud services, DevOps tools, and technical concepts.
+
+You must respond with a valid JSON object containing a "skills" array:
+{
+    "skills": [
+        {"name": "Python", "category": "programming_languages"},
+        {"name": "Docker", "category": "tools_platforms"},
+        ...
+    ]
+}
+
+Return only valid JSON object with a "skills" key containing an array."""
+
+_SOFT_SKILLS_INSTRUCTIONS = f"""Extract all soft skills and interpersonal competencies from the text in the user message.
+Categories: {_SOFT_SKILL_PROMPT_CATEGORIES}
+
+You must respond with a valid JSON object containing a "skills" array:
+{{
+    "skills": [
+        {{"name": "Leadership", "category": "leadership"}},
+        {{"name": "Communication", "category": "communication"}},
+        ...
+    ]
+}}
+
+Return only valid JSON object with a "skills" key containing an array."""
+
+_EDUCATION_INSTRUCTIONS = """Extract all education requirements and qualifications from the text in the user message.
+
+You must respond with a valid JSON object containing an "education" array:
+{
+    "education": [
+        {"degree": "Bachelor's", "field": "Computer Science", "required": true, "preferred": false},
+        ...
+    ]
+}
+
+Return only valid JSON object with an "education" key containing an array."""
+
+_CERTIFICATION_INSTRUCTIONS = """Extract all certifications from the text in the user message.
+
+You must respond with a valid JSON object containing a "certifications" array:
+{
+    "certifications": [
+        {"name": "AWS Certified Solutions Architect", "issuer": "AWS", "required": false, "preferred": true},
+        ...
+    ]
+}
+
+Return only valid JSON object with a "certifications" key containing an array."""
+
+_COMBINED_INSTRUCTIONS = f"""Extract all soft skills and interpersonal competencies, all education requirements and qualifications, and all certifications from the text in the user message.
+Soft skill categories: {_SOFT_SKILL_PROMPT_CATEGORIES}
+
+You must respond with a valid JSON object containing "soft_skills", "education" and "certifications" arrays:
+{{
+    "soft_skills": [
+        {{"name": "Leadership", "category": "leadership"}},
+        ...
+    ],
+    "education": [
+        {{"degree": "Bachelor's", "field": "Computer Science", "required": true, "preferred": false}},
+        ...
+    ],
+    "certifications": [
+        {{"name": "AWS Certified Solutions Architect", "issuer": "AWS", "required": false, "preferred": true}},
+        ...
+    ]
+}}
+
+Return only a valid JSON object with all three keys; use an empty array when nothing applies."""
+
+
+def _strict_schema(schema: Any) -> Any:
+    """
+    Rewrite a Pydantic JSON schema into the subset strict structured outputs accept.
+    
+    Pydantic wraps references that carry a description in a one-item allOf;
+    strict mode rejects allOf, so those collapse back to a bare $ref.
+    """
+    if isinstance(schema, list):
+        return [_strict_schema(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    all_of = schema.get("allOf")
+    if all_of and len(all_of) == 1 and "$ref" in all_of[0]:
+        return {"$ref": all_of[0]["$ref"]}
+    return {key: _strict_schema(value) for key, value in schema.items()}
+
+
+class SkillExtractionPrompts:
+    """Prompt templates for skill extraction using LLM."""
+    
+    # System prompt with taxonomy guidelines
+    SYSTEM_PROMPT = f"{_SYSTEM_PROMPT_INTRO}SKILL CATEGORIES:\n{_CATEGORY_BLOCK}\n\n{_SYSTEM_PROMPT_GUIDELINES}"
+
+    # Same prompt with bare category names, for long inputs where prompt tokens matter most
+    COMPACT_PROMPT_THRESHOLD = 4000
+    _SYSTEM_PROMPT_COMPACT = f"{_SYSTEM_PROMPT_INTRO}SKILL CATEGORIES: {_CATEGORY_BLOCK_COMPACT}\n\n{_SYSTEM_PROMPT_GUIDELINES}"
+
+    # System prompts for the focused extraction calls. Every instruction lives here and the
+    # user message carries only the input text, so each call type shares one static prefix
+    # that the API's automatic prompt caching can reuse
+    TECHNICAL_SYSTEM_PROMPT = f"""You are an expert at extracting technical skills from resumes and job descriptions.
+Extract only concrete technical skills that are explicitly mentioned. You must respond in valid JSON format.
+
+{_TECHNICAL_INSTRUCTIONS}"""
+
+    SOFT_SKILLS_SYSTEM_PROMPT = f"""You are an expert at extracting soft skills and interpersonal competencies from resumes and job descriptions.
+Focus on leadership, communication, collaboration, problem-solving, and analytical thinking skills. You must respond in valid JSON format.
+
+{_SOFT_SKILLS_INSTRUCTIONS}"""
+
+    EDUCATION_SYSTEM_PROMPT = f"""You are an expert at extracting education requirements and qualifications from resumes and job descriptions.
+Identify degree types (Bachelor's, Master's, PhD, etc.) and fields of study. You must respond in valid JSON format.
+
+{_EDUCATION_INSTRUCTIONS}"""
+
+    CERTIFICATION_SYSTEM_PROMPT = f"""You are an expert at extracting professional certifications from resumes and job descriptions.
+Identify certification names and issuing organizations. You must respond in valid JSON format.
+
+{_CERTIFICATION_INSTRUCTIONS}"""
+
+    COMBINED_SYSTEM_PROMPT = f"""You are an expert at extracting soft skills, education requirements and professional certifications from resumes and job descriptions.
+Focus on leadership, communication, collaboration, problem-solving, analytical thinking and working methodologies; degree types and fields of study; and certification names with their issuing organizations. You must respond in valid JSON format.
+
+{_COMBINED_INSTRUCTIONS}"""
+
+    # System messages are built once and shared by every request; callers must not mutate them
+    _SYSTEM_MSG = {"role": "system", "content": f"{SYSTEM_PROMPT}\n\n{_GENERAL_INSTRUCTIONS}"}
+    _SYSTEM_MSG_COMPACT = {"role": "system", "content": f"{_SYSTEM_PROMPT_COMPACT}\n\n{_GENERAL_INSTRUCTIONS}"}
+    _TECHNICAL_SYSTEM_MSG = {"role": "system", "content": TECHNICAL_SYSTEM_PROMPT}
+    _SOFT_SKILLS_SYSTEM_MSG = {"role": "system", "content": SOFT_SKILLS_SYSTEM_PROMPT}
+    _EDUCATION_SYSTEM_MSG = {"role": "system", "content": EDUCATION_SYSTEM_PROMPT}
+    _CERTIFICATION_SYSTEM_MSG = {"role": "system", "content": CERTIFICATION_SYSTEM_PROMPT}
+    _COMBINED_SYSTEM_MSG = {"role": "system", "content": COMBINED_SYSTEM_PROMPT}
+
+    # Few-shot examples for better accuracy; a tuple since they are read-only. The inner
+    # dicts stay plain so they can still be passed to json.dumps
+    FEW_SHOT_EXAMPLES = (
         {
             "input": "I have 5 years of experience with Python, Django, and PostgreSQL. I'm proficient in Docker and AWS.",
             "output": {
@@ -90,7 +439,7 @@ IMPORTANT GUIDELINES:
                 "certifications": []
             }
         }
-    ]
+    )
     
     @staticmethod
     def build_skill_extraction_prompt(text: str, source_type: str = "resume") -> List[Dict[str, str]]:
@@ -105,44 +454,16 @@ IMPORTANT GUIDELINES:
             List of message dictionaries for LLM API
         """
         source_context = "resume" if source_type == "resume" else "job description"
-        
-        user_prompt = f"""Extract all skills, education requirements, and certifications from the following {source_context} text.
-
-Return the results in JSON format with this structure:
-{{
-    "skills": [
-        {{"name": "skill_name", "category": "category_name"}},
-        ...
-    ],
-    "education": [
-        {{"degree": "degree_type", "field": "field_of_study", "required": true/false, "preferred": false}},
-        ...
-    ],
-    "certifications": [
-        {{"name": "certification_name", "issuer": "issuer_name", "required": false, "preferred": false}},
-        ...
-    ]
-}}
-
-For {source_context}s:
-- Extract all technical and soft skills mentioned
-- For job descriptions, mark skills as required if explicitly stated as "required" or "must have"
-- Mark skills as preferred if stated as "preferred", "nice to have", or "bonus"
-- Extract degree requirements (Bachelor's, Master's, PhD, etc.)
-- Extract field of study if mentioned
-- Extract certification names and issuers if mentioned
-
-TEXT TO ANALYZE:
-{text}
+        if len(text) > SkillExtractionPrompts.COMPACT_PROMPT_THRESHOLD:
+            system_msg = SkillExtractionPrompts._SYSTEM_MSG_COMPACT
+        else:
+            system_msg = SkillExtractionPrompts._SYSTEM_MSG
+        text = _prefilter(text)
 
-Return only valid JSON, no additional text or explanation."""
-        
-        messages = [
-            {"role": "system", "content": SkillExtractionPrompts.SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt}
+        return [
+            system_msg,
+            {"role": "user", "content": f"{source_context.capitalize()}:\n{text}"}
         ]
-        
-        return messages
     
     @staticmethod
     def build_technical_skills_prompt(text: str) -> List[Dict[str, str]]:
@@ -155,30 +476,11 @@ Return only valid JSON, no additional text or explanation."""
         Returns:
             List of message dictionaries for LLM API
         """
-        system_prompt = """You are an expert at extracting technical skills from resumes and job descriptions.
-Focus on programming languages, frameworks, tools, databases, cloud services, DevOps, and technical concepts.
-Extract only concrete technical skills that are explicitly mentioned. You must respond in valid JSON format."""
-        
-        user_prompt = f"""Extract all technical skills from the following text. 
-Include: programming languages, frameworks, libraries, tools, platforms, databases, cloud services, DevOps tools, and technical concepts.
-
-You must respond with a valid JSON object containing a "skills" array:
-{{
-    "skills": [
-        {{"name": "Python", "category": "programming_languages"}},
-        {{"name": "Docker", "category": "tools_platforms"}},
-        ...
-    ]
-}}
-
-TEXT:
-{text}
-
-Return only valid JSON object with a "skills" key containing an array."""
+        text = _prefilter(text)
         
         return [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
+            SkillExtractionPrompts._TECHNICAL_SYSTEM_MSG,
+            {"role": "user", "content": text}
         ]
     
     @staticmethod
@@ -192,28 +494,11 @@ Return only valid JSON object with a "skills" key containing an array."""
         Returns:
             List of message dictionaries for LLM API
         """
-        system_prompt = """You are an expert at extracting soft skills and interpersonal competencies from resumes and job descriptions.
-Focus on leadership, communication, collaboration, problem-solving, and analytical thinking skills. You must respond in valid JSON format."""
-        
-        user_prompt = f"""Extract all soft skills and interpersonal competencies from the following text.
-
-You must respond with a valid JSON object containing a "skills" array:
-{{
-    "skills": [
-        {{"name": "Leadership", "category": "leadership"}},
-        {{"name": "Communication", "category": "communication"}},
-        ...
-    ]
-}}
-
-TEXT:
-{text}
-
-Return only valid JSON object with a "skills" key containing an array."""
+        text = _truncate(text)
         
         return [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
+            SkillExtractionPrompts._SOFT_SKILLS_SYSTEM_MSG,
+            {"role": "user", "content": text}
         ]
     
     @staticmethod
@@ -227,27 +512,11 @@ Return only valid JSON object with a "skills" key containing an array."""
         Returns:
             List of message dictionaries for LLM API
         """
-        system_prompt = """You are an expert at extracting education requirements and qualifications from resumes and job descriptions.
-Identify degree types (Bachelor's, Master's, PhD, etc.) and fields of study. You must respond in valid JSON format."""
-        
-        user_prompt = f"""Extract all education requirements and qualifications from the following text.
-
-You must respond with a valid JSON object containing an "education" array:
-{{
-    "education": [
-        {{"degree": "Bachelor's", "field": "Computer Science", "required": true, "preferred": false}},
-        ...
-    ]
-}}
-
-TEXT:
-{text}
-
-Return only valid JSON object with an "education" key containing an array."""
+        text = _truncate(text)
         
         return [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
+            SkillExtractionPrompts._EDUCATION_SYSTEM_MSG,
+            {"role": "user", "content": text}
         ]
     
     @staticmethod
@@ -261,29 +530,117 @@ Return only valid JSON object with an "education" key containing an array."""
         Returns:
             List of message dictionaries for LLM API
         """
-        system_prompt = """You are an expert at extracting professional certifications from resumes and job descriptions.
-Identify certification names and issuing organizations. You must respond in valid JSON format."""
+        text = _truncate(text)
         
-        user_prompt = f"""Extract all certifications from the following text.
-
-You must respond with a valid JSON object containing a "certifications" array:
-{{
-    "certifications": [
-        {{"name": "AWS Certified Solutions Architect", "issuer": "AWS", "required": false, "preferred": true}},
-        ...
-    ]
-}}
-
-TEXT:
-{text}
-
-Return only valid JSON object with a "certifications" key containing an array."""
+        return [
+            SkillExtractionPrompts._CERTIFICATION_SYSTEM_MSG,
+            {"role": "user", "content": text}
+        ]
+    
+    @staticmethod
+    def build_combined_extraction_prompt(text: str) -> List[Dict[str, str]]:
+        """
+        Build one prompt extracting soft skills, education and certifications together.
+        
+        Sends the text once instead of three times; pair it with the
+        CombinedExtraction structured response format.
+        
+        Args:
+            text: Text to extract from
+            
+        Returns:
+            List of message dictionaries for LLM API
+        """
+        text = _truncate(text)
         
         return [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
+            SkillExtractionPrompts._COMBINED_SYSTEM_MSG,
+            {"role": "user", "content": text}
         ]
     
+    @staticmethod
+    def split_text(text: str, model: str, max_tokens: int = _MAX_PROMPT_TOKENS) -> List[str]:
+        """
+        Split text into chunks that each fit one extraction prompt.
+        
+        Text within budget comes back as a single chunk, unchanged. Longer text is
+        broken into lines, with lines too long for a chunk split at sentence ends
+        and then at whitespace, and reduced to the skill-bearing pieces. Those are
+        packed into chunks of at most max_tokens tokens and _MAX_PROMPT_CHARS
+        characters, each starting with up to _CHUNK_OVERLAP_CHARS characters of
+        whole pieces from the end of the previous chunk.
+        
+        Args:
+            text: Resume or job description text
+            model: Model name, used to pick the tokenizer
+            max_tokens: Token budget per chunk
+        
+        Returns:
+            List of text chunks
+        """
+        encoding = _encoding_for(model)
+        if len(text) <= _MAX_PROMPT_CHARS and _count_tokens(text, encoding) <= max_tokens:
+            return [text]
+        
+        # One below the budget, leaving room for the joining newline
+        piece_chars = min(_MAX_PROMPT_CHARS, max_tokens) - 1
+        pieces = []
+        for line in text.splitlines():
+            if len(line) <= piece_chars:
+                pieces.append(line)
+            else:
+                pieces.extend(_split_long_line(line, piece_chars))
+        pieces = [piece for piece in pieces if _RELEVANT_LINE.search(piece)] or [piece for piece in pieces if piece.strip()]
+        
+        chunks = []
+        current: List[str] = []
+        current_tokens = current_chars = 0
+        for piece in pieces:
+            # One extra token and character for the joining newline
+            piece_tokens = _count_tokens(piece, encoding) + 1
+            if current and (current_tokens + piece_tokens > max_tokens or current_chars + len(piece) + 1 > _MAX_PROMPT_CHARS):
+                chunks.append("\n".join(current))
+                # Carry over the trailing whole pieces that fit the overlap
+                overlap: List[str] = []
+                overlap_chars = 0
+                for kept in reversed(current):
+                    overlap_chars += len(kept) + 1
+                    if overlap_chars > _CHUNK_OVERLAP_CHARS:
+                        break
+                    overlap.insert(0, kept)
+                current = overlap
+                current_tokens = sum(_count_tokens(kept, encoding) + 1 for kept in current)
+                current_chars = sum(len(kept) + 1 for kept in current)
+                if current_tokens + piece_tokens > max_tokens or current_chars + len(piece) + 1 > _MAX_PROMPT_CHARS:
+                    # No room for the overlap next to this piece
+                    current = []
+                    current_tokens = current_chars = 0
+            current.append(piece)
+            current_tokens += piece_tokens
+            current_chars += len(piece) + 1
+        if current:
+            chunks.append("\n".join(current))
+        return chunks
+    
+    @classmethod
+    def parse_response(cls, content: Union[str, bytes]) -> Dict[str, Any]:
+        """
+        Parse a JSON-mode LLM response.
+        
+        Args:
+            content: Response content from LLM
+            
+        Returns:
+            Parsed JSON value
+            
+        Raises:
+            json.JSONDecodeError: If content is not valid JSON
+        """
+        if orjson is not None:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+            return orjson.loads(content)
+        return json.loads(content)
+    
     @staticmethod
     def get_response_format() -> Dict[str, str]:
         """
@@ -295,6 +652,31 @@ Return only valid JSON object with a "certifications" key containing an array.""
         return {
             "type": "json_object"
         }
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_structured_response_format(schema_model: Type[BaseModel] = SkillList) -> Dict[str, Any]:
+        """
+        Get response format specification for structured outputs.
+        
+        The model is constrained to the schema, so its reply validates
+        directly into schema_model with no JSON sniffing or fallbacks.
+        Built once per model; callers must not mutate the result.
+        
+        Args:
+            schema_model: Pydantic model describing the expected response
+            
+        Returns:
+            Response format dictionary for LLM API
+        """
+        return {
+            "type": "json_schema",
+            "json_schema": {
+                "name": schema_model.__name__,
+                "strict": True,
+                "schema": _strict_schema(schema_model.model_json_schema()),
+            },
+        }
 
 
 # Global prompts instance
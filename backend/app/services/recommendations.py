@@ -1,6 +1,7 @@
 """
 Recommendations generator for skill gap analysis.
 """
+from bisect import bisect_right
 from typing import List
 from app.models.schemas import GapAnalysis, SkillMatch, Skill
 
@@ -8,6 +9,39 @@ from app.models.schemas import GapAnalysis, SkillMatch, Skill
 class RecommendationsGenerator:
     """Generate personalized recommendations based on gap analysis."""
     
+    # Overall score message, selected by bisecting the score into its band
+    _SCORE_THRESHOLDS = (40, 60, 80)
+    _SCORE_TEMPLATES = (
+        "❌ Low match. This role may require significant skill development. "
+        "Consider whether this is the right opportunity or if you're willing "
+        "to invest in learning the required skills.",
+        "⚠️ Moderate match. You have some relevant skills, but there are "
+        "significant gaps. Consider upskilling in the areas below.",
+        "✅ Good match! You have a solid foundation. Consider focusing on "
+        "the missing skills below to improve your fit.",
+        "🎉 Excellent match! Your skills align well with the job requirements. "
+        "Focus on highlighting your strengths in your application.",
+    )
+    
+    # Skill categories grouped for missing-skill recommendations
+    _TECH_CATEGORIES = frozenset({
+        "programming_languages", "frameworks_libraries", "tools_platforms",
+        "databases", "cloud_services", "devops", "software_architecture",
+        "machine_learning", "data_science",
+    })
+    _SOFT_CATEGORIES = frozenset({
+        "leadership", "communication", "collaboration",
+        "problem_solving", "analytical_thinking",
+    })
+    _METHODOLOGY_CATEGORIES = frozenset({"agile", "scrum", "ci_cd", "design_thinking"})
+    
+    # Missing-skill buckets: 0 = technical, 1 = soft, 2 = methodology
+    _CATEGORY_BUCKET = {
+        **dict.fromkeys(_TECH_CATEGORIES, 0),
+        **dict.fromkeys(_SOFT_CATEGORIES, 1),
+        **dict.fromkeys(_METHODOLOGY_CATEGORIES, 2),
+    }
+    
     @staticmethod
     def generate_recommendations(
         gap_analysis: GapAnalysis,
@@ -26,54 +60,25 @@ class RecommendationsGenerator:
         recommendations = []
         
         # Overall score recommendations
-        if overall_score >= 80:
-            recommendations.append(
-                "🎉 Excellent match! Your skills align well with the job requirements. "
-                "Focus on highlighting your strengths in your application."
-            )
-        elif overall_score >= 60:
-            recommendations.append(
-                "✅ Good match! You have a solid foundation. Consider focusing on "
-                "the missing skills below to improve your fit."
-            )
-        elif overall_score >= 40:
-            recommendations.append(
-                "⚠️ Moderate match. You have some relevant skills, but there are "
-                "significant gaps. Consider upskilling in the areas below."
-            )
-        else:
-            recommendations.append(
-                "❌ Low match. This role may require significant skill development. "
-                "Consider whether this is the right opportunity or if you're willing "
-                "to invest in learning the required skills."
-            )
+        bucket = bisect_right(RecommendationsGenerator._SCORE_THRESHOLDS, overall_score)
+        recommendations.append(RecommendationsGenerator._SCORE_TEMPLATES[bucket])
         
         # Missing skills recommendations
         missing_skills = gap_analysis.missing_skills
         
         if missing_skills:
-            # Categorize missing skills
-            technical_missing = [
-                s for s in missing_skills
-                if s.category in [
-                    "programming_languages", "frameworks_libraries", "tools_platforms",
-                    "databases", "cloud_services", "devops", "software_architecture",
-                    "machine_learning", "data_science"
-                ]
-            ]
-            
-            soft_missing = [
-                s for s in missing_skills
-                if s.category in [
-                    "leadership", "communication", "collaboration",
-                    "problem_solving", "analytical_thinking"
-                ]
-            ]
+            # Categorize missing skills in a single pass
+            technical_missing, soft_missing, methodology_missing = [], [], []
+            buckets = (technical_missing, soft_missing, methodology_missing)
+            category_bucket = RecommendationsGenerator._CATEGORY_BUCKET
+            for s in missing_skills:
+                index = category_bucket.get(s.category)
+                if index is not None:
+                    buckets[index].append(s.name)
             
             # Technical skills recommendations
             if technical_missing:
-                top_missing = technical_missing[:5]  # Top 5 missing technical skills
-                skill_names = [s.name for s in top_missing]
+                skill_names = technical_missing[:5]  # Top 5 missing technical skills
                 recommendations.append(
                     f"📚 Prioritize learning these technical skills: {', '.join(skill_names)}. "
                     "Consider online courses, tutorials, or hands-on projects to build proficiency."
@@ -81,23 +86,16 @@ class RecommendationsGenerator:
             
             # Soft skills recommendations
             if soft_missing:
-                skill_names = [s.name for s in soft_missing]
                 recommendations.append(
-                    f"🤝 Develop these soft skills: {', '.join(skill_names)}. "
+                    f"🤝 Develop these soft skills: {', '.join(soft_missing)}. "
                     "Consider joining professional groups, taking communication courses, "
                     "or seeking mentorship opportunities."
                 )
             
             # Methodology recommendations
-            methodology_missing = [
-                s for s in missing_skills
-                if s.category in ["agile", "scrum", "ci_cd", "design_thinking"]
-            ]
-            
             if methodology_missing:
-                skill_names = [s.name for s in methodology_missing]
                 recommendations.append(
-                    f"🔄 Learn these methodologies: {', '.join(skill_names)}. "
+                    f"🔄 Learn these methodologies: {', '.join(methodology_missing)}. "
                     "Consider certifications or training programs to demonstrate proficiency."
                 )
         
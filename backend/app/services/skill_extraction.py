@@ -1,19 +1,93 @@
 """
 Technical skills extraction module using LLM.
 """
-import time
-from typing import List, Dict, Any, Optional, Tuple
-from app.models.schemas import Skill, Education, Certification
-from app.models.skill_taxonomy import SkillCategory
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Iterable, Optional, Tuple, Union
+try:
+    import ahocorasick
+except ImportError:
+    # Fallback to a compiled regex alternation if pyahocorasick not available
+    ahocorasick = None
+from app.models.schemas import Skill, SkillList, Education, Certification
+from app.models.skill_taxonomy import SkillCategory, KNOWN_TECHNICAL_SKILLS, KNOWN_SKILL_ALIASES
 from app.services.llm_service import llm_service
 from app.services.prompts import skill_extraction_prompts
 
+# Threads for the sync path's chunk calls; the async path awaits them on the event loop instead
+_chunk_executor = ThreadPoolExecutor(max_workers=4)
+
+
+def _build_known_keywords() -> Dict[str, Tuple[str, SkillCategory]]:
+    """Map every lowercased known skill name and alias to its canonical name and category."""
+    keywords = {}
+    for category, names in KNOWN_TECHNICAL_SKILLS.items():
+        for name in names:
+            for keyword in (name, *KNOWN_SKILL_ALIASES.get(name, ())):
+                keywords[keyword.lower()] = (name, category)
+    return keywords
+
+
+_KNOWN_KEYWORDS = _build_known_keywords()
+
+if ahocorasick is not None:
+    # One automaton over all keywords; a single scan of the text reports every occurrence
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _KNOWN_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    # Longest alternatives first, so each position takes the longest keyword like the automaton path
+    _KEYWORD_PATTERN = re.compile(
+        r"(?<!\w)(?:"
+        + "|".join(re.escape(keyword) for keyword in sorted(_KNOWN_KEYWORDS, key=len, reverse=True))
+        + r")(?!\w)"
+    )
+
+
+# Separators of a bare skills list ("Python, Docker; AWS" or one skill per line)
+_LIST_SEPARATOR = re.compile(r"[,;\n|\u2022]")
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex \\w class used by the fallback pattern."""
+    return char.isalnum() or char == "_"
+
+
+def _keyword_hits(lowered: str) -> Iterable[str]:
+    """
+    Find known keywords that stand as whole words in lowercased text.
+    
+    Overlapping hits resolve leftmost-longest, so "google cloud platform"
+    yields one keyword rather than also "google cloud".
+    """
+    if ahocorasick is None:
+        return [match.group(0) for match in _KEYWORD_PATTERN.finditer(lowered)]
+    
+    spans = []
+    for end, keyword in _KEYWORD_AUTOMATON.iter(lowered):
+        start = end - len(keyword) + 1
+        if start > 0 and _is_word_char(lowered[start - 1]):
+            continue
+        if end + 1 < len(lowered) and _is_word_char(lowered[end + 1]):
+            continue
+        spans.append((start, -len(keyword), keyword))
+    
+    hits = []
+    covered_until = 0
+    for start, negative_length, keyword in sorted(spans):
+        if start >= covered_until:
+            hits.append(keyword)
+            covered_until = start - negative_length
+    return hits
+
 
 class TechnicalSkillsExtractor:
     """Extract technical skills from text using LLM."""
     
-    # Technical skill categories
-    TECHNICAL_CATEGORIES = [
+    # Technical skill categories (frozenset: _validate_skills checks membership per skill)
+    TECHNICAL_CATEGORIES = frozenset({
         SkillCategory.PROGRAMMING_LANGUAGES,
         SkillCategory.FRAMEWORKS_LIBRARIES,
         SkillCategory.TOOLS_PLATFORMS,
@@ -25,7 +99,10 @@ class TechnicalSkillsExtractor:
         SkillCategory.BLOCKCHAIN,
         SkillCategory.CYBERSECURITY,
         SkillCategory.DATA_SCIENCE,
-    ]
+    })
+    
+    # Texts up to this length skip the LLM when keyword hits cover every listed item
+    KNOWN_SKILLS_ONLY_MAX_CHARS = 200
     
     @staticmethod
     def extract_skills(text: str, source_type: str = "resume") -> Tuple[List[Skill], Optional[str]]:
@@ -42,104 +119,290 @@ class TechnicalSkillsExtractor:
         if not text or len(text.strip()) < 10:
             return [], "Text is too short or empty"
         
+        # A short list made up only of known skills skips the LLM; keyword hits in
+        # prose ("react quickly", "Mark Jenkins") are left to the LLM to judge
+        if TechnicalSkillsExtractor._covered_by_known_skills(text):
+            known_skills = TechnicalSkillsExtractor.find_known_skills(text)
+            if known_skills:
+                return known_skills, None
+        
         if not llm_service.is_configured():
             return [], "LLM service is not configured. Please set OPENAI_API_KEY in .env file."
         
         try:
-            # Build prompt for technical skills extraction
-            messages = skill_extraction_prompts.build_technical_skills_prompt(text)
+            # Long texts are split to the per-request token budget; each chunk is one call
+            chunks = skill_extraction_prompts.split_text(text, llm_service.get_model())
+            if len(chunks) == 1:
+                skills = TechnicalSkillsExtractor._extract_chunk(chunks[0])
+            else:
+                futures = [_chunk_executor.submit(TechnicalSkillsExtractor._extract_chunk, chunk) for chunk in chunks]
+                results = []
+                for future in futures:
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        results.append(e)
+                skills = TechnicalSkillsExtractor._combine_chunk_results(results)
             
-            print(f"[Extraction] Calling LLM API for technical skills extraction...")
+            return TechnicalSkillsExtractor._finish_skills(skills, len(chunks)), None
             
-            # Call LLM API
-            response = llm_service.call_api(
-                messages=messages,
-                response_format=skill_extraction_prompts.get_response_format()
-            )
+        except Exception as e:
+            return [], TechnicalSkillsExtractor._error_message(e)
+    
+    @staticmethod
+    async def extract_skills_async(text: str, source_type: str = "resume") -> Tuple[List[Skill], Optional[str]]:
+        """
+        Extract technical skills from text without blocking the event loop.
+        
+        Same result as extract_skills, with the chunk calls awaited
+        concurrently on the async LLM client instead of worker threads.
+        
+        Args:
+            text: Text to extract skills from
+            source_type: Type of source ('resume' or 'job_description')
             
-            print(f"[Extraction] LLM API call successful. Response content length: {len(response.get('content', ''))}")
+        Returns:
+            Tuple of (list of Skill objects, error_message)
+        """
+        if not text or len(text.strip()) < 10:
+            return [], "Text is too short or empty"
+        
+        if TechnicalSkillsExtractor._covered_by_known_skills(text):
+            known_skills = TechnicalSkillsExtractor.find_known_skills(text)
+            if known_skills:
+                return known_skills, None
+        
+        if not llm_service.is_configured():
+            return [], "LLM service is not configured. Please set OPENAI_API_KEY in .env file."
+        
+        try:
+            chunks = skill_extraction_prompts.split_text(text, llm_service.get_model())
+            if len(chunks) == 1:
+                skills = await TechnicalSkillsExtractor._extract_chunk_async(chunks[0])
+            else:
+                results = await asyncio.gather(
+                    *(TechnicalSkillsExtractor._extract_chunk_async(chunk) for chunk in chunks),
+                    return_exceptions=True
+                )
+                skills = TechnicalSkillsExtractor._combine_chunk_results(results)
+            
+            return TechnicalSkillsExtractor._finish_skills(skills, len(chunks)), None
             
-            # Extract JSON from response
-            result = llm_service.extract_json_response(response["content"])
+        except Exception as e:
+            return [], TechnicalSkillsExtractor._error_message(e)
+    
+    @staticmethod
+    def _finish_skills(skills: List[Skill], chunk_count: int) -> List[Skill]:
+        """
+        Validate the LLM's skills.
+        
+        Args:
+            skills: Skills from the LLM, in chunk order
+            chunk_count: Number of chunks the text was split into
             
-            # Debug: Log the raw response
-            print(f"[Extraction] Technical skills LLM response: {str(result)[:500]}")
+        Returns:
+            List of validated Skill objects
+        """
+        if chunk_count > 1:
+            print(f"[Extraction] Combined {len(skills)} technical skills from {chunk_count} chunks")
+        
+        # Validate and filter skills
+        validated_skills = TechnicalSkillsExtractor._validate_skills(skills)
+        
+        print(f"[Extraction] After validation: {len(validated_skills)} technical skills")
+        
+        return validated_skills
+    
+    @staticmethod
+    def _error_message(error: Exception) -> str:
+        """Log a failed extraction and build its error message."""
+        error_message = f"Error extracting technical skills: {str(error)}"
+        import traceback
+        print(f"[Extraction] ERROR extracting technical skills: {error_message}")
+        print(f"[Extraction] Traceback: {traceback.format_exc()}")
+        return error_message
+    
+    @staticmethod
+    def _combine_chunk_results(results: List[Union[List[Skill], Exception]]) -> List[Skill]:
+        """
+        Combine per-chunk skills in chunk order.
+        
+        A failed chunk is logged and skipped so the others still count; the
+        first error is raised only when every chunk fails.
+        
+        Args:
+            results: Skills or the raised exception for each chunk
+            
+        Returns:
+            List of Skill objects, not yet validated
+        """
+        skills = []
+        errors = []
+        for index, result in enumerate(results):
+            if isinstance(result, Exception):
+                print(f"[Extraction] ERROR extracting technical skills from chunk {index + 1}/{len(results)}: {result}")
+                errors.append(result)
+            else:
+                skills.extend(result)
+        
+        if len(errors) == len(results):
+            raise errors[0]
+        return skills
+    
+    @staticmethod
+    def _chunk_request(text: str) -> Dict[str, Any]:
+        """Build the LLM call arguments for one chunk."""
+        # Structured outputs constrain the reply to the SkillList schema
+        return {
+            "messages": skill_extraction_prompts.build_technical_skills_prompt(text),
+            # Deterministic, so re-scoring the same text is served from the response cache
+            "temperature": 0,
+            "response_format": skill_extraction_prompts.get_structured_response_format(SkillList),
+        }
+    
+    @staticmethod
+    def _extract_chunk(text: str) -> List[Skill]:
+        """
+        Run one LLM extraction call over text that fits a single prompt.
+        
+        Args:
+            text: Text to extract skills from
             
-            # Parse skills from result
-            skills = TechnicalSkillsExtractor._parse_skills(result)
+        Returns:
+            List of Skill objects, not yet validated
+        """
+        print(f"[Extraction] Calling LLM API for technical skills extraction...")
+        
+        response = llm_service.call_api(**TechnicalSkillsExtractor._chunk_request(text))
+        
+        return TechnicalSkillsExtractor._parse_chunk_response(response.content)
+    
+    @staticmethod
+    async def _extract_chunk_async(text: str) -> List[Skill]:
+        """
+        Run one LLM extraction call over text that fits a single prompt, on the async client.
+        
+        Args:
+            text: Text to extract skills from
             
-            # Debug: Log parsed skills count
-            print(f"[Extraction] Parsed {len(skills)} technical skills from response")
+        Returns:
+            List of Skill objects, not yet validated
+        """
+        print(f"[Extraction] Calling LLM API for technical skills extraction...")
+        
+        response = await llm_service.call_api_async(**TechnicalSkillsExtractor._chunk_request(text))
+        
+        return TechnicalSkillsExtractor._parse_chunk_response(response.content)
+    
+    @staticmethod
+    def _parse_chunk_response(content: str) -> List[Skill]:
+        """
+        Validate one chunk's structured-output response and parse its skills.
+        
+        Args:
+            content: Response content from the LLM
             
-            # Validate and filter skills
-            validated_skills = TechnicalSkillsExtractor._validate_skills(skills)
+        Returns:
+            List of Skill objects, not yet validated
+        """
+        print(f"[Extraction] LLM API call successful. Response content length: {len(content)}")
+        
+        # Validate the response straight into the schema model
+        result = SkillList.model_validate_json(content)
+        
+        # Debug: Log the raw response
+        print(f"[Extraction] Technical skills LLM response: {content[:500]}")
+        
+        # Parse skills from result
+        skills = TechnicalSkillsExtractor._parse_skills(result)
+        
+        # Debug: Log parsed skills count
+        print(f"[Extraction] Parsed {len(skills)} technical skills from response")
+        
+        return skills
+    
+    @staticmethod
+    async def extract_skills_many(
+        texts: Iterable[str], source_type: str = "resume", concurrency: int = 8
+    ) -> List[Tuple[List[Skill], Optional[str]]]:
+        """
+        Extract technical skills from several texts concurrently.
+        
+        Args:
+            texts: Texts to extract skills from
+            source_type: Type of source ('resume' or 'job_description')
+            concurrency: Maximum number of LLM calls in flight at once
             
-            print(f"[Extraction] After validation: {len(validated_skills)} technical skills")
+        Returns:
+            List of (list of Skill objects, error_message) tuples, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def extract_one(text: str) -> Tuple[List[Skill], Optional[str]]:
+            async with semaphore:
+                return await TechnicalSkillsExtractor.extract_skills_async(text, source_type)
+        
+        return await asyncio.gather(*(extract_one(text) for text in texts))
+    
+    @staticmethod
+    def find_known_skills(text: str) -> List[Skill]:
+        """
+        Find known technical skills by whole-word keyword match, without the LLM.
+        
+        Args:
+            text: Text to search
             
-            return validated_skills, None
+        Returns:
+            List of Skill objects in order of first occurrence, without duplicates
+        """
+        skills = []
+        seen = set()
+        for keyword in _keyword_hits(text.lower()):
+            name, category = _KNOWN_KEYWORDS[keyword]
+            if name not in seen:
+                seen.add(name)
+                skills.append(Skill(name=name, category=category))
+        return skills
+    
+    @staticmethod
+    def _covered_by_known_skills(text: str) -> bool:
+        """
+        Check whether keyword hits alone account for a short text.
+        
+        True only for a short separated list in which every item is a known
+        skill or alias, so skipping the LLM cannot drop an unknown skill.
+        
+        Args:
+            text: Text to check
             
-        except Exception as e:
-            error_message = f"Error extracting technical skills: {str(e)}"
-            import traceback
-            print(f"[Extraction] ERROR extracting technical skills: {error_message}")
-            print(f"[Extraction] Traceback: {traceback.format_exc()}")
-            return [], error_message
+        Returns:
+            True if the text is fully covered by known skills
+        """
+        if len(text) > TechnicalSkillsExtractor.KNOWN_SKILLS_ONLY_MAX_CHARS:
+            return False
+        
+        items = [item.strip().lower() for item in _LIST_SEPARATOR.split(text)]
+        return all(item in _KNOWN_KEYWORDS for item in items if item)
     
     @staticmethod
-    def _parse_skills(result: Dict[str, Any]) -> List[Skill]:
+    def _parse_skills(result: SkillList) -> List[Skill]:
         """
         Parse skills from LLM response.
         
         Args:
-            result: LLM response dictionary
+            result: Validated structured-output response
             
         Returns:
             List of Skill objects
         """
         skills = []
         
-        # Handle different response formats
-        if isinstance(result, list):
-            # Direct array of skills
-            skill_list = result
-        elif isinstance(result, dict) and "skills" in result:
-            # Nested skills object
-            skill_list = result["skills"]
-        elif isinstance(result, dict):
-            # Try to find skills in any key
-            skill_list = result.get("skills", result.get("technical_skills", []))
-        else:
-            return []
-        
-        for skill_data in skill_list:
-            if isinstance(skill_data, dict):
-                try:
-                    skill_name = skill_data.get("name", "").strip()
-                    category_str = skill_data.get("category", "").strip()
-                    
-                    if not skill_name:
-                        continue
-                    
-                    # Validate and convert category
-                    try:
-                        category = SkillCategory(category_str.lower())
-                    except ValueError:
-                        # Try to infer category from name
-                        category = TechnicalSkillsExtractor._infer_category(skill_name)
-                    
-                    # Create Skill object
-                    skill = Skill(
-                        name=skill_name,
-                        category=category,
-                        confidence=skill_data.get("confidence"),
-                        aliases=skill_data.get("aliases", [])
-                    )
-                    
-                    skills.append(skill)
-                    
-                except Exception as e:
-                    # Skip invalid skill entries
-                    continue
+        for extracted in result.skills:
+            skill_name = extracted.name.strip()
+            if not skill_name:
+                continue
+            
+            skills.append(Skill(name=skill_name, category=extracted.category))
         
         return skills
     
@@ -179,57 +442,28 @@ class TechnicalSkillsExtractor:
         return validated
     
     @staticmethod
-    def _infer_category(skill_name: str) -> SkillCategory:
+    def extract_by_categories(text: str) -> Dict[str, List[Skill]]:
         """
-        Infer skill category from skill name.
+        Extract skills once and group them by category.
+        
+        Prefer this over several extract_by_category calls: each of those
+        runs a full extraction.
         
         Args:
-            skill_name: Name of the skill
+            text: Text to extract from
             
         Returns:
-            Inferred SkillCategory
+            Dictionary mapping category value to its Skill objects
         """
-        skill_lower = skill_name.lower()
-        
-        # Programming languages
-        if skill_lower in ["python", "java", "javascript", "typescript", "c++", "c#", "go", "rust", 
-                           "ruby", "php", "swift", "kotlin", "scala", "r", "matlab"]:
-            return SkillCategory.PROGRAMMING_LANGUAGES
-        
-        # Frameworks and libraries
-        if skill_lower in ["react", "django", "spring", "spring boot", "flask", "express", "angular", 
-                           "vue", "node.js", "tensorflow", "pytorch", "keras", "pandas", "numpy"]:
-            return SkillCategory.FRAMEWORKS_LIBRARIES
-        
-        # Databases
-        if skill_lower in ["postgresql", "mysql", "mongodb", "redis", "cassandra", "oracle", 
-                          "sqlite", "dynamodb", "elasticsearch"]:
-            return SkillCategory.DATABASES
-        
-        # Cloud services
-        if skill_lower in ["aws", "azure", "gcp", "google cloud", "heroku", "vercel", "netlify"]:
-            return SkillCategory.CLOUD_SERVICES
-        
-        # DevOps
-        if skill_lower in ["kubernetes", "docker", "terraform", "jenkins", "gitlab ci", "github actions",
-                          "ansible", "puppet", "chef", "vagrant"]:
-            return SkillCategory.DEVOPS
-        
-        # Tools and platforms
-        if skill_lower in ["git", "jira", "confluence", "slack", "vs code", "intellij", "eclipse"]:
-            return SkillCategory.TOOLS_PLATFORMS
-        
-        # Machine Learning
-        if skill_lower in ["machine learning", "deep learning", "neural networks", "nlp", 
-                          "computer vision", "reinforcement learning"]:
-            return SkillCategory.MACHINE_LEARNING
-        
-        # Blockchain
-        if skill_lower in ["blockchain", "solidity", "ethereum", "smart contracts", "web3", "defi"]:
-            return SkillCategory.BLOCKCHAIN
-        
-        # Default to other
-        return SkillCategory.OTHER
+        all_skills, error = TechnicalSkillsExtractor.extract_skills(text)
+        
+        if error:
+            return {}
+        
+        grouped: Dict[str, List[Skill]] = {}
+        for skill in all_skills:
+            grouped.setdefault(skill.category, []).append(skill)
+        return grouped
     
     @staticmethod
     def extract_by_category(text: str, category: SkillCategory) -> List[Skill]:
@@ -243,12 +477,7 @@ class TechnicalSkillsExtractor:
         Returns:
             List of Skill objects in the specified category
         """
-        all_skills, error = TechnicalSkillsExtractor.extract_skills(text)
-        
-        if error:
-            return []
-        
-        return [skill for skill in all_skills if skill.category == category]
+        return TechnicalSkillsExtractor.extract_by_categories(text).get(category, [])
     
     @staticmethod
     def extract_programming_languages(text: str) -> List[Skill]:
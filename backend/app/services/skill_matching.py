@@ -1,19 +1,57 @@
 """
 Skill matching algorithm for comparing skills between resume and job description.
 """
+import functools
 import re
-from typing import List, Dict, Tuple, Optional, Set
-from difflib import SequenceMatcher
+from typing import List, Dict, FrozenSet, Iterable, Tuple, Optional, Set
+from rapidfuzz.distance import Indel
 try:
-    from Levenshtein import ratio as levenshtein_ratio
+    import numpy
+    from rapidfuzz.process import cdist
 except ImportError:
-    # Fallback if Levenshtein not available
-    def levenshtein_ratio(s1: str, s2: str) -> float:
-        return SequenceMatcher(None, s1, s2).ratio()
+    # Fallback to pairwise ratios and greedy assignment if numpy not available
+    cdist = None
+    linear_sum_assignment = None
+else:
+    try:
+        from scipy.optimize import linear_sum_assignment
+    except ImportError:
+        # Fallback to greedy assignment if SciPy not available
+        linear_sum_assignment = None
 
 from app.models.schemas import Skill, SkillMatch
 from app.models.skill_taxonomy import SkillCategory
 
+# Normalized Indel similarity, the ratio python-Levenshtein computes
+levenshtein_ratio = Indel.normalized_similarity
+
+# Normalization patterns, compiled once. The suffix rules run in sequence like the
+# original rule table (so "app.ts.js" loses both suffixes); the whitespace and separator
+# rules collapse into a single pass over runs of spaces, hyphens and underscores
+_SUFFIX_PATTERNS = tuple(re.compile(pattern) for pattern in (r'\.js$', r'\.jsx$', r'\.ts$', r'\.tsx$'))
+_SEPARATOR_RUN = re.compile(r'[-_\s]+')
+_PREFIX_PATTERN = re.compile(r'^(proficient|experienced|skilled|expert|knowledge|familiar)\s+')
+_POSTFIX_PATTERN = re.compile(r'\s+(experience|proficiency|skills?|knowledge)$')
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_skill_name(skill_name: str) -> str:
+    """Normalize a skill name; cached because every comparison normalizes both names."""
+    normalized = skill_name.lower().strip()
+    
+    # Remove .js/.jsx/.ts/.tsx suffixes
+    for pattern in _SUFFIX_PATTERNS:
+        normalized = pattern.sub('', normalized)
+    
+    # Replace hyphens/underscores with spaces and remove extra whitespace
+    normalized = _SEPARATOR_RUN.sub(' ', normalized).strip()
+    
+    # Remove common prefixes/suffixes
+    normalized = _PREFIX_PATTERN.sub('', normalized)
+    normalized = _POSTFIX_PATTERN.sub('', normalized)
+    
+    return normalized
+
 
 class SkillMatcher:
     """Skill matching algorithm with exact, synonym, and fuzzy matching."""
@@ -57,7 +95,7 @@ class SkillMatcher:
         "leadership": {"leadership skills", "team leadership"},
     }
     
-    # Normalization rules
+    # Normalization rules (documentation; normalize_skill_name uses the compiled module patterns)
     NORMALIZATION_RULES = {
         r'\.js$': '',  # Remove .js suffix
         r'\.jsx$': '',  # Remove .jsx suffix
@@ -88,23 +126,10 @@ class SkillMatcher:
         if not skill_name:
             return ""
         
-        normalized = skill_name.lower().strip()
-        
-        # Apply normalization rules
-        for pattern, replacement in SkillMatcher.NORMALIZATION_RULES.items():
-            normalized = re.sub(pattern, replacement, normalized)
-        
-        # Remove extra whitespace
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        
-        # Remove common prefixes/suffixes
-        normalized = re.sub(r'^(proficient|experienced|skilled|expert|knowledge|familiar)\s+', '', normalized)
-        normalized = re.sub(r'\s+(experience|proficiency|skills?|knowledge)$', '', normalized)
-        
-        return normalized
+        return _normalize_skill_name(skill_name)
     
     @staticmethod
-    def get_synonyms(skill_name: str) -> Set[str]:
+    def get_synonyms(skill_name: str) -> FrozenSet[str]:
         """
         Get synonyms for a skill name.
         
@@ -114,25 +139,7 @@ class SkillMatcher:
         Returns:
             Set of synonyms including the skill name itself
         """
-        normalized = SkillMatcher.normalize_skill_name(skill_name)
-        synonyms = {normalized}
-        
-        # Check direct synonym mapping
-        for key, values in SkillMatcher.SKILL_SYNONYMS.items():
-            if normalized == key or normalized in values:
-                synonyms.add(key)
-                synonyms.update(values)
-            elif normalized in [SkillMatcher.normalize_skill_name(k) for k in [key] + list(values)]:
-                synonyms.add(key)
-                synonyms.update(values)
-        
-        # Reverse lookup: find if normalized name matches any synonym
-        for key, values in SkillMatcher.SKILL_SYNONYMS.items():
-            if normalized == SkillMatcher.normalize_skill_name(key):
-                synonyms.add(key)
-                synonyms.update(values)
-        
-        return synonyms
+        return _synonyms_for(SkillMatcher.normalize_skill_name(skill_name))
     
     @staticmethod
     def exact_match(skill1: Skill, skill2: Skill) -> bool:
@@ -166,10 +173,10 @@ class SkillMatcher:
         synonyms1 = SkillMatcher.get_synonyms(skill1.name)
         synonyms2 = SkillMatcher.get_synonyms(skill2.name)
         
-        return bool(synonyms1 & synonyms2)  # Check intersection
+        return not synonyms1.isdisjoint(synonyms2)  # Check intersection
     
     @staticmethod
-    def fuzzy_match(skill1: Skill, skill2: Skill, threshold: float = None) -> Tuple[bool, float]:
+    def fuzzy_match(skill1: Skill, skill2: Skill, threshold: Optional[float] = None) -> Tuple[bool, float]:
         """
         Check if two skills match using fuzzy matching.
         
@@ -217,155 +224,399 @@ class SkillMatcher:
         Returns:
             SkillMatch if match found, None otherwise
         """
-        # Try exact match first
-        if SkillMatcher.exact_match(skill1, skill2):
-            return SkillMatch(
-                skill=skill1,
-                match_type="exact",
-                confidence=SkillMatcher.EXACT_MATCH_CONFIDENCE
-            )
+        matched = _match_names(
+            SkillMatcher.normalize_skill_name(skill1.name),
+            SkillMatcher.normalize_skill_name(skill2.name),
+            SkillMatcher.category_match(skill1, skill2)
+        )
+        if matched:
+            match_type, confidence = matched
+            return SkillMatch(skill=skill1, match_type=match_type, confidence=confidence)
         
-        # Try synonym match
-        if SkillMatcher.synonym_match(skill1, skill2):
-            return SkillMatch(
-                skill=skill1,
-                match_type="synonym",
-                confidence=SkillMatcher.SYNONYM_MATCH_CONFIDENCE
-            )
+        return None
+    
+    @staticmethod
+    def _similar_match(name1: str, name2: str, same_category: bool) -> Optional[Tuple[str, float]]:
+        """
+        Fuzzy or category match on already-normalized names.
         
-        # Try fuzzy match
-        is_fuzzy_match, similarity = SkillMatcher.fuzzy_match(skill1, skill2)
-        if is_fuzzy_match:
-            return SkillMatch(
-                skill=skill1,
-                match_type="fuzzy",
-                confidence=similarity * SkillMatcher.FUZZY_MATCH_CONFIDENCE
-            )
+        Args:
+            name1: Normalized name of the first skill
+            name2: Normalized name of the second skill
+            same_category: Whether the skills share a category
+            
+        Returns:
+            Tuple of (match_type, confidence), or None if the names are too different
+        """
+        return SkillMatcher._score_similarity(levenshtein_ratio(name1, name2), same_category)
+    
+    @staticmethod
+    def _score_similarity(similarity: float, same_category: bool) -> Optional[Tuple[str, float]]:
+        """
+        Turn a name similarity into a fuzzy or category match.
         
-        # Try category match (only if categories match)
-        if SkillMatcher.category_match(skill1, skill2):
-            # Check if names are somewhat similar
-            name1 = SkillMatcher.normalize_skill_name(skill1.name)
-            name2 = SkillMatcher.normalize_skill_name(skill2.name)
-            similarity = levenshtein_ratio(name1, name2)
+        Args:
+            similarity: Levenshtein ratio of the normalized names
+            same_category: Whether the skills share a category
             
-            if similarity >= 0.6:  # Lower threshold for category match
-                return SkillMatch(
-                    skill=skill1,
-                    match_type="category",
-                    confidence=similarity * SkillMatcher.CATEGORY_MATCH_CONFIDENCE
-                )
+        Returns:
+            Tuple of (match_type, confidence), or None if the names are too different
+        """
+        if similarity >= SkillMatcher.FUZZY_THRESHOLD:
+            return "fuzzy", similarity * SkillMatcher.FUZZY_MATCH_CONFIDENCE
+        
+        # Category match only if categories match, with a lower similarity threshold
+        if same_category and similarity >= 0.6:
+            return "category", similarity * SkillMatcher.CATEGORY_MATCH_CONFIDENCE
         
         return None
     
     @staticmethod
-    def find_matches(resume_skills: List[Skill], jd_skills: List[Skill]) -> List[SkillMatch]:
+    def _similarity_matrix(resume_norms: List[str], jd_norms: List[str]) -> List[List[float]]:
         """
-        Find all matches between resume skills and JD skills.
+        Levenshtein ratios of every resume name against every JD name.
         
         Args:
-            resume_skills: Skills from resume
-            jd_skills: Skills from job description
+            resume_norms: Normalized resume skill names
+            jd_norms: Normalized JD skill names
             
         Returns:
-            List of SkillMatch objects
+            Matrix of ratios indexed [resume][jd]
         """
-        matches = []
-        matched_resume_indices = set()
+        if cdist is not None and resume_norms and jd_norms:
+            # One C call over the whole grid instead of a Python call per pair
+            # float64 and no score_cutoff keep every ratio identical to levenshtein_ratio; the
+            # defaults round to float32 and drop ratios sitting exactly on the 0.6 threshold
+            return cdist(
+                resume_norms, jd_norms, scorer=Indel.normalized_similarity, dtype=numpy.float64, workers=-1
+            ).tolist()
+        return [[levenshtein_ratio(r, j) for j in jd_norms] for r in resume_norms]
+    
+    @staticmethod
+    def _has_match(
+        index: "_SkillIndex", norm: str, synonyms: FrozenSet[str], category: str, similarities: Iterable[float]
+    ) -> bool:
+        """
+        Check whether match_skills would pair a skill with any skill in an index.
         
-        # Try to match each JD skill with resume skills
-        for jd_skill in jd_skills:
-            best_match = None
-            best_match_index = -1
-            best_confidence = 0.0
-            
-            for idx, resume_skill in enumerate(resume_skills):
-                if idx in matched_resume_indices:
-                    continue
-                
-                match = SkillMatcher.match_skills(resume_skill, jd_skill)
-                
-                if match and match.confidence > best_confidence:
-                    best_match = match
-                    best_match_index = idx
-                    best_confidence = match.confidence
+        Args:
+            index: Index over the skills to search
+            norm: Normalized name of the skill to look up
+            synonyms: Synonyms of the skill to look up
+            category: Category of the skill to look up
+            similarities: Name similarity of the skill to each indexed skill
             
-            if best_match:
-                matches.append(best_match)
-                matched_resume_indices.add(best_match_index)
+        Returns:
+            True if any indexed skill matches
+        """
+        if norm in index.by_norm or index.synonym_candidates(synonyms):
+            return True
         
-        return matches
+        return any(
+            SkillMatcher._score_similarity(similarity, other_category == category)
+            for similarity, other_category in zip(similarities, index.categories)
+        )
     
     @staticmethod
-    def find_missing_skills(resume_skills: List[Skill], jd_skills: List[Skill]) -> List[Skill]:
+    def _find_matches(comparison: "_SkillComparison") -> List[SkillMatch]:
+        """Pair JD skills with resume skills, optimally when SciPy is available."""
+        if linear_sum_assignment is not None and comparison.resume.skills and comparison.jd.skills:
+            return SkillMatcher._find_matches_optimal(comparison)
+        return SkillMatcher._find_matches_greedy(comparison)
+    
+    @staticmethod
+    def _find_matches_optimal(comparison: "_SkillComparison") -> List[SkillMatch]:
         """
-        Find skills in JD that are not in resume.
+        Pair skills so the summed match confidence is as high as possible.
+        
+        Greedy assignment lets an early JD skill take a resume skill that a later
+        JD skill needed; solving the assignment problem over the full confidence
+        matrix avoids that.
         
         Args:
-            resume_skills: Skills from resume
-            jd_skills: Skills from job description
+            comparison: Resume and JD skill indexes
             
         Returns:
-            List of missing skills
+            List of SkillMatch objects in JD order
         """
-        matches = SkillMatcher.find_matches(resume_skills, jd_skills)
+        resume, jd = comparison.resume, comparison.jd
+        similarities = numpy.asarray(comparison.similarities, dtype=numpy.float64)
+        same_category = numpy.equal.outer(
+            numpy.asarray(resume.categories, dtype=object), numpy.asarray(jd.categories, dtype=object)
+        )
+        
+        # Fuzzy and category confidences, vectorized; see _score_similarity
+        confidence = numpy.where(
+            similarities >= SkillMatcher.FUZZY_THRESHOLD,
+            similarities * SkillMatcher.FUZZY_MATCH_CONFIDENCE,
+            numpy.where(same_category & (similarities >= 0.6), similarities * SkillMatcher.CATEGORY_MATCH_CONFIDENCE, 0.0)
+        )
+        match_types = numpy.where(
+            similarities >= SkillMatcher.FUZZY_THRESHOLD, "fuzzy", numpy.where(confidence > 0, "category", "")
+        ).astype(object)
+        
+        # Synonym and exact matches override, in that order
+        for jd_position, (jd_norm, jd_synonyms) in enumerate(zip(jd.norms, jd.synonyms)):
+            for idx in resume.synonym_candidates(jd_synonyms):
+                confidence[idx, jd_position] = SkillMatcher.SYNONYM_MATCH_CONFIDENCE
+                match_types[idx, jd_position] = "synonym"
+            for idx in resume.by_norm.get(jd_norm, ()):
+                confidence[idx, jd_position] = SkillMatcher.EXACT_MATCH_CONFIDENCE
+                match_types[idx, jd_position] = "exact"
+        
+        rows, columns = linear_sum_assignment(confidence, maximize=True)
+        pairs = sorted(
+            (jd_position, idx) for idx, jd_position in zip(rows, columns)
+            if confidence[idx, jd_position] > 0
+        )
+        return [
+            SkillMatch(
+                skill=resume.skills[idx],
+                match_type=match_types[idx, jd_position],
+                confidence=float(confidence[idx, jd_position])
+            )
+            for jd_position, idx in pairs
+        ]
+    
+    @staticmethod
+    def _find_matches_greedy(comparison: "_SkillComparison") -> List[SkillMatch]:
+        """Assign each JD skill, in order, its best unmatched resume skill."""
+        resume, jd = comparison.resume, comparison.jd
+        matches = []
+        matched_resume_indices = set()
+        
+        # Try to match each JD skill with resume skills. Exact (1.0) beats synonym (0.95),
+        # which beats any fuzzy or category score, so the first two are index lookups that
+        # take the lowest unmatched resume index, as the pairwise scan did
+        for jd_position, (jd_norm, jd_category) in enumerate(zip(jd.norms, jd.categories)):
+            best_match_index = next(
+                (idx for idx in resume.by_norm.get(jd_norm, ()) if idx not in matched_resume_indices),
+                None
+            )
+            match_type, best_confidence = "exact", SkillMatcher.EXACT_MATCH_CONFIDENCE
+            
+            if best_match_index is None:
+                candidates = resume.synonym_candidates(jd.synonyms[jd_position])
+                best_match_index = next(
+                    (idx for idx in candidates if idx not in matched_resume_indices),
+                    None
+                )
+                match_type, best_confidence = "synonym", SkillMatcher.SYNONYM_MATCH_CONFIDENCE
+            
+            if best_match_index is None:
+                # Built on first use; often every JD skill has an exact or synonym match
+                similarities = comparison.similarities
+                best_confidence = 0.0
+                for idx, category in enumerate(resume.categories):
+                    if idx in matched_resume_indices:
+                        continue
+                    
+                    similar = SkillMatcher._score_similarity(
+                        similarities[idx][jd_position], category == jd_category
+                    )
+                    if similar and similar[1] > best_confidence:
+                        match_type, best_confidence = similar
+                        best_match_index = idx
+            
+            if best_match_index is not None:
+                matches.append(SkillMatch(
+                    skill=resume.skills[best_match_index],
+                    match_type=match_type,
+                    confidence=best_confidence
+                ))
+                matched_resume_indices.add(best_match_index)
+        
+        return matches
+    
+    @staticmethod
+    def _find_missing(comparison: "_SkillComparison", matches: List[SkillMatch]) -> List[Skill]:
+        """JD skills that no resume skill matches."""
+        resume, jd = comparison.resume, comparison.jd
         matched_jd_skill_names = {
             SkillMatcher.normalize_skill_name(match.skill.name) 
             for match in matches
         }
         
         missing = []
-        for jd_skill in jd_skills:
-            normalized_name = SkillMatcher.normalize_skill_name(jd_skill.name)
-            
+        for position, (jd_skill, normalized_name) in enumerate(zip(jd.skills, jd.norms)):
             # Check if this JD skill was matched
             if normalized_name not in matched_jd_skill_names:
-                # Double-check with matching
-                is_matched = False
-                for resume_skill in resume_skills:
-                    if SkillMatcher.match_skills(resume_skill, jd_skill):
-                        is_matched = True
-                        break
-                
-                if not is_matched:
+                # Double-check against every resume skill, matched or not
+                if not SkillMatcher._has_match(
+                    resume, normalized_name, jd.synonyms[position], jd_skill.category,
+                    (row[position] for row in comparison.similarities)
+                ):
                     missing.append(jd_skill)
         
         return missing
     
     @staticmethod
-    def find_extra_skills(resume_skills: List[Skill], jd_skills: List[Skill]) -> List[Skill]:
+    def _find_extra(comparison: "_SkillComparison", matches: List[SkillMatch]) -> List[Skill]:
+        """Resume skills that no JD skill matches."""
+        resume, jd = comparison.resume, comparison.jd
+        matched_resume_skill_names = {
+            SkillMatcher.normalize_skill_name(match.skill.name) 
+            for match in matches
+        }
+        
+        extra = []
+        for position, (resume_skill, normalized_name) in enumerate(zip(resume.skills, resume.norms)):
+            if normalized_name not in matched_resume_skill_names:
+                # Double-check against every JD skill, matched or not
+                if not SkillMatcher._has_match(
+                    jd, normalized_name, resume.synonyms[position], resume_skill.category,
+                    comparison.similarities[position]
+                ):
+                    extra.append(resume_skill)
+        
+        return extra
+    
+    @staticmethod
+    def match_all(
+        resume_skills: List[Skill], jd_skills: List[Skill]
+    ) -> Tuple[List[SkillMatch], List[Skill], List[Skill]]:
         """
-        Find skills in resume that are not in JD.
+        Find matched, missing and extra skills sharing one set of lookups.
+        
+        Same results as calling find_matches, find_missing_skills and
+        find_extra_skills, without recomputing the matches for each.
         
         Args:
             resume_skills: Skills from resume
             jd_skills: Skills from job description
             
         Returns:
-            List of extra skills
+            Tuple of (matches, missing skills, extra skills)
         """
-        matches = SkillMatcher.find_matches(resume_skills, jd_skills)
-        matched_resume_skill_names = {
-            SkillMatcher.normalize_skill_name(match.skill.name) 
-            for match in matches
-        }
+        comparison = _SkillComparison(resume_skills, jd_skills)
+        matches = SkillMatcher._find_matches(comparison)
+        return (
+            matches,
+            SkillMatcher._find_missing(comparison, matches),
+            SkillMatcher._find_extra(comparison, matches),
+        )
+    
+    @staticmethod
+    def find_matches(resume_skills: List[Skill], jd_skills: List[Skill]) -> List[SkillMatch]:
+        """
+        Find all matches between resume skills and JD skills.
         
-        extra = []
-        for resume_skill in resume_skills:
-            normalized_name = SkillMatcher.normalize_skill_name(resume_skill.name)
+        Args:
+            resume_skills: Skills from resume
+            jd_skills: Skills from job description
             
-            if normalized_name not in matched_resume_skill_names:
-                # Double-check with matching
-                is_matched = False
-                for jd_skill in jd_skills:
-                    if SkillMatcher.match_skills(resume_skill, jd_skill):
-                        is_matched = True
-                        break
-                
-                if not is_matched:
-                    extra.append(resume_skill)
+        Returns:
+            List of SkillMatch objects
+        """
+        return SkillMatcher._find_matches(_SkillComparison(resume_skills, jd_skills))
+    
+    @staticmethod
+    def find_missing_skills(resume_skills: List[Skill], jd_skills: List[Skill]) -> List[Skill]:
+        """
+        Find skills in JD that are not in resume.
         
-        return extra
+        Args:
+            resume_skills: Skills from resume
+            jd_skills: Skills from job description
+            
+        Returns:
+            List of missing skills
+        """
+        comparison = _SkillComparison(resume_skills, jd_skills)
+        return SkillMatcher._find_missing(comparison, SkillMatcher._find_matches(comparison))
+    
+    @staticmethod
+    def find_extra_skills(resume_skills: List[Skill], jd_skills: List[Skill]) -> List[Skill]:
+        """
+        Find skills in resume that are not in JD.
+        
+        Args:
+            resume_skills: Skills from resume
+            jd_skills: Skills from job description
+            
+        Returns:
+            List of extra skills
+        """
+        comparison = _SkillComparison(resume_skills, jd_skills)
+        return SkillMatcher._find_extra(comparison, SkillMatcher._find_matches(comparison))
+
+
+def _build_synonym_index() -> Dict[str, FrozenSet[str]]:
+    """
+    Map each name that triggers a synonym group to the union of the groups it triggers.
+    
+    A group (key plus its aliases) is triggered by any of its members, raw or
+    normalized. Groups overlap ("nodejs" is listed under both "javascript" and
+    "node.js"), so a name maps to every group it belongs to.
+    """
+    index: Dict[str, Set[str]] = {}
+    for key, values in SkillMatcher.SKILL_SYNONYMS.items():
+        members = {key} | values
+        triggers = members | {SkillMatcher.normalize_skill_name(member) for member in members}
+        for trigger in triggers:
+            index.setdefault(trigger, set()).update(members)
+    return {trigger: frozenset(members) for trigger, members in index.items()}
+
+
+# Normalized skill name -> synonyms to add, built once from SKILL_SYNONYMS
+_SYNONYM_INDEX = _build_synonym_index()
+
+
+@functools.lru_cache(maxsize=2048)
+def _synonyms_for(normalized: str) -> FrozenSet[str]:
+    """Synonym set of a normalized name, itself included; cached to skip the set union."""
+    return _SYNONYM_INDEX.get(normalized, frozenset()) | {normalized}
+
+
+@functools.lru_cache(maxsize=8192)
+def _match_names(name1: str, name2: str, same_category: bool) -> Optional[Tuple[str, float]]:
+    """
+    Match type and confidence of two normalized names; cached since the same pairs recur.
+    
+    Exact beats synonym, which beats fuzzy or category, as in match_skills.
+    """
+    if name1 == name2:
+        return "exact", SkillMatcher.EXACT_MATCH_CONFIDENCE
+    
+    if not _synonyms_for(name1).isdisjoint(_synonyms_for(name2)):
+        return "synonym", SkillMatcher.SYNONYM_MATCH_CONFIDENCE
+    
+    return SkillMatcher._similar_match(name1, name2, same_category)
+
+
+class _SkillIndex:
+    """Normalized names, categories and synonym sets of a skill list, with lookup tables."""
+    
+    def __init__(self, skills: List[Skill]) -> None:
+        self.skills: List[Skill] = skills
+        self.norms: List[str] = [SkillMatcher.normalize_skill_name(skill.name) for skill in skills]
+        self.categories: List[str] = [skill.category for skill in skills]
+        self.synonyms: List[FrozenSet[str]] = [SkillMatcher.get_synonyms(skill.name) for skill in skills]
+        
+        # Normalized name / synonym -> indices of the skills carrying it, ascending
+        self.by_norm: Dict[str, List[int]] = {}
+        self.by_synonym: Dict[str, List[int]] = {}
+        for idx, (norm, synonyms) in enumerate(zip(self.norms, self.synonyms)):
+            self.by_norm.setdefault(norm, []).append(idx)
+            for synonym in synonyms:
+                self.by_synonym.setdefault(synonym, []).append(idx)
+    
+    def synonym_candidates(self, synonyms: FrozenSet[str]) -> List[int]:
+        """Indices of skills sharing at least one synonym, ascending."""
+        return sorted({idx for synonym in synonyms for idx in self.by_synonym.get(synonym, ())})
+
+
+class _SkillComparison:
+    """Resume and JD skill indexes plus their name similarity matrix, computed on first use."""
+    
+    def __init__(self, resume_skills: List[Skill], jd_skills: List[Skill]) -> None:
+        self.resume: _SkillIndex = _SkillIndex(resume_skills)
+        self.jd: _SkillIndex = _SkillIndex(jd_skills)
+    
+    @functools.cached_property
+    def similarities(self) -> List[List[float]]:
+        """Levenshtein ratios indexed [resume][jd]."""
+        return SkillMatcher._similarity_matrix(self.resume.norms, self.jd.norms)
 
 
 # Global skill matcher instance
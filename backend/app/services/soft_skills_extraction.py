@@ -2,12 +2,29 @@
 Soft skills, education, and certification extraction module.
 """
 from typing import List, Dict, Any, Optional, Tuple
-from app.models.schemas import Skill, Education, Certification
-from app.models.skill_taxonomy import SkillCategory
+from app.models.schemas import (
+    Skill,
+    Education,
+    Certification,
+    CombinedExtraction,
+    ExtractedSkill,
+    ExtractedEducation,
+    ExtractedCertification,
+)
+from app.config import settings
+from app.models.skill_taxonomy import SkillCategory, KNOWN_SOFT_SKILLS
 from app.services.llm_service import llm_service
 from app.services.prompts import skill_extraction_prompts
 
 
+# Lowercased skill name -> category for soft skills and methodologies the LLM left uncategorized
+_SOFT_SKILL_NAME_TO_CATEGORY: Dict[str, SkillCategory] = {}
+for _category, _names in KNOWN_SOFT_SKILLS.items():
+    for _name in _names:
+        # First category listed wins
+        _SOFT_SKILL_NAME_TO_CATEGORY.setdefault(_name, _category)
+
+
 class SoftSkillsExtractor:
     """Extract soft skills, education, and certifications from text using LLM."""
     
@@ -28,155 +45,307 @@ class SoftSkillsExtractor:
         SkillCategory.DESIGN_THINKING,
     ]
     
+    # Categories kept by _validate_soft_skills (frozenset: checked once per skill)
+    _ALLOWED_CATEGORIES = frozenset(SOFT_SKILL_CATEGORIES + METHODOLOGY_CATEGORIES)
+    
     @staticmethod
-    def extract_soft_skills(text: str, source_type: str = "resume") -> Tuple[List[Skill], Optional[str]]:
+    def extract_all(
+        text: str, source_type: str = "resume"
+    ) -> Tuple[List[Skill], List[Education], List[Certification], Optional[str]]:
         """
-        Extract soft skills from text.
+        Extract soft skills, education, and certifications with a single LLM call.
         
         Args:
-            text: Text to extract skills from
+            text: Text to extract from
             source_type: Type of source ('resume' or 'job_description')
             
         Returns:
-            Tuple of (list of Skill objects, error_message)
+            Tuple of (list of Skill objects, list of Education objects,
+            list of Certification objects, error_message)
         """
         if not text or len(text.strip()) < 10:
-            return [], "Text is too short or empty"
+            return [], [], [], "Text is too short or empty"
         
         if not llm_service.is_configured():
-            return [], "LLM service is not configured. Please set OPENAI_API_KEY in .env file."
+            return [], [], [], "LLM service is not configured. Please set OPENAI_API_KEY in .env file."
         
         try:
-            # Build prompt for soft skills extraction
-            messages = skill_extraction_prompts.build_soft_skills_prompt(text)
-            
-            print(f"[Extraction] Calling LLM API for soft skills extraction...")
-            
-            # Call LLM API
-            response = llm_service.call_api(
-                messages=messages,
-                response_format=skill_extraction_prompts.get_response_format()
-            )
-            
-            print(f"[Extraction] LLM API call successful. Response content length: {len(response.get('content', ''))}")
+            print(f"[Extraction] Calling LLM API for soft skills, education and certifications extraction...")
             
-            # Extract JSON from response
-            result = llm_service.extract_json_response(response["content"])
+            response = llm_service.call_api(**SoftSkillsExtractor._combined_request(text))
             
-            # Debug: Log the raw response
-            print(f"[Extraction] Soft skills LLM response: {str(result)[:500]}")
-            
-            # Parse skills from result
-            skills = SoftSkillsExtractor._parse_skills(result)
-            
-            # Debug: Log parsed skills count
-            print(f"[Extraction] Parsed {len(skills)} soft skills from response")
-            
-            # Validate and filter skills
-            validated_skills = SoftSkillsExtractor._validate_soft_skills(skills)
-            
-            print(f"[Extraction] After validation: {len(validated_skills)} soft skills")
-            
-            return validated_skills, None
+            return SoftSkillsExtractor._finish_combined(response.content, source_type)
             
         except Exception as e:
-            error_message = f"Error extracting soft skills: {str(e)}"
-            import traceback
-            print(f"[Extraction] ERROR extracting soft skills: {error_message}")
-            print(f"[Extraction] Traceback: {traceback.format_exc()}")
-            return [], error_message
+            return [], [], [], SoftSkillsExtractor._error_message(e)
     
     @staticmethod
-    def extract_education(text: str, source_type: str = "resume") -> Tuple[List[Education], Optional[str]]:
+    async def extract_all_async(
+        text: str, source_type: str = "resume"
+    ) -> Tuple[List[Skill], List[Education], List[Certification], Optional[str]]:
         """
-        Extract education requirements from text.
+        Extract soft skills, education, and certifications with a single LLM call on the async client.
         
         Args:
-            text: Text to extract education from
+            text: Text to extract from
             source_type: Type of source ('resume' or 'job_description')
             
         Returns:
-            Tuple of (list of Education objects, error_message)
+            Tuple of (list of Skill objects, list of Education objects,
+            list of Certification objects, error_message)
         """
         if not text or len(text.strip()) < 10:
-            return [], "Text is too short or empty"
+            return [], [], [], "Text is too short or empty"
         
         if not llm_service.is_configured():
-            return [], "LLM service is not configured. Please set OPENAI_API_KEY in .env file."
+            return [], [], [], "LLM service is not configured. Please set OPENAI_API_KEY in .env file."
         
         try:
-            # Build prompt for education extraction
-            messages = skill_extraction_prompts.build_education_extraction_prompt(text)
-            
-            # Call LLM API
-            response = llm_service.call_api(
-                messages=messages,
-                response_format=skill_extraction_prompts.get_response_format()
-            )
-            
-            # Extract JSON from response
-            result = llm_service.extract_json_response(response["content"])
-            
-            # Debug: Log the raw response
-            print(f"[Extraction] Education LLM response: {str(result)[:500]}")
+            print(f"[Extraction] Calling LLM API for soft skills, education and certifications extraction...")
             
-            # Parse education from result
-            education_list = SoftSkillsExtractor._parse_education(result, source_type)
+            response = await llm_service.call_api_async(**SoftSkillsExtractor._combined_request(text))
             
-            # Debug: Log parsed education count
-            print(f"[Extraction] Parsed {len(education_list)} education entries from response")
-            
-            return education_list, None
+            return SoftSkillsExtractor._finish_combined(response.content, source_type)
             
         except Exception as e:
-            error_message = f"Error extracting education: {str(e)}"
-            return [], error_message
+            return [], [], [], SoftSkillsExtractor._error_message(e)
     
     @staticmethod
-    def extract_certifications(text: str, source_type: str = "resume") -> Tuple[List[Certification], Optional[str]]:
+    def submit_batch(texts: List[str]) -> Tuple[Optional[str], Optional[str]]:
         """
-        Extract certifications from text.
+        Submit the combined extraction of many texts to the Batch API.
+        
+        For bulk, non-interactive scoring: batched requests cost half as much
+        but can take up to 24 hours. This returns as soon as the batch is
+        created; pass the same texts to collect_batch later for the results.
         
         Args:
-            text: Text to extract certifications from
-            source_type: Type of source ('resume' or 'job_description')
+            texts: Texts to extract from
             
         Returns:
-            Tuple of (list of Certification objects, error_message)
+            Tuple of (batch ID, error_message)
         """
-        if not text or len(text.strip()) < 10:
-            return [], "Text is too short or empty"
-        
         if not llm_service.is_configured():
-            return [], "LLM service is not configured. Please set OPENAI_API_KEY in .env file."
+            return None, "LLM service is not configured. Please set OPENAI_API_KEY in .env file."
+        
+        _, requests = SoftSkillsExtractor._batch_requests(texts)
+        if not requests:
+            return None, "Text is too short or empty"
         
         try:
-            # Build prompt for certification extraction
-            messages = skill_extraction_prompts.build_certification_extraction_prompt(text)
+            return llm_service.submit_batch(requests), None
+        except Exception as e:
+            error_message = f"Error submitting batch extraction: {str(e)}"
+            print(f"[Extraction] ERROR: {error_message}")
+            return None, error_message
+    
+    @staticmethod
+    def collect_batch(
+        batch_id: str, texts: List[str], source_type: str = "resume"
+    ) -> Optional[List[Tuple[List[Skill], List[Education], List[Certification], Optional[str]]]]:
+        """
+        Fetch the results of a batch from submit_batch, if it has finished.
+        
+        Args:
+            batch_id: Batch ID returned by submit_batch
+            texts: The texts passed to submit_batch, in the same order
+            source_type: Type of source ('resume' or 'job_description')
             
-            # Call LLM API
-            response = llm_service.call_api(
-                messages=messages,
-                response_format=skill_extraction_prompts.get_response_format()
-            )
+        Returns:
+            One (skills, education, certifications, error_message) tuple per text,
+            in input order, or None while the batch is still running
+        """
+        request_ids, requests = SoftSkillsExtractor._batch_requests(texts)
+        
+        try:
+            responses = llm_service.collect_batch(batch_id, requests)
+        except Exception as e:
+            error_message = f"Error running batch extraction: {str(e)}"
+            print(f"[Extraction] ERROR: {error_message}")
+            return [([], [], [], error_message) for _ in texts]
+        
+        if responses is None:
+            return None
+        
+        # Each distinct response is parsed once; duplicates get their own list copies
+        parsed_by_id = {}
+        results = []
+        for custom_id in request_ids:
+            if custom_id is None:
+                results.append(([], [], [], "Text is too short or empty"))
+                continue
+            if custom_id not in responses:
+                results.append(([], [], [], "Batch request failed"))
+                continue
             
-            # Extract JSON from response
-            result = llm_service.extract_json_response(response["content"])
+            if custom_id not in parsed_by_id:
+                try:
+                    parsed_by_id[custom_id] = SoftSkillsExtractor._parse_combined_response(
+                        responses[custom_id].content, source_type
+                    )
+                except Exception as e:
+                    parsed_by_id[custom_id] = f"Error extracting soft skills, education and certifications: {str(e)}"
+            
+            parsed = parsed_by_id[custom_id]
+            if isinstance(parsed, str):
+                results.append(([], [], [], parsed))
+            else:
+                skills, education_list, certifications = parsed
+                results.append((list(skills), list(education_list), list(certifications), None))
+        
+        print(f"[Extraction] Batch extraction finished: {len(responses)} responses for {len(texts)} texts")
+        return results
+    
+    @staticmethod
+    def _batch_requests(texts: List[str]) -> Tuple[List[Optional[str]], Dict[str, Dict[str, Any]]]:
+        """
+        Build one batch request per distinct text.
+        
+        Texts that repeat once trimmed (shared boilerplate, resubmitted files)
+        share one request. The IDs depend only on the texts, so submit_batch and
+        collect_batch rebuild the same mapping.
+        
+        Args:
+            texts: Texts to extract from
             
-            # Debug: Log the raw response
-            print(f"[Extraction] Certifications LLM response: {str(result)[:500]}")
+        Returns:
+            Tuple of (custom ID per text, or None if too short; request parameters by custom ID)
+        """
+        request_ids: List[Optional[str]] = []
+        requests = {}
+        ids_by_text: Dict[str, str] = {}
+        for text in texts:
+            if not text or len(text.strip()) < 10:
+                request_ids.append(None)
+                continue
+            key = text.strip()
+            if key not in ids_by_text:
+                ids_by_text[key] = str(len(ids_by_text))
+                requests[ids_by_text[key]] = llm_service.build_params(**SoftSkillsExtractor._combined_request(key))
+            request_ids.append(ids_by_text[key])
+        return request_ids, requests
+    
+    @staticmethod
+    def _finish_combined(
+        content: str, source_type: str
+    ) -> Tuple[List[Skill], List[Education], List[Certification], Optional[str]]:
+        """Log and parse a successful combined extraction response."""
+        print(f"[Extraction] LLM API call successful. Response content length: {len(content)}")
+        
+        # Debug: Log the raw response
+        print(f"[Extraction] Soft skills, education and certifications LLM response: {content[:500]}")
+        
+        skills, education_list, certifications = SoftSkillsExtractor._parse_combined_response(
+            content, source_type
+        )
+        
+        print(
+            f"[Extraction] Parsed {len(skills)} soft skills, {len(education_list)} education entries "
+            f"and {len(certifications)} certifications from response"
+        )
+        
+        return skills, education_list, certifications, None
+    
+    @staticmethod
+    def _error_message(error: Exception) -> str:
+        """Log a failed combined extraction and build its error message."""
+        error_message = f"Error extracting soft skills, education and certifications: {str(error)}"
+        import traceback
+        print(f"[Extraction] ERROR extracting soft skills, education and certifications: {error_message}")
+        print(f"[Extraction] Traceback: {traceback.format_exc()}")
+        return error_message
+    
+    @staticmethod
+    def _combined_request(text: str) -> Dict[str, Any]:
+        """Build the call_api arguments for the combined extraction of one text."""
+        return {
+            # Build one prompt covering all three extractions; trimmed so texts differing only in
+            # surrounding whitespace share a request key (and with it the response cache)
+            "messages": skill_extraction_prompts.build_combined_extraction_prompt(text.strip()),
+            # Plain classification, so it runs on the smaller model; structured outputs
+            # keep that model to the schema with all three arrays present
+            "model": settings.llm_soft_skills_model or None,
+            # Deterministic, so re-scoring the same text is served from the response cache
+            "temperature": 0,
+            "response_format": skill_extraction_prompts.get_structured_response_format(CombinedExtraction),
+        }
+    
+    @staticmethod
+    def _parse_combined_response(
+        content: str, source_type: str
+    ) -> Tuple[List[Skill], List[Education], List[Certification]]:
+        """
+        Parse a combined extraction response.
+        
+        Args:
+            content: Response content from LLM
+            source_type: Type of source ('resume' or 'job_description')
             
-            # Parse certifications from result
-            certifications = SoftSkillsExtractor._parse_certifications(result, source_type)
+        Returns:
+            Tuple of (list of Skill objects, list of Education objects, list of Certification objects)
+        """
+        # Validate the response straight into the schema model
+        result = CombinedExtraction.model_validate_json(content)
+        
+        # Fan the arrays out to the individual parsers
+        skills = SoftSkillsExtractor._validate_soft_skills(
+            SoftSkillsExtractor._parse_skills(result.soft_skills)
+        )
+        education_list = SoftSkillsExtractor._parse_education(result.education, source_type)
+        certifications = SoftSkillsExtractor._parse_certifications(result.certifications, source_type)
+        return skills, education_list, certifications
+    
+    @staticmethod
+    def extract_soft_skills(text: str, source_type: str = "resume") -> Tuple[List[Skill], Optional[str]]:
+        """
+        Extract soft skills from text.
+        
+        Runs the combined extraction; calls for the same text share one LLM
+        request through the service's request coalescing and response cache.
+        
+        Args:
+            text: Text to extract skills from
+            source_type: Type of source ('resume' or 'job_description')
             
-            # Debug: Log parsed certifications count
-            print(f"[Extraction] Parsed {len(certifications)} certifications from response")
+        Returns:
+            Tuple of (list of Skill objects, error_message)
+        """
+        skills, _, _, error = SoftSkillsExtractor.extract_all(text, source_type)
+        return skills, error
+    
+    @staticmethod
+    def extract_education(text: str, source_type: str = "resume") -> Tuple[List[Education], Optional[str]]:
+        """
+        Extract education requirements from text.
+        
+        Runs the combined extraction; see extract_soft_skills.
+        
+        Args:
+            text: Text to extract education from
+            source_type: Type of source ('resume' or 'job_description')
             
-            return certifications, None
+        Returns:
+            Tuple of (list of Education objects, error_message)
+        """
+        _, education_list, _, error = SoftSkillsExtractor.extract_all(text, source_type)
+        return education_list, error
+    
+    @staticmethod
+    def extract_certifications(text: str, source_type: str = "resume") -> Tuple[List[Certification], Optional[str]]:
+        """
+        Extract certifications from text.
+        
+        Runs the combined extraction; see extract_soft_skills.
+        
+        Args:
+            text: Text to extract certifications from
+            source_type: Type of source ('resume' or 'job_description')
             
-        except Exception as e:
-            error_message = f"Error extracting certifications: {str(e)}"
-            return [], error_message
+        Returns:
+            Tuple of (list of Certification objects, error_message)
+        """
+        _, _, certifications, error = SoftSkillsExtractor.extract_all(text, source_type)
+        return certifications, error
     
     @staticmethod
     def extract_methodologies(text: str) -> List[Skill]:
@@ -199,141 +368,125 @@ class SoftSkillsExtractor:
             if error:
                 return []
             
-            # Filter for methodology categories
-            methodology_skills = [
-                skill for skill in all_skills
-                if skill.category in SoftSkillsExtractor.METHODOLOGY_CATEGORIES
-            ]
-            
-            return methodology_skills
+            return SoftSkillsExtractor._filter_methodologies(all_skills)
             
         except Exception:
             return []
     
     @staticmethod
-    def _parse_skills(result: Dict[str, Any]) -> List[Skill]:
-        """Parse skills from LLM response."""
-        skills = []
+    async def extract_methodologies_async(text: str) -> List[Skill]:
+        """
+        Extract methodology skills from text on the async client.
         
-        if isinstance(result, list):
-            skill_list = result
-        elif isinstance(result, dict) and "skills" in result:
-            skill_list = result["skills"]
-        elif isinstance(result, dict):
-            skill_list = result.get("skills", result.get("soft_skills", []))
-        else:
+        Args:
+            text: Text to extract from
+            
+        Returns:
+            List of Skill objects
+        """
+        try:
+            from app.services.skill_extraction import technical_skills_extractor
+            
+            # Same request as the technical extraction, so a concurrent one shares its call
+            all_skills, error = await technical_skills_extractor.extract_skills_async(text)
+            
+            if error:
+                return []
+            
+            return SoftSkillsExtractor._filter_methodologies(all_skills)
+            
+        except Exception:
             return []
+    
+    @staticmethod
+    def _filter_methodologies(skills: List[Skill]) -> List[Skill]:
+        """Keep the skills in methodology categories."""
+        return [
+            skill for skill in skills
+            if skill.category in SoftSkillsExtractor.METHODOLOGY_CATEGORIES
+        ]
+    
+    @staticmethod
+    def _parse_skills(extracted_skills: List[ExtractedSkill]) -> List[Skill]:
+        """
+        Parse skills from LLM response.
         
-        for skill_data in skill_list:
-            if isinstance(skill_data, dict):
-                try:
-                    skill_name = skill_data.get("name", "").strip()
-                    category_str = skill_data.get("category", "").strip()
-                    
-                    if not skill_name:
-                        continue
-                    
-                    try:
-                        category = SkillCategory(category_str.lower())
-                    except ValueError:
-                        category = SoftSkillsExtractor._infer_soft_skill_category(skill_name)
-                    
-                    skill = Skill(
-                        name=skill_name,
-                        category=category,
-                        confidence=skill_data.get("confidence"),
-                        aliases=skill_data.get("aliases", [])
-                    )
-                    
-                    skills.append(skill)
-                    
-                except Exception:
-                    continue
+        Args:
+            extracted_skills: Validated structured-output skills
+            
+        Returns:
+            List of Skill objects
+        """
+        skills = []
+        
+        for extracted in extracted_skills:
+            skill_name = extracted.name.strip()
+            if not skill_name:
+                continue
+            
+            category = extracted.category
+            if category == SkillCategory.OTHER:
+                # Well-known soft skills still land in their category when the LLM gave up on one
+                category = SoftSkillsExtractor._infer_soft_skill_category(skill_name)
+            
+            skills.append(Skill(name=skill_name, category=category))
         
         return skills
     
     @staticmethod
-    def _parse_education(result: Dict[str, Any], source_type: str) -> List[Education]:
-        """Parse education from LLM response."""
-        education_list = []
-        
-        if isinstance(result, list):
-            edu_list = result
-        elif isinstance(result, dict) and "education" in result:
-            edu_list = result["education"]
-        elif isinstance(result, dict):
-            edu_list = result.get("education", [])
-        else:
-            return []
+    def _parse_education(extracted_education: List[ExtractedEducation], source_type: str) -> List[Education]:
+        """
+        Parse education from LLM response.
         
-        for edu_data in edu_list:
-            if isinstance(edu_data, dict):
-                try:
-                    # For resumes, education is typically not required/preferred
-                    # For job descriptions, check if required/preferred
-                    if source_type == "job_description":
-                        required = edu_data.get("required", False)
-                        preferred = edu_data.get("preferred", False)
-                    else:
-                        required = False
-                        preferred = False
-                    
-                    education = Education(
-                        degree=edu_data.get("degree"),
-                        field=edu_data.get("field"),
-                        required=required,
-                        preferred=preferred
-                    )
-                    
-                    education_list.append(education)
-                    
-                except Exception:
-                    continue
+        Args:
+            extracted_education: Validated structured-output education entries
+            source_type: Type of source ('resume' or 'job_description')
+            
+        Returns:
+            List of Education objects
+        """
+        # For resumes, education is typically not required/preferred
+        is_job_description = source_type == "job_description"
         
-        return education_list
+        return [
+            Education(
+                degree=extracted.degree,
+                field=extracted.field,
+                required=is_job_description and extracted.required,
+                preferred=is_job_description and extracted.preferred
+            )
+            for extracted in extracted_education
+        ]
     
     @staticmethod
-    def _parse_certifications(result: Dict[str, Any], source_type: str) -> List[Certification]:
-        """Parse certifications from LLM response."""
-        certifications = []
+    def _parse_certifications(
+        extracted_certifications: List[ExtractedCertification], source_type: str
+    ) -> List[Certification]:
+        """
+        Parse certifications from LLM response.
         
-        if isinstance(result, list):
-            cert_list = result
-        elif isinstance(result, dict) and "certifications" in result:
-            cert_list = result["certifications"]
-        elif isinstance(result, dict):
-            cert_list = result.get("certifications", [])
-        else:
-            return []
+        Args:
+            extracted_certifications: Validated structured-output certifications
+            source_type: Type of source ('resume' or 'job_description')
+            
+        Returns:
+            List of Certification objects
+        """
+        certifications = []
+        # For resumes, certifications are typically not required/preferred
+        is_job_description = source_type == "job_description"
         
-        for cert_data in cert_list:
-            if isinstance(cert_data, dict):
-                try:
-                    cert_name = cert_data.get("name", "").strip()
-                    
-                    if not cert_name:
-                        continue
-                    
-                    # For resumes, certifications are typically not required/preferred
-                    # For job descriptions, check if required/preferred
-                    if source_type == "job_description":
-                        required = cert_data.get("required", False)
-                        preferred = cert_data.get("preferred", False)
-                    else:
-                        required = False
-                        preferred = False
-                    
-                    certification = Certification(
-                        name=cert_name,
-                        issuer=cert_data.get("issuer"),
-                        required=required,
-                        preferred=preferred
-                    )
-                    
-                    certifications.append(certification)
-                    
-                except Exception:
-                    continue
+        for extracted in extracted_certifications:
+            cert_name = extracted.name.strip()
+            if not cert_name:
+                continue
+            
+            certifications.append(Certification(
+                name=cert_name,
+                issuer=extracted.issuer,
+                required=is_job_description and extracted.required,
+                preferred=is_job_description and extracted.preferred
+            ))
         
         return certifications
     
@@ -345,15 +498,12 @@ class SoftSkillsExtractor:
         
         for skill in skills:
             # Check if skill is in soft skill or methodology categories
-            if skill.category not in SoftSkillsExtractor.SOFT_SKILL_CATEGORIES + SoftSkillsExtractor.METHODOLOGY_CATEGORIES:
+            if skill.category not in SoftSkillsExtractor._ALLOWED_CATEGORIES:
                 continue
             
             normalized_name = skill.name.lower().strip()
             
-            if normalized_name in seen_names:
-                continue
-            
-            if len(skill.name.strip()) < 2:
+            if len(normalized_name) < 2 or normalized_name in seen_names:
                 continue
             
             seen_names.add(normalized_name)
@@ -364,46 +514,7 @@ class SoftSkillsExtractor:
     @staticmethod
     def _infer_soft_skill_category(skill_name: str) -> SkillCategory:
         """Infer soft skill category from skill name."""
-        skill_lower = skill_name.lower()
-        
-        # Leadership
-        if skill_lower in ["leadership", "team management", "mentoring", "strategic planning", 
-                          "managing", "supervision"]:
-            return SkillCategory.LEADERSHIP
-        
-        # Communication
-        if skill_lower in ["communication", "technical writing", "presentations", "public speaking",
-                          "written communication", "verbal communication"]:
-            return SkillCategory.COMMUNICATION
-        
-        # Collaboration
-        if skill_lower in ["collaboration", "teamwork", "pair programming", "code reviews",
-                          "cross-functional", "cooperation"]:
-            return SkillCategory.COLLABORATION
-        
-        # Problem solving
-        if skill_lower in ["problem solving", "debugging", "troubleshooting", "critical thinking",
-                          "analytical problem solving"]:
-            return SkillCategory.PROBLEM_SOLVING
-        
-        # Analytical thinking
-        if skill_lower in ["analytical thinking", "data analysis", "root cause analysis",
-                          "logical reasoning", "analysis"]:
-            return SkillCategory.ANALYTICAL_THINKING
-        
-        # Agile
-        if skill_lower in ["agile", "agile development", "agile methodologies"]:
-            return SkillCategory.AGILE
-        
-        # Scrum
-        if skill_lower in ["scrum", "scrum master", "sprint", "scrum practices"]:
-            return SkillCategory.SCRUM
-        
-        # CI/CD
-        if skill_lower in ["ci/cd", "continuous integration", "continuous deployment"]:
-            return SkillCategory.CI_CD
-        
-        return SkillCategory.OTHER
+        return _SOFT_SKILL_NAME_TO_CATEGORY.get(skill_name.lower(), SkillCategory.OTHER)
 
 
 # Global soft skills extractor instance
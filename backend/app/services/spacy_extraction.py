@@ -1,142 +1,261 @@
 """
 Alternative NLP-based skill extraction using spaCy as fallback.
 """
+import bisect
+import functools
 import re
-from typing import List, Dict, Set, Optional, Tuple
+from typing import List, Dict, FrozenSet, Set, Optional, Tuple
 import spacy
+from spacy.language import Language
 from spacy.matcher import Matcher
+from spacy.tokens import Doc
+try:
+    import ahocorasick
+except ImportError:
+    # Fallback to one word-boundary regex per skill if pyahocorasick not available
+    ahocorasick = None
+from app.config import settings
 from app.models.schemas import Skill, Education, Certification
-from app.models.skill_taxonomy import SkillCategory
+from app.models.skill_taxonomy import SkillCategory, KNOWN_SOFT_SKILLS
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex \\w class."""
+    return char.isalnum() or char == "_"
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    """Check whether a regex \\b holds at index, i.e. word-ness changes across it."""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+# (group name, pattern, degree type); the order is the order entries are reported in
+_DEGREE_PATTERNS = (
+    ("bachelor", r"\b(bachelor['s]?|b\.?s\.?|b\.?a\.?|b\.?sc\.?)\b", "Bachelor's"),
+    ("master", r"\b(master['s]?|m\.?s\.?|m\.?a\.?|m\.?sc\.?|mba)\b", "Master's"),
+    ("phd", r"\b(ph\.?d\.?|doctorate|doctoral)\b", "PhD"),
+    ("associate", r"\b(associate['s]?|a\.?a\.?|a\.?s\.?)\b", "Associate's"),
+)
+
+# (group name, pattern, field of study); earlier entries win when several fields are mentioned
+_FIELD_PATTERNS = (
+    ("cs", r"\b(computer\s+science|cs|software\s+engineering|se)\b", "Computer Science"),
+    ("it", r"\b(information\s+technology|it)\b", "Information Technology"),
+    ("ee", r"\b(electrical\s+engineering|ee)\b", "Electrical Engineering"),
+    ("ai", r"\b(artificial\s+intelligence|ai|machine\s+learning)\b", "Artificial Intelligence"),
+)
+
+# (group name, pattern, issuer)
+_CERT_PATTERNS = (
+    ("aws", r"\b(aws\s+certified\s+\w+)\b", "AWS"),
+    ("azure", r"\b(azure\s+\w+\s+certified)\b", "Microsoft"),
+    ("gcp", r"\b(google\s+cloud\s+professional)\b", "Google"),
+    ("pmp", r"\b(pmp|project\s+management\s+professional)\b", "PMI"),
+    ("cissp", r"\b(cissp|certified\s+information\s+systems\s+security)\b", "ISC2"),
+    ("cisco", r"\b(cisco\s+ccna|ccnp|ccie)\b", "Cisco"),
+)
+
+
+def _compile_alternation(patterns: Tuple[Tuple[str, str, str], ...]) -> re.Pattern:
+    """Combine patterns into one regex whose named groups tell which one matched."""
+    return re.compile("|".join(f"(?P<{group}>{pattern})" for group, pattern, _ in patterns))
+
+
+_DEGREE_RE = _compile_alternation(_DEGREE_PATTERNS)
+_FIELD_RE = _compile_alternation(_FIELD_PATTERNS)
+_CERT_RE = _compile_alternation(_CERT_PATTERNS)
+
+# Phrases near a job description mention that mark it required or preferred
+_REQUIRED_PHRASES = ("required", "must have")
+_PREFERRED_PHRASES = ("preferred", "nice to have")
+
+
+def _phrase_starts(text_lower: str) -> Dict[str, List[int]]:
+    """Find the sorted start offsets of every requirement phrase in one pass per phrase."""
+    starts = {}
+    for phrase in _REQUIRED_PHRASES + _PREFERRED_PHRASES:
+        offsets = []
+        index = text_lower.find(phrase)
+        while index != -1:
+            offsets.append(index)
+            index = text_lower.find(phrase, index + len(phrase))
+        starts[phrase] = offsets
+    return starts
+
+
+def _requirement_flags(
+    phrase_starts: Dict[str, List[int]], window_start: int, window_end: int
+) -> Tuple[bool, bool]:
+    """
+    Check for requirement phrases lying wholly inside text_lower[window_start:window_end].
+    
+    Args:
+        phrase_starts: Offsets from _phrase_starts
+        window_start: Start of the context window (inclusive)
+        window_end: End of the context window (exclusive)
+        
+    Returns:
+        Tuple of (required, preferred); required takes precedence
+    """
+    def mentioned(phrases: Tuple[str, ...]) -> bool:
+        for phrase in phrases:
+            offsets = phrase_starts[phrase]
+            i = bisect.bisect_left(offsets, window_start)
+            if i < len(offsets) and offsets[i] + len(phrase) <= window_end:
+                return True
+        return False
+    
+    if mentioned(_REQUIRED_PHRASES):
+        return True, False
+    return False, mentioned(_PREFERRED_PHRASES)
+
+
+# Keyword dictionary for the fallback extractor, built once at import and shared by every instance
+_SKILL_DICT: Dict[SkillCategory, FrozenSet[str]] = {
+    # Programming Languages
+    SkillCategory.PROGRAMMING_LANGUAGES: frozenset({
+        "python", "java", "javascript", "typescript", "c++", "c#", "cpp", "go", "golang",
+        "rust", "ruby", "php", "swift", "kotlin", "scala", "r", "matlab", "perl",
+        "haskell", "erlang", "clojure", "lua", "objective-c", "dart", "elixir"
+    }),
+    # Frameworks & Libraries
+    SkillCategory.FRAMEWORKS_LIBRARIES: frozenset({
+        "react", "django", "spring", "spring boot", "flask", "express", "angular",
+        "vue", "node.js", "nodejs", "tensorflow", "pytorch", "keras", "pandas",
+        "numpy", "scikit-learn", "scikit", "sklearn", "redux", "next.js", "nextjs",
+        "laravel", "symfony", "rails", "ruby on rails", "asp.net", "aspnet",
+        "jquery", "bootstrap", "tailwind", "tailwindcss"
+    }),
+    # Tools & Platforms
+    SkillCategory.TOOLS_PLATFORMS: frozenset({
+        "git", "jira", "confluence", "slack", "vs code", "vscode", "intellij",
+        "eclipse", "visual studio", "postman", "insomnia", "fiddler", "wireshark",
+        "figma", "sketch", "adobe xd", "trello", "asana", "monday", "notion"
+    }),
+    # Databases
+    SkillCategory.DATABASES: frozenset({
+        "postgresql", "postgres", "mysql", "mongodb", "mongo", "redis", "cassandra",
+        "oracle", "sqlite", "dynamodb", "elasticsearch", "solr", "couchdb",
+        "neo4j", "mariadb", "firebase", "supabase"
+    }),
+    # Cloud Services
+    SkillCategory.CLOUD_SERVICES: frozenset({
+        "aws", "amazon web services", "azure", "microsoft azure", "gcp", "google cloud",
+        "google cloud platform", "heroku", "vercel", "netlify", "digitalocean",
+        "cloudflare", "linode", "vultr"
+    }),
+    # DevOps
+    SkillCategory.DEVOPS: frozenset({
+        "kubernetes", "k8s", "docker", "terraform", "jenkins", "gitlab ci", "github actions",
+        "ansible", "puppet", "chef", "vagrant", "prometheus", "grafana", "splunk",
+        "elastic", "elk stack", "ci/cd", "continuous integration", "continuous deployment"
+    }),
+    # Software Architecture
+    SkillCategory.SOFTWARE_ARCHITECTURE: frozenset({
+        "microservices", "rest api", "rest", "graphql", "soap", "api design",
+        "design patterns", "system design", "distributed systems", "event-driven",
+        "service-oriented", "soa", "monolith", "serverless", "lambda"
+    }),
+    # Machine Learning
+    SkillCategory.MACHINE_LEARNING: frozenset({
+        "machine learning", "ml", "deep learning", "neural networks", "nlp",
+        "natural language processing", "computer vision", "reinforcement learning",
+        "supervised learning", "unsupervised learning", "neural net", "cnn", "rnn",
+        "lstm", "transformer", "bert", "gpt"
+    }),
+    # Blockchain
+    SkillCategory.BLOCKCHAIN: frozenset({
+        "blockchain", "solidity", "ethereum", "smart contracts", "web3", "defi",
+        "decentralized finance", "bitcoin", "cryptocurrency", "hyperledger",
+        "nft", "non-fungible token"
+    }),
+    # Cybersecurity
+    SkillCategory.CYBERSECURITY: frozenset({
+        "cybersecurity", "penetration testing", "pen testing", "security", "encryption",
+        "ssl", "tls", "oauth", "oauth2", "jwt", "authentication", "authorization",
+        "vulnerability assessment", "security auditing"
+    }),
+    # Data Science
+    SkillCategory.DATA_SCIENCE: frozenset({
+        "data science", "data analysis", "data analytics", "statistics", "etl",
+        "data visualization", "tableau", "power bi", "looker", "metabase",
+        "sql", "nosql", "data mining", "big data", "hadoop", "spark"
+    }),
+    # Soft skills and methodologies
+    **{category: frozenset(names) for category, names in KNOWN_SOFT_SKILLS.items()},
+}
+
+# Lowercased skill -> category; a skill listed under several categories keeps the first
+_SKILL_TO_CATEGORY: Dict[str, SkillCategory] = {}
+for _category, _skills in _SKILL_DICT.items():
+    for _skill in _skills:
+        _SKILL_TO_CATEGORY.setdefault(_skill.lower(), _category)
+
+if ahocorasick is not None:
+    # One automaton over all skills; a single scan of the text reports every occurrence
+    _SKILL_AUTOMATON = ahocorasick.Automaton()
+    for _skill in _SKILL_TO_CATEGORY:
+        _SKILL_AUTOMATON.add_word(_skill, _skill)
+    _SKILL_AUTOMATON.make_automaton()
+else:
+    _SKILL_PATTERNS: List[Tuple[str, re.Pattern]] = [
+        (skill, re.compile(r'\b' + re.escape(skill) + r'\b')) for skill in _SKILL_TO_CATEGORY
+    ]
+
+
+def _find_keywords(text_lower: str) -> Set[str]:
+    """
+    Find dictionary skills that occur in lowercased text between regex word boundaries.
+    
+    Args:
+        text_lower: Lowercased text to scan
+        
+    Returns:
+        Set of matched lowercased skill names
+    """
+    if ahocorasick is None:
+        return {skill for skill, pattern in _SKILL_PATTERNS if pattern.search(text_lower)}
+    
+    found: Set[str] = set()
+    for end, skill in _SKILL_AUTOMATON.iter(text_lower):
+        if skill in found:
+            continue
+        start = end - len(skill) + 1
+        if _is_boundary(text_lower, start) and _is_boundary(text_lower, end + 1):
+            found.add(skill)
+    return found
+
+
+@functools.lru_cache(maxsize=None)
+def _load_model() -> Optional[Language]:
+    """Load the spaCy model once per process; None when it is not installed."""
+    try:
+        # Try to load the model; the matcher needs tokens and POS tags only, so the
+        # dependency parser, NER and lemmatizer are left out of the pipeline
+        return spacy.load("en_core_web_sm", disable=["parser", "ner", "lemmatizer"])
+    except OSError:
+        # Model not found - will use keyword matching only
+        return None
 
 
 class SpacySkillExtractor:
     """spaCy-based skill extraction as fallback when LLM is unavailable."""
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize spaCy model and skill dictionaries."""
-        self.nlp = None
-        self.matcher = None
+        self.nlp: Optional[Language] = None
+        self.matcher: Optional[Matcher] = None
+        self.skill_dict = _SKILL_DICT
         self._initialize_model()
-        self._build_skill_dictionary()
         self._build_matcher_patterns()
     
-    def _initialize_model(self):
+    def _initialize_model(self) -> None:
         """Initialize spaCy model."""
-        try:
-            # Try to load the model
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            # Model not found - will use keyword matching only
-            self.nlp = None
-    
-    def _build_skill_dictionary(self):
-        """Build skill dictionary for keyword matching."""
-        self.skill_dict = {
-            # Programming Languages
-            SkillCategory.PROGRAMMING_LANGUAGES: {
-                "python", "java", "javascript", "typescript", "c++", "c#", "cpp", "go", "golang",
-                "rust", "ruby", "php", "swift", "kotlin", "scala", "r", "matlab", "perl",
-                "haskell", "erlang", "clojure", "lua", "objective-c", "dart", "elixir"
-            },
-            # Frameworks & Libraries
-            SkillCategory.FRAMEWORKS_LIBRARIES: {
-                "react", "django", "spring", "spring boot", "flask", "express", "angular",
-                "vue", "node.js", "nodejs", "tensorflow", "pytorch", "keras", "pandas",
-                "numpy", "scikit-learn", "scikit", "sklearn", "redux", "next.js", "nextjs",
-                "laravel", "symfony", "rails", "ruby on rails", "asp.net", "aspnet",
-                "jquery", "bootstrap", "tailwind", "tailwindcss"
-            },
-            # Tools & Platforms
-            SkillCategory.TOOLS_PLATFORMS: {
-                "git", "jira", "confluence", "slack", "vs code", "vscode", "intellij",
-                "eclipse", "visual studio", "postman", "insomnia", "fiddler", "wireshark",
-                "figma", "sketch", "adobe xd", "trello", "asana", "monday", "notion"
-            },
-            # Databases
-            SkillCategory.DATABASES: {
-                "postgresql", "postgres", "mysql", "mongodb", "mongo", "redis", "cassandra",
-                "oracle", "sqlite", "dynamodb", "elasticsearch", "solr", "couchdb",
-                "neo4j", "mariadb", "firebase", "supabase"
-            },
-            # Cloud Services
-            SkillCategory.CLOUD_SERVICES: {
-                "aws", "amazon web services", "azure", "microsoft azure", "gcp", "google cloud",
-                "google cloud platform", "heroku", "vercel", "netlify", "digitalocean",
-                "cloudflare", "linode", "vultr"
-            },
-            # DevOps
-            SkillCategory.DEVOPS: {
-                "kubernetes", "k8s", "docker", "terraform", "jenkins", "gitlab ci", "github actions",
-                "ansible", "puppet", "chef", "vagrant", "prometheus", "grafana", "splunk",
-                "elastic", "elk stack", "ci/cd", "continuous integration", "continuous deployment"
-            },
-            # Software Architecture
-            SkillCategory.SOFTWARE_ARCHITECTURE: {
-                "microservices", "rest api", "rest", "graphql", "soap", "api design",
-                "design patterns", "system design", "distributed systems", "event-driven",
-                "service-oriented", "soa", "monolith", "serverless", "lambda"
-            },
-            # Machine Learning
-            SkillCategory.MACHINE_LEARNING: {
-                "machine learning", "ml", "deep learning", "neural networks", "nlp",
-                "natural language processing", "computer vision", "reinforcement learning",
-                "supervised learning", "unsupervised learning", "neural net", "cnn", "rnn",
-                "lstm", "transformer", "bert", "gpt"
-            },
-            # Blockchain
-            SkillCategory.BLOCKCHAIN: {
-                "blockchain", "solidity", "ethereum", "smart contracts", "web3", "defi",
-                "decentralized finance", "bitcoin", "cryptocurrency", "hyperledger",
-                "nft", "non-fungible token"
-            },
-            # Cybersecurity
-            SkillCategory.CYBERSECURITY: {
-                "cybersecurity", "penetration testing", "pen testing", "security", "encryption",
-                "ssl", "tls", "oauth", "oauth2", "jwt", "authentication", "authorization",
-                "vulnerability assessment", "security auditing"
-            },
-            # Data Science
-            SkillCategory.DATA_SCIENCE: {
-                "data science", "data analysis", "data analytics", "statistics", "etl",
-                "data visualization", "tableau", "power bi", "looker", "metabase",
-                "sql", "nosql", "data mining", "big data", "hadoop", "spark"
-            },
-            # Soft Skills
-            SkillCategory.LEADERSHIP: {
-                "leadership", "team management", "mentoring", "strategic planning", "managing",
-                "supervision", "team leadership", "people management"
-            },
-            SkillCategory.COMMUNICATION: {
-                "communication", "technical writing", "presentations", "public speaking",
-                "written communication", "verbal communication", "documentation"
-            },
-            SkillCategory.COLLABORATION: {
-                "collaboration", "teamwork", "pair programming", "code reviews",
-                "cross-functional", "cooperation", "agile collaboration"
-            },
-            SkillCategory.PROBLEM_SOLVING: {
-                "problem solving", "debugging", "troubleshooting", "critical thinking",
-                "analytical problem solving", "troubleshoot"
-            },
-            SkillCategory.ANALYTICAL_THINKING: {
-                "analytical thinking", "data analysis", "root cause analysis",
-                "logical reasoning", "analysis", "analytical skills"
-            },
-            # Methodologies
-            SkillCategory.AGILE: {
-                "agile", "agile development", "agile methodologies", "agile practices"
-            },
-            SkillCategory.SCRUM: {
-                "scrum", "scrum master", "sprint", "scrum practices", "sprint planning",
-                "daily standup", "sprint retrospective"
-            },
-            SkillCategory.CI_CD: {
-                "ci/cd", "continuous integration", "continuous deployment", "continuous delivery",
-                "ci", "cd", "pipeline", "devops pipeline"
-            },
-        }
+        self.nlp = _load_model()
     
-    def _build_matcher_patterns(self):
+    def _build_matcher_patterns(self) -> None:
         """Build spaCy matcher patterns."""
         if not self.nlp:
             return
@@ -169,15 +288,60 @@ class SpacySkillExtractor:
         if not text:
             return []
         
-        text_lower = text.lower()
-        found_skills = {}
+        found_skills = self._keyword_skills(text.lower())
+        
+        # Use spaCy NER if available
+        if self.nlp and self.matcher:
+            self._add_matcher_skills(self.nlp(text), found_skills)
+        
+        return list(found_skills.values())
+    
+    def extract_skills_batch(self, texts: List[str], batch_size: int = 64) -> List[List[Skill]]:
+        """
+        Extract skills from many texts, running them through spaCy as one stream.
         
-        # Keyword matching against skill dictionary
+        nlp.pipe amortizes per-call pipeline overhead across the batch and can
+        spread it over settings.spacy_n_process worker processes.
+        
+        Args:
+            texts: Texts to extract skills from
+            batch_size: Number of texts spaCy buffers per batch
+            
+        Returns:
+            One list of Skill objects per text, in input order
+        """
+        results = [self._keyword_skills(text.lower()) if text else {} for text in texts]
+        
+        if self.nlp and self.matcher:
+            indexed = [(text, index) for index, text in enumerate(texts) if text]
+            docs = self.nlp.pipe(
+                indexed,
+                as_tuples=True,
+                batch_size=batch_size,
+                n_process=max(1, settings.spacy_n_process),
+            )
+            for doc, index in docs:
+                self._add_matcher_skills(doc, results[index])
+        
+        return [list(found_skills.values()) for found_skills in results]
+    
+    def _keyword_skills(self, text_lower: str) -> Dict[str, Skill]:
+        """
+        Match the skill dictionary against lowercased text.
+        
+        Args:
+            text_lower: Lowercased text to scan
+            
+        Returns:
+            Skills keyed by lowercased display name
+        """
+        found_skills: Dict[str, Skill] = {}
+        
+        # Keyword matching against skill dictionary, one pass over the text
+        keywords = _find_keywords(text_lower)
         for category, skill_set in self.skill_dict.items():
             for skill_name in skill_set:
-                # Use word boundaries for exact matching
-                pattern = r'\b' + re.escape(skill_name.lower()) + r'\b'
-                if re.search(pattern, text_lower):
+                if skill_name.lower() in keywords:
                     # Use the original skill name from dictionary or capitalize
                     display_name = skill_name.title() if skill_name.islower() else skill_name
                     found_skills[display_name.lower()] = Skill(
@@ -186,37 +350,35 @@ class SpacySkillExtractor:
                         confidence=0.8  # Lower confidence for keyword matching
                     )
         
-        # Use spaCy NER if available
-        if self.nlp and self.matcher:
-            doc = self.nlp(text)
-            
-            # Find skill mentions using matcher
-            matches = self.matcher(doc)
-            for match_id, start, end in matches:
-                span = doc[start:end]
-                # Extract potential skill names
-                potential_skill = span.text.strip()
-                if len(potential_skill) > 2:
-                    # Try to categorize
-                    category = self._categorize_skill(potential_skill)
-                    if category:
-                        found_skills[potential_skill.lower()] = Skill(
-                            name=potential_skill,
-                            category=category,
-                            confidence=0.7
-                        )
+        return found_skills
+    
+    def _add_matcher_skills(self, doc: Doc, found_skills: Dict[str, Skill]) -> None:
+        """
+        Add skills from the spaCy matcher's mentions in a processed doc.
         
-        return list(found_skills.values())
+        Args:
+            doc: spaCy Doc for the text
+            found_skills: Skills keyed by lowercased name, updated in place
+        """
+        # Find skill mentions using matcher
+        matches = self.matcher(doc)
+        for match_id, start, end in matches:
+            span = doc[start:end]
+            # Extract potential skill names
+            potential_skill = span.text.strip()
+            if len(potential_skill) > 2:
+                # Try to categorize
+                category = self._categorize_skill(potential_skill)
+                if category:
+                    found_skills[potential_skill.lower()] = Skill(
+                        name=potential_skill,
+                        category=category,
+                        confidence=0.7
+                    )
     
     def _categorize_skill(self, skill_name: str) -> Optional[SkillCategory]:
         """Categorize a skill name."""
-        skill_lower = skill_name.lower()
-        
-        for category, skill_set in self.skill_dict.items():
-            if skill_lower in skill_set:
-                return category
-        
-        return None
+        return _SKILL_TO_CATEGORY.get(skill_name.lower())
     
     def extract_education(self, text: str, source_type: str = "resume") -> List[Education]:
         """
@@ -229,53 +391,39 @@ class SpacySkillExtractor:
         Returns:
             List of Education objects
         """
-        education_list = []
+        education_list: List[Education] = []
         text_lower = text.lower()
         
-        # Patterns for degree types
-        degree_patterns = {
-            r"\b(bachelor['s]?|b\.?s\.?|b\.?a\.?|b\.?sc\.?)\b": "Bachelor's",
-            r"\b(master['s]?|m\.?s\.?|m\.?a\.?|m\.?sc\.?|mba)\b": "Master's",
-            r"\b(ph\.?d\.?|doctorate|doctoral)\b": "PhD",
-            r"\b(associate['s]?|a\.?a\.?|a\.?s\.?)\b": "Associate's",
-        }
+        # First mention of each degree type, from one scan of the text
+        degree_starts: Dict[str, int] = {}
+        for match in _DEGREE_RE.finditer(text_lower):
+            degree_starts.setdefault(match.lastgroup, match.start())
+        if not degree_starts:
+            return education_list
         
-        # Patterns for fields
-        field_patterns = {
-            r"\b(computer\s+science|cs|software\s+engineering|se)\b": "Computer Science",
-            r"\b(information\s+technology|it)\b": "Information Technology",
-            r"\b(electrical\s+engineering|ee)\b": "Electrical Engineering",
-            r"\b(artificial\s+intelligence|ai|machine\s+learning)\b": "Artificial Intelligence",
-        }
+        # Associated field: first field pattern, in table order, mentioned anywhere
+        found_fields = {match.lastgroup for match in _FIELD_RE.finditer(text_lower)}
+        field = next((name for group, _, name in _FIELD_PATTERNS if group in found_fields), None)
         
-        # Find degree mentions
-        for pattern, degree in degree_patterns.items():
-            if re.search(pattern, text_lower):
-                # Try to find associated field
-                field = None
-                for field_pattern, field_name in field_patterns.items():
-                    if re.search(field_pattern, text_lower):
-                        field = field_name
-                        break
-                
-                # Determine if required/preferred
-                required = False
-                preferred = False
-                if source_type == "job_description":
-                    # Check context around degree mention
-                    context = text_lower[max(0, text_lower.find(pattern) - 50):
-                                         min(len(text_lower), text_lower.find(pattern) + 100)]
-                    if "required" in context or "must have" in context:
-                        required = True
-                    elif "preferred" in context or "nice to have" in context:
-                        preferred = True
-                
-                education_list.append(Education(
-                    degree=degree,
-                    field=field,
-                    required=required,
-                    preferred=preferred
-                ))
+        phrase_starts = _phrase_starts(text_lower) if source_type == "job_description" else None
+        for group, _, degree in _DEGREE_PATTERNS:
+            if group not in degree_starts:
+                continue
+            
+            # Determine if required/preferred
+            required = False
+            preferred = False
+            if phrase_starts is not None:
+                # Check context around the degree mention
+                start = degree_starts[group]
+                required, preferred = _requirement_flags(phrase_starts, max(0, start - 50), start + 100)
+            
+            education_list.append(Education(
+                degree=degree,
+                field=field,
+                required=required,
+                preferred=preferred
+            ))
         
         return education_list
     
@@ -290,34 +438,26 @@ class SpacySkillExtractor:
         Returns:
             List of Certification objects
         """
-        certifications = []
         text_lower = text.lower()
         
-        # Common certification patterns
-        cert_patterns = {
-            r"\b(aws\s+certified\s+\w+)\b": ("AWS", r"aws"),
-            r"\b(azure\s+\w+\s+certified)\b": ("Microsoft", r"azure"),
-            r"\b(google\s+cloud\s+professional)\b": ("Google", r"gcp"),
-            r"\b(pmp|project\s+management\s+professional)\b": ("PMI", r"pmp"),
-            r"\b(cissp|certified\s+information\s+systems\s+security)\b": ("ISC2", r"cissp"),
-            r"\b(cisco\s+ccna|ccnp|ccie)\b": ("Cisco", r"cisco"),
-        }
+        # One scan of the text; results keep the pattern table order
+        matches_by_group: Dict[str, List[re.Match]] = {}
+        for match in _CERT_RE.finditer(text_lower):
+            matches_by_group.setdefault(match.lastgroup, []).append(match)
         
-        for cert_pattern, (issuer, issuer_pattern) in cert_patterns.items():
-            matches = re.finditer(cert_pattern, text_lower)
-            for match in matches:
+        certifications: List[Certification] = []
+        phrase_starts = _phrase_starts(text_lower) if source_type == "job_description" and matches_by_group else None
+        for group, _, issuer in _CERT_PATTERNS:
+            for match in matches_by_group.get(group, ()):
                 cert_name = match.group(0).title()
                 
                 # Determine if required/preferred
                 required = False
                 preferred = False
-                if source_type == "job_description":
-                    context = text_lower[max(0, match.start() - 50):
-                                         min(len(text_lower), match.end() + 100)]
-                    if "required" in context or "must have" in context:
-                        required = True
-                    elif "preferred" in context or "nice to have" in context:
-                        preferred = True
+                if phrase_starts is not None:
+                    required, preferred = _requirement_flags(
+                        phrase_starts, max(0, match.start() - 50), match.end() + 100
+                    )
                 
                 certifications.append(Certification(
                     name=cert_name,
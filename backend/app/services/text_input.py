@@ -4,7 +4,7 @@ Text input handler service for plain text resume and job description input.
 from typing import Tuple, Optional
 from app.utils.file_storage import file_storage
 from app.utils.file_validation import generate_file_id
-from app.utils.text_cleaning import clean_text, normalize_whitespace
+from app.utils.text_cleaning import clean_text
 
 
 class TextInputService:
@@ -63,9 +63,9 @@ class TextInputService:
         if not is_valid:
             return None, error_message
         
-        # Clean and normalize text
-        cleaned_text = normalize_whitespace(text)
-        cleaned_text = clean_text(cleaned_text)
+        # Clean and normalize text; clean_text collapses every whitespace run,
+        # so a separate normalize_whitespace pass would change nothing
+        cleaned_text = clean_text(text)
         
         # Generate text ID
         text_id = generate_file_id()
@@ -74,16 +74,16 @@ class TextInputService:
         if not filename:
             filename = f"{source_type}_{text_id[:8]}.txt"
         
-        # Convert text to bytes for storage
-        text_bytes = cleaned_text.encode('utf-8')
-        file_size = len(text_bytes)
+        # Size as the UTF-8 text file it stands in for
+        file_size = len(cleaned_text.encode('utf-8'))
         
-        # Store in file storage (treating as a text file)
+        # Store in file storage (treating as a text file). The text is stored
+        # already parsed, so the raw bytes would only duplicate it in memory
         file_data = file_storage.store_file(
             file_id=text_id,
             filename=filename,
             file_type="txt",
-            content=text_bytes,
+            content=b"",
             file_size=file_size,
             source_type=source_type
         )
@@ -109,7 +109,7 @@ class TextInputService:
         if not file_data:
             return None, "Text not found or session expired"
         
-        text = file_data.get("parsed_text")
+        text = file_data.parsed_text
         
         if not text:
             return None, "Text not available"
@@ -3,27 +3,23 @@ Unified skill extraction service that combines all extraction modules.
 """
 import time
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from typing import Tuple, Optional
+from typing import Iterable, List, Tuple, Optional
 from app.models.schemas import SkillExtractionResult
 from app.services.skill_extraction import technical_skills_extractor
 from app.services.soft_skills_extraction import soft_skills_extractor
 from app.utils.file_storage import file_storage
 from app.services.file_parser import file_parser_service
 
-# Thread pool for running synchronous extraction functions in parallel
-extraction_executor = ThreadPoolExecutor(max_workers=5)
-
 
 class UnifiedSkillExtractor:
     """Unified service for extracting all skills, education, and certifications."""
     
     @staticmethod
-    def extract_from_text(text: str, source_type: str = "resume") -> Tuple[SkillExtractionResult, Optional[str]]:
+    async def extract_from_text(text: str, source_type: str = "resume") -> Tuple[SkillExtractionResult, Optional[str]]:
         """
         Extract all skills, education, and certifications from text.
         
-        Runs all sub-extractions in parallel for better performance.
+        Runs all sub-extractions in parallel on the caller's event loop.
         
         Args:
             text: Text to extract from
@@ -43,17 +39,7 @@ class UnifiedSkillExtractor:
             if not llm_service.is_configured():
                 return None, "LLM service is not configured. Please set OPENAI_API_KEY in your .env file. Skill extraction requires OpenAI API access."
             
-            # Run all extractions in parallel using asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(
-                    UnifiedSkillExtractor._extract_parallel(text, source_type)
-                )
-                return result
-            finally:
-                loop.close()
+            return await UnifiedSkillExtractor._extract_parallel(text, source_type)
             
         except Exception as e:
             extraction_time = time.time() - start_time
@@ -70,86 +56,37 @@ class UnifiedSkillExtractor:
         
         async def extract_technical():
             """Extract technical skills."""
-            loop = asyncio.get_event_loop()
-            result, error = await loop.run_in_executor(
-                extraction_executor,
-                technical_skills_extractor.extract_skills,
-                text,
-                source_type
-            )
+            result, error = await technical_skills_extractor.extract_skills_async(text, source_type)
             if error and "not configured" in error:
                 return None, error
             print(f"[Extraction] Extracted {len(result)} technical skills")
             return result, error
         
-        async def extract_soft():
-            """Extract soft skills."""
-            loop = asyncio.get_event_loop()
-            result, error = await loop.run_in_executor(
-                extraction_executor,
-                soft_skills_extractor.extract_soft_skills,
-                text,
-                source_type
-            )
+        async def extract_soft_education_certifications():
+            """Extract soft skills, education, and certifications in one LLM call."""
+            soft, education, certifications, error = await soft_skills_extractor.extract_all_async(text, source_type)
             if error and "not configured" in error:
                 return None, error
-            print(f"[Extraction] Extracted {len(result)} soft skills")
-            return result, error
+            print(f"[Extraction] Extracted {len(soft)} soft skills, {len(education)} education entries, {len(certifications)} certifications")
+            return (soft, education, certifications), error
         
         async def extract_methodologies():
             """Extract methodologies."""
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                extraction_executor,
-                soft_skills_extractor.extract_methodologies,
-                text
-            )
+            result = await soft_skills_extractor.extract_methodologies_async(text)
             print(f"[Extraction] Extracted {len(result)} methodologies")
             return result
         
-        async def extract_education():
-            """Extract education."""
-            loop = asyncio.get_event_loop()
-            result, error = await loop.run_in_executor(
-                extraction_executor,
-                soft_skills_extractor.extract_education,
-                text,
-                source_type
-            )
-            if error and "not configured" in error:
-                return None, error
-            print(f"[Extraction] Extracted {len(result)} education entries")
-            return result, error
-        
-        async def extract_certifications():
-            """Extract certifications."""
-            loop = asyncio.get_event_loop()
-            result, error = await loop.run_in_executor(
-                extraction_executor,
-                soft_skills_extractor.extract_certifications,
-                text,
-                source_type
-            )
-            if error and "not configured" in error:
-                return None, error
-            print(f"[Extraction] Extracted {len(result)} certifications")
-            return result, error
-        
-        # Run all extractions in parallel
+        # Run all extractions concurrently; each awaits its LLM calls on this loop
         print(f"[Extraction] Starting parallel extraction for {source_type}...")
         technical_task = extract_technical()
-        soft_task = extract_soft()
+        combined_task = extract_soft_education_certifications()
         methodologies_task = extract_methodologies()
-        education_task = extract_education()
-        certifications_task = extract_certifications()
         
         # Wait for all tasks to complete
         results = await asyncio.gather(
             technical_task,
-            soft_task,
+            combined_task,
             methodologies_task,
-            education_task,
-            certifications_task,
             return_exceptions=True
         )
         
@@ -160,11 +97,12 @@ class UnifiedSkillExtractor:
         else:
             technical_skills, tech_error = results[0] if isinstance(results[0], tuple) else ([], None)
         
-        # Soft skills
+        # Soft skills, education, and certifications
         if isinstance(results[1], Exception):
-            soft_skills, soft_error = [], str(results[1])
+            combined, combined_error = None, str(results[1])
         else:
-            soft_skills, soft_error = results[1] if isinstance(results[1], tuple) else ([], None)
+            combined, combined_error = results[1] if isinstance(results[1], tuple) else (None, None)
+        soft_skills, education, certifications = combined or ([], [], [])
         
         # Methodologies (returns only a list, not a tuple)
         if isinstance(results[2], Exception):
@@ -172,27 +110,11 @@ class UnifiedSkillExtractor:
         else:
             methodologies = results[2] if isinstance(results[2], list) else []
         
-        # Education
-        if isinstance(results[3], Exception):
-            education, edu_error = [], str(results[3])
-        else:
-            education, edu_error = results[3] if isinstance(results[3], tuple) else ([], None)
-        
-        # Certifications
-        if isinstance(results[4], Exception):
-            certifications, cert_error = [], str(results[4])
-        else:
-            certifications, cert_error = results[4] if isinstance(results[4], tuple) else ([], None)
-        
         # Check for critical errors
         if tech_error and "not configured" in tech_error:
             return None, tech_error
-        if soft_error and "not configured" in soft_error:
-            return None, soft_error
-        if edu_error and "not configured" in edu_error:
-            return None, edu_error
-        if cert_error and "not configured" in cert_error:
-            return None, cert_error
+        if combined_error and "not configured" in combined_error:
+            return None, combined_error
         
         # Combine all skills
         all_skills = (technical_skills or []) + (soft_skills or []) + (methodologies or [])
@@ -222,7 +144,7 @@ class UnifiedSkillExtractor:
         return result, None
     
     @staticmethod
-    def extract_from_file_id(file_id: str) -> Tuple[SkillExtractionResult, Optional[str]]:
+    async def extract_from_file_id(file_id: str) -> Tuple[SkillExtractionResult, Optional[str]]:
         """
         Extract skills from a stored file.
         
@@ -239,27 +161,59 @@ class UnifiedSkillExtractor:
             return None, "File not found or session expired"
         
         # Get parsed text
-        parsed_text = file_data.get("parsed_text")
+        parsed_text = file_data.parsed_text
         
         if not parsed_text:
-            # Try to parse the file first
-            success, parse_error = file_parser_service.parse_file(file_id)
+            # Try to parse the file first, off the event loop
+            loop = asyncio.get_running_loop()
+            success, parse_error = await loop.run_in_executor(
+                None,
+                file_parser_service.parse_file,
+                file_id
+            )
             
             if not success:
                 return None, parse_error or "Failed to parse file"
             
             # Get updated file data
             file_data = file_storage.get_file(file_id)
-            parsed_text = file_data.get("parsed_text")
+            parsed_text = file_data.parsed_text
             
             if not parsed_text:
                 return None, "Could not extract text from file"
         
         # Extract source type
-        source_type = file_data.get("source_type", "resume")
+        source_type = file_data.source_type
         
         # Extract skills from text
-        return UnifiedSkillExtractor.extract_from_text(parsed_text, source_type)
+        return await UnifiedSkillExtractor.extract_from_text(parsed_text, source_type)
+    
+    @staticmethod
+    async def extract_from_file_ids(
+        file_ids: Iterable[str], concurrency: int = 10
+    ) -> List[Tuple[SkillExtractionResult, Optional[str]]]:
+        """
+        Extract skills from several stored files concurrently.
+        
+        A file that fails gets (None, error_message) without affecting the others.
+        
+        Args:
+            file_ids: File identifiers
+            concurrency: Maximum number of files extracted at once
+            
+        Returns:
+            List of (SkillExtractionResult, error_message) tuples, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def extract_one(file_id: str) -> Tuple[SkillExtractionResult, Optional[str]]:
+            async with semaphore:
+                try:
+                    return await UnifiedSkillExtractor.extract_from_file_id(file_id)
+                except Exception as e:
+                    return None, f"Error extracting file {file_id}: {str(e)}"
+        
+        return await asyncio.gather(*(extract_one(file_id) for file_id in file_ids))
 
 
 # Global unified extractor instance
@@ -1,19 +1,43 @@
 """
 In-memory file storage for session-based file handling.
 """
-from typing import Dict, Optional, Union
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+import hashlib
+import heapq
+import time
 import uuid
 from datetime import datetime, timedelta
 from app.models.schemas import ResumeData, JobDescription
 
 
+@dataclass(slots=True)
+class FileRecord:
+    """A stored file and what has been derived from it."""
+    file_id: str
+    filename: str
+    file_type: str  # pdf, docx or txt
+    content: bytes
+    file_size: int
+    source_type: str  # resume or job_description
+    uploaded_at: datetime
+    expires_at: float  # time.monotonic() deadline for the session
+    parsed_text: Optional[str] = None  # Populated after parsing
+    parsed_data: Optional[Union[ResumeData, JobDescription]] = None  # Populated after extraction
+
+
 class FileStorage:
     """In-memory file storage for session-based processing."""
     
     def __init__(self):
         """Initialize file storage."""
-        self._files: Dict[str, dict] = {}
+        self._files: Dict[str, FileRecord] = {}
         self._session_timeout = timedelta(hours=1)  # 1 hour session timeout
+        # (expires_at, file_id) min-heap, so cleanup only visits expired entries
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # Content digest -> a stored file with that content, so re-uploads share one bytes object
+        self._content_index: Dict[bytes, str] = {}
+        self._content_digests: Dict[str, bytes] = {}
     
     def store_file(
         self,
@@ -23,10 +47,13 @@ class FileStorage:
         content: bytes,
         file_size: int,
         source_type: str = "resume"
-    ) -> dict:
+    ) -> FileRecord:
         """
         Store file in memory.
         
+        Content identical to a file already stored reuses that file's bytes,
+        and its parsed text when the file type matches.
+        
         Args:
             file_id: Unique file identifier
             filename: Original filename
@@ -36,30 +63,48 @@ class FileStorage:
             source_type: Type of file (resume or job_description)
             
         Returns:
-            File metadata dictionary
+            Stored FileRecord
         """
-        file_data = {
-            "file_id": file_id,
-            "filename": filename,
-            "file_type": file_type,
-            "content": content,
-            "file_size": file_size,
-            "source_type": source_type,
-            "uploaded_at": datetime.now(),
-            "parsed_text": None,  # Will be populated after parsing
-            "parsed_data": None,  # Will be populated after extraction
-        }
+        parsed_text = None
+        digest = None
+        if content:
+            digest = hashlib.blake2b(content, digest_size=16).digest()
+            duplicate = self._files.get(self._content_index.get(digest))
+            if duplicate is not None:
+                content = duplicate.content
+                if duplicate.file_type == file_type:
+                    parsed_text = duplicate.parsed_text
+        
+        # Replacing an ID must not leave its old digest indexed
+        self._remove(file_id)
+        
+        file_data = FileRecord(
+            file_id=file_id,
+            filename=filename,
+            file_type=file_type,
+            content=content,
+            file_size=file_size,
+            source_type=source_type,
+            uploaded_at=datetime.now(),
+            expires_at=time.monotonic() + self._session_timeout.total_seconds(),
+            parsed_text=parsed_text,
+        )
         
         self._files[file_id] = file_data
+        if digest is not None:
+            # The first file stored with this content stays the one duplicates copy from
+            self._content_index.setdefault(digest, file_id)
+            self._content_digests[file_id] = digest
+        heapq.heappush(self._expiry_heap, (file_data.expires_at, file_id))
         return file_data
     
-    def get_file(self, file_id: str) -> Optional[dict]:
+    def get_file(self, file_id: str) -> Optional[FileRecord]:
         """Get file by ID."""
         if file_id in self._files:
             file_data = self._files[file_id]
             # Check if session expired
-            if datetime.now() - file_data["uploaded_at"] > self._session_timeout:
-                del self._files[file_id]
+            if time.monotonic() > file_data.expires_at:
+                self._remove(file_id)
                 return None
             return file_data
         return None
@@ -67,36 +112,45 @@ class FileStorage:
     def update_file_text(self, file_id: str, parsed_text: str) -> bool:
         """Update parsed text for a file."""
         if file_id in self._files:
-            self._files[file_id]["parsed_text"] = parsed_text
+            self._files[file_id].parsed_text = parsed_text
             return True
         return False
     
     def update_file_data(self, file_id: str, parsed_data: Union[ResumeData, JobDescription]) -> bool:
         """Update parsed data for a file."""
         if file_id in self._files:
-            self._files[file_id]["parsed_data"] = parsed_data
+            self._files[file_id].parsed_data = parsed_data
             return True
         return False
     
     def delete_file(self, file_id: str) -> bool:
         """Delete file from storage."""
-        if file_id in self._files:
-            del self._files[file_id]
-            return True
-        return False
+        return self._remove(file_id)
+    
+    def _remove(self, file_id: str) -> bool:
+        """Drop a file and its content index entry."""
+        if self._files.pop(file_id, None) is None:
+            return False
+        digest = self._content_digests.pop(file_id, None)
+        if digest is not None and self._content_index.get(digest) == file_id:
+            del self._content_index[digest]
+        return True
     
     def cleanup_expired(self) -> int:
         """Clean up expired files. Returns number of files cleaned."""
-        now = datetime.now()
-        expired_ids = [
-            file_id for file_id, file_data in self._files.items()
-            if now - file_data["uploaded_at"] > self._session_timeout
-        ]
+        now = time.monotonic()
+        cleaned = 0
         
-        for file_id in expired_ids:
-            del self._files[file_id]
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            _, file_id = heapq.heappop(self._expiry_heap)
+            file_data = self._files.get(file_id)
+            # Skip entries already deleted, or re-stored under the same ID since
+            if file_data is None or now <= file_data.expires_at:
+                continue
+            self._remove(file_id)
+            cleaned += 1
         
-        return len(expired_ids)
+        return cleaned
     
     def get_file_count(self) -> int:
         """Get total number of stored files."""
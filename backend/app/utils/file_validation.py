@@ -8,6 +8,12 @@ from fastapi import UploadFile, HTTPException
 from app.config import settings
 
 
+# Allowed file types (lowercased, without the dot), parsed once from settings
+_ALLOWED_FILE_TYPES = frozenset(
+    ext.strip().lower().lstrip('.') for ext in settings.allowed_extensions_list if ext.strip()
+)
+
+
 def validate_file_extension(filename: str) -> Tuple[bool, Optional[str]]:
     """
     Validate file extension against allowed extensions.
@@ -21,13 +27,9 @@ def validate_file_extension(filename: str) -> Tuple[bool, Optional[str]]:
     if not filename:
         return False, None
     
-    filename_lower = filename.lower()
-    allowed_extensions = settings.allowed_extensions_list
-    
-    for ext in allowed_extensions:
-        if filename_lower.endswith(ext.lower()):
-            file_type = ext.lstrip('.')
-            return True, file_type
+    file_type = get_file_extension(filename)
+    if file_type in _ALLOWED_FILE_TYPES:
+        return True, file_type
     
     return False, None
 
@@ -77,14 +79,18 @@ async def validate_upload_file(file: UploadFile) -> Tuple[bool, Optional[str], O
         allowed = ", ".join(settings.allowed_extensions_list)
         return False, None, f"File type not allowed. Allowed types: {allowed}"
     
-    # Read file content to get size
+    # Get file size
     try:
-        # Read file content
-        content = await file.read()
-        file_size = len(content)
-        
-        # Reset file pointer for later use
-        await file.seek(0)
+        # Starlette counts the bytes as it spools the upload, so there is no need to read it
+        file_size = file.size
+        if file_size is None:
+            # Fallback to counting in chunks if the size was not recorded
+            file_size = 0
+            while chunk := await file.read(64 * 1024):
+                file_size += len(chunk)
+            
+            # Reset file pointer for later use
+            await file.seek(0)
         
         # Validate file size
         is_valid_size, error_msg = validate_file_size(file_size)
@@ -99,7 +105,7 @@ async def validate_upload_file(file: UploadFile) -> Tuple[bool, Optional[str], O
 
 def generate_file_id() -> str:
     """Generate a unique file ID."""
-    return str(uuid.uuid4())
+    return uuid.uuid4().hex
 
 
 def get_file_extension(filename: str) -> str:
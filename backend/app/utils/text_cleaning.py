@@ -5,6 +5,70 @@ import re
 from typing import Optional
 
 
+# Encoding fixes applied by remove_encoding_issues, as a single str.translate table
+_ENCODING_TRANSLATION = str.maketrans({
+    '\u2018': "'",  # Left single quotation mark
+    '\u2019': "'",  # Right single quotation mark
+    '\u201C': '"',  # Left double quotation mark
+    '\u201D': '"',  # Right double quotation mark
+    '\u2013': '-',  # En dash
+    '\u2014': '--',  # Em dash
+    '\u2026': '...',  # Horizontal ellipsis
+    '\u00A0': ' ',  # Non-breaking space
+})
+
+_SPACE_RUN = re.compile(r' +')
+_EXCESS_NEWLINES = re.compile(r'\n{3,}')
+_DISALLOWED_CHARS = re.compile(r'[^\w\s\.\,\;\:\!\?\-\(\)\[\]\{\}\'\"\/\\\@\#\$\%\&\*\=\+\<\>]')
+# ASCII characters _DISALLOWED_CHARS removes, derived from the pattern so the two cannot drift
+_ASCII_DISALLOWED = bytes(c for c in range(128) if _DISALLOWED_CHARS.match(chr(c)))
+
+# Common section headers used by extract_sections, as one alternation with a named
+# group per section so a single scan finds every boundary
+_SECTION_HEADERS = re.compile(
+    r'(?:'
+    r'(?P<summary>summary|objective|profile|about)'
+    r'|(?P<experience>experience|work\s+experience|employment|professional\s+experience)'
+    r'|(?P<education>education|academic|qualifications)'
+    r'|(?P<skills>skills|technical\s+skills|competencies)'
+    r'|(?P<certifications>certifications|certificates|credentials)'
+    r')\s*:?\s*\n',
+    re.IGNORECASE
+)
+
+
+def _remove_disallowed_chars(text: str) -> str:
+    """Strip the characters matched by _DISALLOWED_CHARS."""
+    if text.isascii():
+        # Pure ASCII (the usual case) can delete bytes in C instead of running the regex
+        return text.encode('ascii').translate(None, _ASCII_DISALLOWED).decode('ascii')
+    return _DISALLOWED_CHARS.sub('', text)
+
+
+def clean_extracted_text(text: str) -> str:
+    """
+    Fix encoding issues, normalize whitespace and clean text in one pass.
+    
+    Produces the same result as remove_encoding_issues, normalize_whitespace
+    and clean_text applied in that order: clean_text collapses every whitespace
+    run to a single space, which subsumes the line-break normalization.
+    
+    Args:
+        text: Raw extracted text
+        
+    Returns:
+        Cleaned text
+    """
+    if not text:
+        return ""
+    
+    text = text.translate(_ENCODING_TRANSLATION)
+    text = ' '.join(text.split())
+    text = _remove_disallowed_chars(text)
+    
+    return text.strip()
+
+
 def clean_text(text: str) -> str:
     """
     Clean and normalize extracted text.
@@ -18,15 +82,15 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # Normalize whitespace - replace multiple spaces/tabs/newlines with single space
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove excessive line breaks
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    # Normalize whitespace - replace multiple spaces/tabs/newlines with single space.
+    # This leaves no newlines behind, so there are no excessive line breaks to remove.
+    # str.split() treats the same characters as whitespace as the regex \s class,
+    # and split/join runs in C without the regex engine
+    text = ' '.join(text.split())
     
     # Remove special characters that might interfere (keep alphanumeric, punctuation, and common symbols)
     # Keep: letters, numbers, spaces, and common punctuation
-    text = re.sub(r'[^\w\s\.\,\;\:\!\?\-\(\)\[\]\{\}\'\"\/\\\@\#\$\%\&\*\=\+\<\>]', '', text)
+    text = _remove_disallowed_chars(text)
     
     # Remove leading/trailing whitespace
     text = text.strip()
@@ -48,14 +112,13 @@ def normalize_whitespace(text: str) -> str:
         return ""
     
     # Replace multiple spaces with single space
-    text = re.sub(r' +', ' ', text)
+    text = _SPACE_RUN.sub(' ', text)
     
-    # Normalize line breaks
-    text = re.sub(r'\r\n', '\n', text)
-    text = re.sub(r'\r', '\n', text)
+    # Normalize line breaks (literal replacements need no regex)
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
     
     # Remove excessive line breaks
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _EXCESS_NEWLINES.sub('\n\n', text)
     
     return text.strip()
 
@@ -79,23 +142,10 @@ def extract_sections(text: str) -> dict:
         "other": ""
     }
     
-    # Common section headers
-    section_patterns = {
-        "summary": r'(?:summary|objective|profile|about)\s*:?\s*\n',
-        "experience": r'(?:experience|work\s+experience|employment|professional\s+experience)\s*:?\s*\n',
-        "education": r'(?:education|academic|qualifications)\s*:?\s*\n',
-        "skills": r'(?:skills|technical\s+skills|competencies)\s*:?\s*\n',
-        "certifications": r'(?:certifications|certificates|credentials)\s*:?\s*\n',
-    }
-    
-    text_lower = text.lower()
-    
-    # Find section boundaries
+    # Find section boundaries; only the first header of each kind matters
     section_starts = {}
-    for section, pattern in section_patterns.items():
-        matches = list(re.finditer(pattern, text_lower, re.IGNORECASE | re.MULTILINE))
-        if matches:
-            section_starts[section] = matches[0].start()
+    for match in _SECTION_HEADERS.finditer(text):
+        section_starts.setdefault(match.lastgroup, match.start())
     
     # Sort sections by position
     sorted_sections = sorted(section_starts.items(), key=lambda x: x[1])
@@ -125,20 +175,9 @@ def remove_encoding_issues(text: str) -> str:
     if not text:
         return ""
     
-    # Replace common encoding errors
-    replacements = {
-        '\u2018': "'",  # Left single quotation mark
-        '\u2019': "'",  # Right single quotation mark
-        '\u201C': '"',  # Left double quotation mark
-        '\u201D': '"',  # Right double quotation mark
-        '\u2013': '-',  # En dash
-        '\u2014': '--',  # Em dash
-        '\u2026': '...',  # Horizontal ellipsis
-        '\u00A0': ' ',  # Non-breaking space
-    }
-    
-    for old, new in replacements.items():
-        text = text.replace(old, new)
+    # Replace common encoding errors in one pass; str.translate handles the
+    # multi-character replacements (em dash, ellipsis) as well
+    text = text.translate(_ENCODING_TRANSLATION)
     
     return text
 
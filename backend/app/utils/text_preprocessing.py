@@ -6,7 +6,44 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+# Patterns used on every call, compiled once
+_SPECIAL_KEEP_PUNCT = re.compile(r'[^\w\s\.\,\;\:\!\?\-\(\)\[\]\{\}\'\"\/\\\@\#\$\%\&\*\=\+\<\>]')
+_SPECIAL_ALL = re.compile(r'[^\w\s]')
+# ASCII characters each pattern removes, derived from the patterns so they cannot drift
+_ASCII_SPECIAL_KEEP_PUNCT = bytes(c for c in range(128) if _SPECIAL_KEEP_PUNCT.match(chr(c)))
+_ASCII_SPECIAL_ALL = bytes(c for c in range(128) if _SPECIAL_ALL.match(chr(c)))
+_MULTI_SPACE = re.compile(r' {2,}')
+_CRLF = re.compile(r'\r\n?')
+_MULTI_NL = re.compile(r'\n{3,}')
+_SENTENCE_SPLIT = re.compile(r'[.!?]+\s+')
+_NON_SPACE = re.compile(r'\S')
+
+# Common Unicode replacements applied by fix_encoding, as a single str.translate table
+_ENCODING_TRANSLATION = str.maketrans({
+    '\u2018': "'",  # Left single quotation mark
+    '\u2019': "'",  # Right single quotation mark
+    '\u201C': '"',  # Left double quotation mark
+    '\u201D': '"',  # Right double quotation mark
+    '\u2013': '-',  # En dash
+    '\u2014': '--',  # Em dash
+    '\u2026': '...',  # Horizontal ellipsis
+    '\u00A0': ' ',  # Non-breaking space
+    '\u200B': None,  # Zero-width space
+    '\u200C': None,  # Zero-width non-joiner
+    '\u200D': None,  # Zero-width joiner
+    '\uFEFF': None,  # Zero-width no-break space
+})
+
+
+def _remove_chars(text: str, pattern: re.Pattern, ascii_chars: bytes) -> str:
+    """Strip the characters matched by pattern, given the ASCII ones it matches."""
+    if text.isascii():
+        # Pure ASCII (the usual case) can delete bytes in C instead of running the regex
+        return text.encode('ascii').translate(None, ascii_chars).decode('ascii')
+    return pattern.sub('', text)
+
+
+@dataclass(slots=True)
 class PreprocessedText:
     """Container for preprocessed text data."""
     cleaned_text: str
@@ -54,6 +91,18 @@ class TextPreprocessor:
         ],
     }
     
+    # Every section header as one alternation with a named group per section,
+    # so a single scan finds all headers in order
+    _SECTION_UNION = re.compile(
+        r'(?:^|\n)\s*(?:'
+        + '|'.join(
+            f"(?P<{section_name}>{'|'.join(patterns)})"
+            for section_name, patterns in SECTION_PATTERNS.items()
+        )
+        + r')\s*:?\s*\n',
+        re.IGNORECASE | re.MULTILINE
+    )
+    
     @staticmethod
     def remove_special_characters(text: str, keep_punctuation: bool = True) -> str:
         """
@@ -71,10 +120,10 @@ class TextPreprocessor:
         
         if keep_punctuation:
             # Keep alphanumeric, spaces, and common punctuation
-            text = re.sub(r'[^\w\s\.\,\;\:\!\?\-\(\)\[\]\{\}\'\"\/\\\@\#\$\%\&\*\=\+\<\>]', '', text)
+            text = _remove_chars(text, _SPECIAL_KEEP_PUNCT, _ASCII_SPECIAL_KEEP_PUNCT)
         else:
             # Keep only alphanumeric and spaces
-            text = re.sub(r'[^\w\s]', '', text)
+            text = _remove_chars(text, _SPECIAL_ALL, _ASCII_SPECIAL_ALL)
         
         return text
     
@@ -92,15 +141,20 @@ class TextPreprocessor:
         if not text:
             return ""
         
-        # Replace multiple spaces with single space
-        text = re.sub(r' +', ' ', text)
+        # Each pass is skipped when a substring check shows it has nothing to do;
+        # the checks run in C and are far cheaper than a regex pass
         
-        # Normalize line breaks
-        text = re.sub(r'\r\n', '\n', text)
-        text = re.sub(r'\r', '\n', text)
+        # Replace multiple spaces with single space (single spaces are left alone)
+        if '  ' in text:
+            text = _MULTI_SPACE.sub(' ', text)
+        
+        # Normalize line breaks (\r\n first, then lone \r, in one pass)
+        if '\r' in text:
+            text = _CRLF.sub('\n', text)
         
         # Remove excessive line breaks (keep max 2 consecutive)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        if '\n\n\n' in text:
+            text = _MULTI_NL.sub('\n\n', text)
         
         # Remove spaces at start/end of lines
         lines = [line.strip() for line in text.split('\n')]
@@ -122,26 +176,9 @@ class TextPreprocessor:
         if not text:
             return ""
         
-        # Common Unicode replacements
-        replacements = {
-            '\u2018': "'",  # Left single quotation mark
-            '\u2019': "'",  # Right single quotation mark
-            '\u201C': '"',  # Left double quotation mark
-            '\u201D': '"',  # Right double quotation mark
-            '\u2013': '-',  # En dash
-            '\u2014': '--',  # Em dash
-            '\u2026': '...',  # Horizontal ellipsis
-            '\u00A0': ' ',  # Non-breaking space
-            '\u200B': '',   # Zero-width space
-            '\u200C': '',   # Zero-width non-joiner
-            '\u200D': '',   # Zero-width joiner
-            '\uFEFF': '',   # Zero-width no-break space
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        
-        return text
+        # Replace all of them in one pass; str.translate handles the
+        # multi-character replacements (em dash, ellipsis) as well
+        return text.translate(_ENCODING_TRANSLATION)
     
     @staticmethod
     def extract_sections(text: str) -> Dict[str, str]:
@@ -168,43 +205,21 @@ class TextPreprocessor:
         if not text:
             return sections
         
-        text_lower = text.lower()
-        
-        # Find section boundaries
-        section_positions = {}
-        
-        for section_name, patterns in TextPreprocessor.SECTION_PATTERNS.items():
-            for pattern in patterns:
-                # Look for section headers (case-insensitive)
-                regex_pattern = rf'(?:^|\n)\s*{pattern}\s*:?\s*\n'
-                matches = list(re.finditer(regex_pattern, text_lower, re.IGNORECASE | re.MULTILINE))
-                
-                if matches:
-                    # Use the first match
-                    section_positions[section_name] = matches[0].start()
-                    break
-        
-        # Sort sections by position in text
-        sorted_sections = sorted(section_positions.items(), key=lambda x: x[1])
+        # Find section headers in text order; only the first header of each section counts
+        headers = []
+        seen = set()
+        for match in TextPreprocessor._SECTION_UNION.finditer(text):
+            if match.lastgroup not in seen:
+                seen.add(match.lastgroup)
+                headers.append(match)
         
         # Extract content between sections
-        if sorted_sections:
-            for i, (section_name, start) in enumerate(sorted_sections):
-                # Find end position (start of next section or end of text)
-                end = sorted_sections[i + 1][1] if i + 1 < len(sorted_sections) else len(text)
-                
-                # Extract section content
-                section_content = text[start:end]
+        if headers:
+            for i, match in enumerate(headers):
+                # Content runs from the end of this header to the start of the next one
+                end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
                 
-                # Remove section header from content
-                section_content = re.sub(
-                    rf'(?:^|\n)\s*{TextPreprocessor.SECTION_PATTERNS[section_name][0]}\s*:?\s*\n',
-                    '',
-                    section_content,
-                    flags=re.IGNORECASE | re.MULTILINE
-                )
-                
-                sections[section_name] = section_content.strip()
+                sections[match.lastgroup] = text[match.end():end].strip()
         else:
             # No clear sections found - put everything in "other"
             sections["other"] = text
@@ -226,12 +241,19 @@ class TextPreprocessor:
         if not text:
             return []
         
-        segments = []
-        
         # Split by paragraphs first
         paragraphs = text.split('\n\n')
         
-        current_segment = ""
+        if len(text) <= max_segment_length:
+            # Stripping and rejoining never makes the text longer, so it is one segment
+            segment = "\n\n".join(filter(None, (paragraph.strip() for paragraph in paragraphs)))
+            return [segment] if segment else []
+        
+        segments = []
+        
+        # Paragraphs of the segment being built, joined once when it is closed
+        current_parts: List[str] = []
+        current_length = 0
         
         for paragraph in paragraphs:
             paragraph = paragraph.strip()
@@ -240,18 +262,19 @@ class TextPreprocessor:
                 continue
             
             # If adding this paragraph would exceed max length, start new segment
-            if current_segment and len(current_segment) + len(paragraph) + 2 > max_segment_length:
-                segments.append(current_segment.strip())
-                current_segment = paragraph
+            if current_parts and current_length + len(paragraph) + 2 > max_segment_length:
+                segments.append("\n\n".join(current_parts))
+                current_parts = [paragraph]
+                current_length = len(paragraph)
             else:
-                if current_segment:
-                    current_segment += "\n\n" + paragraph
-                else:
-                    current_segment = paragraph
+                if current_parts:
+                    current_length += 2
+                current_parts.append(paragraph)
+                current_length += len(paragraph)
         
         # Add remaining segment
-        if current_segment:
-            segments.append(current_segment.strip())
+        if current_parts:
+            segments.append("\n\n".join(current_parts))
         
         return segments
     
@@ -270,13 +293,36 @@ class TextPreprocessor:
             return []
         
         # Simple sentence splitting (can be enhanced with NLP)
-        sentences = re.split(r'[.!?]+\s+', text)
+        sentences = _SENTENCE_SPLIT.split(text)
         
         # Clean sentences
         sentences = [s.strip() for s in sentences if s.strip()]
         
         return sentences
     
+    @staticmethod
+    def count_sentences(text: str) -> int:
+        """
+        Count the sentences extract_sentences would return, without building them.
+        
+        Args:
+            text: Text to count sentences in
+            
+        Returns:
+            Number of non-blank sentences
+        """
+        count = 0
+        start = 0
+        for match in _SENTENCE_SPLIT.finditer(text):
+            if _NON_SPACE.search(text, start, match.start()):
+                count += 1
+            start = match.end()
+        
+        if _NON_SPACE.search(text, start):
+            count += 1
+        
+        return count
+    
     @staticmethod
     def preprocess(text: str, extract_sections_flag: bool = True, segment_flag: bool = True) -> PreprocessedText:
         """
@@ -320,7 +366,7 @@ class TextPreprocessor:
             "cleaned_length": cleaned_length,
             "sections_found": list(sections.keys()) if sections else [],
             "segment_count": len(segments),
-            "sentence_count": len(TextPreprocessor.extract_sentences(cleaned_text)),
+            "sentence_count": TextPreprocessor.count_sentences(cleaned_text),
         }
         
         return PreprocessedText(
@@ -0,0 +1,21 @@
+"""
+Shared pytest fixtures.
+"""
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client shared by the whole session; app startup and shutdown run once."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="module")
+def uploaded_resume_id(client):
+    """File id of a small text resume uploaded once per test module."""
+    files = {"file": ("test_resume.txt", b"Python, JavaScript, React, AWS", "text/plain")}
+    response = client.post("/api/upload/upload-resume", files=files, data={"source_type": "resume"})
+    return response.json()["file_id"]
@@ -2,16 +2,12 @@
 Integration tests for API endpoints.
 """
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
-
-client = TestClient(app)
 
 
 class TestAPIEndpoints:
     """Integration tests for API endpoints."""
 
-    def test_root_endpoint(self):
+    def test_root_endpoint(self, client):
         """Test root endpoint."""
         response = client.get("/")
         assert response.status_code == 200
@@ -20,7 +16,7 @@ class TestAPIEndpoints:
         assert "version" in data
         assert "status" in data
 
-    def test_upload_resume(self):
+    def test_upload_resume(self, client):
         """Test resume upload endpoint."""
         # Create a test file
         test_content = b"Test resume content"
@@ -33,7 +29,7 @@ class TestAPIEndpoints:
         assert "file_id" in data
         assert "filename" in data
 
-    def test_text_input(self):
+    def test_text_input(self, client):
         """Test text input endpoint."""
         payload = {
             "text": "Python developer with 5 years experience",
@@ -45,24 +41,15 @@ class TestAPIEndpoints:
         data = response.json()
         assert "text_id" in data
 
-    def test_extract_skills(self):
+    def test_extract_skills(self, client, uploaded_resume_id):
         """Test skill extraction endpoint."""
-        # First upload a file
-        test_content = b"Python, JavaScript, React, AWS"
-        files = {"file": ("test_resume.txt", test_content, "text/plain")}
-        data = {"source_type": "resume"}
-        
-        upload_response = client.post("/api/upload/upload-resume", files=files, data=data)
-        file_id = upload_response.json()["file_id"]
-        
-        # Then extract skills
-        payload = {"resume_id": file_id}
+        payload = {"resume_id": uploaded_resume_id}
         response = client.post("/api/extract/extract", json=payload)
         assert response.status_code == 200
         data = response.json()
         assert "resume_skills" in data
 
-    def test_analyze_gap(self):
+    def test_analyze_gap(self, client):
         """Test gap analysis endpoint."""
         # Create test skill extraction results
         from app.models.schemas import Skill, SkillExtractionResult
@@ -93,7 +80,7 @@ class TestAPIEndpoints:
         assert "fit_score" in data["report"]
         assert "gap_analysis" in data["report"]
 
-    def test_invalid_file_type(self):
+    def test_invalid_file_type(self, client):
         """Test upload with invalid file type."""
         test_content = b"Test content"
         files = {"file": ("test.exe", test_content, "application/x-msdownload")}
@@ -102,7 +89,7 @@ class TestAPIEndpoints:
         response = client.post("/api/upload/upload-resume", files=files, data=data)
         assert response.status_code == 400
 
-    def test_missing_required_fields(self):
+    def test_missing_required_fields(self, client):
         """Test endpoint with missing required fields."""
         payload = {}
         response = client.post("/api/text/text", json=payload)
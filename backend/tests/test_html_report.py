@@ -0,0 +1,55 @@
+"""
+Tests for the WeasyPrint HTML report renderer.
+"""
+import pytest
+
+pytest.importorskip("weasyprint")
+
+from io import BytesIO
+from app.models.schemas import FitScoreBreakdown, GapAnalysis, Skill, SkillGapReport
+from app.models.skill_taxonomy import SkillCategory
+from app.services.html_pdf_generator import HTMLReportGenerator, _report_url_fetcher
+from app.services.recommendations import RecommendationsGenerator
+
+HOSTILE_NAME = '<link rel="attachment" href="file:///proc/self/environ">'
+
+
+def _hostile_report() -> SkillGapReport:
+    """Build a report whose missing JD skill name is an HTML tag."""
+    gap_analysis = GapAnalysis(
+        missing_skills=[Skill(name=HOSTILE_NAME, category=SkillCategory.PROGRAMMING_LANGUAGES)],
+    )
+    fit_score = FitScoreBreakdown(
+        overall_score=0.0, technical_score=0.0, soft_skills_score=0.0,
+        missing_count=1, total_jd_skills=1,
+    )
+    return SkillGapReport(
+        fit_score=fit_score,
+        gap_analysis=gap_analysis,
+        recommendations=RecommendationsGenerator.generate_recommendations(gap_analysis, 0.0),
+    )
+
+
+class TestHTMLReportGenerator:
+    """Test cases for the HTML report renderer."""
+
+    def test_hostile_skill_name_is_escaped(self):
+        """Skill names from the request never reach the HTML as markup."""
+        html = HTMLReportGenerator().render_html(_hostile_report())
+
+        assert "<link" not in html
+        assert "&lt;link" in html
+        assert "<b>Priority:</b>" in html
+
+    def test_local_and_network_urls_are_refused(self):
+        """The URL fetcher refuses file and network URLs."""
+        for url in ("file:///proc/self/environ", "http://169.254.169.254/", "https://example.com/a.css"):
+            with pytest.raises(ValueError):
+                _report_url_fetcher(url)
+
+    def test_write_pdf_with_hostile_skill_name(self):
+        """A report with a hostile skill name still renders to a PDF."""
+        stream = BytesIO()
+        HTMLReportGenerator().generate_pdf_to_stream(_hostile_report(), stream)
+
+        assert stream.getvalue().startswith(b"%PDF")
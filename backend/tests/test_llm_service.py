@@ -0,0 +1,194 @@
+"""
+Unit tests for the LLM service response cache and Batch API path.
+"""
+import asyncio
+import json
+import pytest
+from types import SimpleNamespace
+from app.services import llm_service as llm_service_module
+from app.services.llm_service import llm_service
+from app.services.skill_extraction import TechnicalSkillsExtractor
+from app.services.soft_skills_extraction import SoftSkillsExtractor
+from app.services.unified_extraction import UnifiedSkillExtractor
+
+RESUME_TEXT = (
+    "Backend engineer who built data pipelines in Python and deployed them with Docker "
+    "on AWS, mentoring two junior developers along the way."
+)
+
+
+@pytest.fixture
+def api_calls(monkeypatch):
+    """Replace the OpenAI clients with ones that record calls, on a fresh response cache."""
+    calls = []
+
+    def create(**params):
+        calls.append(params)
+        if params["response_format"]["json_schema"]["name"] == "SkillList":
+            content = '{"skills": [{"name": "Python", "category": "programming_languages"}]}'
+        else:
+            content = '{"soft_skills": [{"name": "Mentoring", "category": "leadership"}], "education": [], "certifications": []}'
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason="stop")],
+            model=params["model"],
+            usage=SimpleNamespace(prompt_tokens=100, completion_tokens=20, total_tokens=120),
+        )
+
+    async def create_async(**params):
+        return create(**params)
+
+    def loop_state(api_key, max_concurrency):
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create_async)))
+        return SimpleNamespace(client=client, concurrency=asyncio.Semaphore(max_concurrency), inflight={})
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(llm_service, "client", client)
+    monkeypatch.setattr(llm_service_module, "_LoopState", loop_state)
+    monkeypatch.setattr(llm_service, "api_key", "test-key")
+    monkeypatch.setattr(llm_service, "_cache_db", None)
+    return calls
+
+
+class TestLLMResponseCache:
+    """Test cases for reusing LLM responses across repeated extractions."""
+
+    def test_repeated_technical_extraction_is_cached(self, api_calls):
+        """Extracting the same text twice makes a single API call."""
+        first, error = TechnicalSkillsExtractor.extract_skills(RESUME_TEXT)
+        second, _ = TechnicalSkillsExtractor.extract_skills(RESUME_TEXT)
+
+        assert error is None
+        assert len(api_calls) == 1
+        assert api_calls[0]["temperature"] == 0
+        assert [s.name for s in first] == [s.name for s in second]
+
+    def test_repeated_combined_extraction_is_cached(self, api_calls):
+        """The combined soft skill extraction is served from the cache the second time."""
+        first = SoftSkillsExtractor.extract_all(RESUME_TEXT)
+        second = SoftSkillsExtractor.extract_all(RESUME_TEXT)
+
+        assert first[3] is None
+        assert len(api_calls) == 1
+        assert first == second
+
+    def test_rescoring_the_same_resume_makes_no_new_calls(self, api_calls):
+        """A second full extraction of the same text is served entirely from the cache."""
+        first, error = asyncio.run(UnifiedSkillExtractor.extract_from_text(RESUME_TEXT))
+        calls_after_first = len(api_calls)
+        second, _ = asyncio.run(UnifiedSkillExtractor.extract_from_text(RESUME_TEXT))
+
+        assert error is None
+        assert calls_after_first == 2  # Technical skills and the combined soft skill request
+        assert len(api_calls) == calls_after_first
+        assert [s.name for s in first.skills] == [s.name for s in second.skills]
+
+    def test_concurrent_identical_extractions_share_calls(self, api_calls, monkeypatch):
+        """Identical extractions in flight together share one call per request, even uncached."""
+        monkeypatch.setattr(llm_service, "cache_ttl", 0)
+
+        async def extract_twice():
+            return await asyncio.gather(
+                UnifiedSkillExtractor.extract_from_text(RESUME_TEXT),
+                UnifiedSkillExtractor.extract_from_text(RESUME_TEXT),
+            )
+
+        (first, error), (second, _) = asyncio.run(extract_twice())
+
+        assert error is None
+        assert len(api_calls) == 2
+        assert [s.name for s in first.skills] == [s.name for s in second.skills]
+
+    def test_sampled_calls_are_not_cached(self, api_calls):
+        """Requests at a non-zero temperature always reach the API."""
+        messages = [{"role": "user", "content": "Suggest a course"}]
+        response_format = {"type": "json_schema", "json_schema": {"name": "Other"}}
+        llm_service.call_api(messages, temperature=0.7, response_format=response_format)
+        llm_service.call_api(messages, temperature=0.7, response_format=response_format)
+
+        assert len(api_calls) == 2
+
+
+@pytest.fixture
+def batch_api(monkeypatch):
+    """Replace the OpenAI client with a fake Batch API whose batch finishes when told to."""
+    state = {"status": "in_progress", "requests": [], "chat_calls": 0}
+    content = '{"soft_skills": [{"name": "Mentoring", "category": "leadership"}], "education": [], "certifications": []}'
+
+    def create_file(file, purpose):
+        state["requests"] = [json.loads(line) for line in file[1].decode("utf-8").splitlines()]
+        return SimpleNamespace(id="file-in")
+
+    def file_content(file_id):
+        lines = [
+            json.dumps({
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 200, "body": {
+                    "model": request["body"]["model"],
+                    "choices": [{"message": {"content": content}, "finish_reason": "stop"}],
+                    "usage": {"prompt_tokens": 100, "completion_tokens": 20, "total_tokens": 120},
+                }},
+            })
+            for request in state["requests"]
+        ]
+        return SimpleNamespace(text="\n".join(lines))
+
+    def get(path, cast_to):
+        batch = {"id": "batch-1", "status": state["status"], "output_file_id": "file-out"}
+        return SimpleNamespace(json=lambda: batch)
+
+    def create_chat(**params):
+        state["chat_calls"] += 1
+        raise AssertionError("Batched texts should not reach the chat API")
+
+    client = SimpleNamespace(
+        files=SimpleNamespace(create=create_file, content=file_content),
+        post=lambda path, body, cast_to: SimpleNamespace(json=lambda: {"id": "batch-1", "status": "validating"}),
+        get=get,
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create_chat)),
+    )
+    monkeypatch.setattr(llm_service, "client", client)
+    monkeypatch.setattr(llm_service, "api_key", "test-key")
+    monkeypatch.setattr(llm_service, "_cache_db", None)
+    return state
+
+
+class TestBatchExtraction:
+    """Test cases for submitting and collecting batched soft skill extractions."""
+
+    def test_submit_then_collect(self, batch_api):
+        """A batch is submitted without waiting and collected once it completes."""
+        texts = [RESUME_TEXT, f"  {RESUME_TEXT}\n", "short"]
+
+        batch_id, error = SoftSkillsExtractor.submit_batch(texts)
+
+        assert error is None
+        assert batch_id == "batch-1"
+        assert len(batch_api["requests"]) == 1  # Duplicates once trimmed share a request
+        assert SoftSkillsExtractor.collect_batch(batch_id, texts) is None
+
+        batch_api["status"] = "completed"
+        results = SoftSkillsExtractor.collect_batch(batch_id, texts)
+
+        assert [result[3] for result in results] == [None, None, "Text is too short or empty"]
+        assert [s.name for s in results[0][0]] == ["Mentoring"]
+        assert results[0] == results[1] and results[0][0] is not results[1][0]
+
+    def test_collected_responses_are_cached(self, batch_api):
+        """A later interactive extraction of a batched text is served from the cache."""
+        batch_id, _ = SoftSkillsExtractor.submit_batch([RESUME_TEXT])
+        batch_api["status"] = "completed"
+        SoftSkillsExtractor.collect_batch(batch_id, [RESUME_TEXT])
+
+        skills, _, _, error = SoftSkillsExtractor.extract_all(RESUME_TEXT)
+
+        assert error is None
+        assert batch_api["chat_calls"] == 0
+
+    def test_failed_batch_reports_errors(self, batch_api):
+        """Every text gets an error when the batch fails."""
+        batch_id, _ = SoftSkillsExtractor.submit_batch([RESUME_TEXT])
+        batch_api["status"] = "expired"
+
+        results = SoftSkillsExtractor.collect_batch(batch_id, [RESUME_TEXT])
+
+        assert results[0][3].startswith("Error running batch extraction")
@@ -0,0 +1,62 @@
+"""
+Unit tests for prompt text chunking.
+"""
+import pytest
+from app.services.prompts import (
+    SkillExtractionPrompts,
+    _CHUNK_OVERLAP_CHARS,
+    _MAX_PROMPT_CHARS,
+)
+
+
+SKILLS = ["Python", "Docker", "Kubernetes", "AWS", "PostgreSQL", "Terraform", "Java", "Git"]
+
+
+def _sentences(count: int) -> list:
+    """Resume-style sentences, each naming one known skill."""
+    return [
+        f"Built and operated internal services with {SKILLS[i % len(SKILLS)]} for team number {i}."
+        for i in range(count)
+    ]
+
+
+class TestSplitText:
+    """Test cases for splitting long texts into prompt-sized chunks."""
+
+    def test_short_text_is_one_chunk(self):
+        """Text within budget comes back unchanged."""
+        text = "Python developer with Docker experience"
+        assert SkillExtractionPrompts.split_text(text, "gpt-4o") == [text]
+
+    def test_newline_free_text_splits_at_sentences(self):
+        """Cleaned single-line text is split at sentence ends, without cutting words."""
+        sentences = _sentences(600)
+        text = " ".join(sentences)
+        assert "\n" not in text and len(text) > 3 * _MAX_PROMPT_CHARS
+
+        chunks = SkillExtractionPrompts.split_text(text, "gpt-4o")
+
+        assert 1 < len(chunks) <= len(text) // (_MAX_PROMPT_CHARS - _CHUNK_OVERLAP_CHARS) + 1
+        assert all(len(chunk) <= _MAX_PROMPT_CHARS for chunk in chunks)
+        pieces = [piece for chunk in chunks for piece in chunk.split("\n")]
+        assert set(pieces) == set(sentences)
+        # Only a bounded overlap is repeated between chunks
+        assert sum(len(chunk) for chunk in chunks) <= len(text) + len(chunks) * (_CHUNK_OVERLAP_CHARS + 1)
+
+    def test_newline_free_text_matches_line_split(self):
+        """The same text with or without its newlines makes the same number of chunks."""
+        sentences = _sentences(600)
+        single_line = SkillExtractionPrompts.split_text(" ".join(sentences), "gpt-4o")
+        multi_line = SkillExtractionPrompts.split_text("\n".join(sentences), "gpt-4o")
+
+        assert len(single_line) == len(multi_line)
+
+    def test_overlong_sentence_splits_at_whitespace(self):
+        """A sentence longer than a chunk is split between words."""
+        words = [f"Python{i}" for i in range(5000)]
+        text = " ".join(words)
+
+        chunks = SkillExtractionPrompts.split_text(text, "gpt-4o")
+
+        assert len(chunks) > 1
+        assert {word for chunk in chunks for word in chunk.split()} == set(words)
@@ -0,0 +1,51 @@
+"""
+Unit tests for the technical skill keyword pre-pass.
+"""
+import pytest
+from app.services.llm_service import llm_service
+from app.services.skill_extraction import TechnicalSkillsExtractor
+
+PROSE = (
+    "Trained staff to react quickly to customer complaints and reported to Mark Jenkins. "
+    "Painted the office azure."
+)
+
+
+@pytest.fixture
+def llm_finds_nothing(monkeypatch):
+    """Make every LLM extraction call return no skills, recording the texts it was given."""
+    texts = []
+
+    def extract_chunk(text):
+        texts.append(text)
+        return []
+
+    monkeypatch.setattr(llm_service, "is_configured", lambda: True)
+    monkeypatch.setattr(TechnicalSkillsExtractor, "_extract_chunk", staticmethod(extract_chunk))
+    return texts
+
+
+class TestKnownSkillsPrepass:
+    """Test cases for keyword hits alongside the LLM."""
+
+    def test_prose_keyword_hits_are_not_skills(self, llm_finds_nothing):
+        """Skill names used as ordinary words in prose are not added to the result."""
+        skills, error = TechnicalSkillsExtractor.extract_skills(PROSE)
+
+        assert error is None
+        assert skills == []
+        assert llm_finds_nothing == [PROSE]
+
+    def test_known_skills_list_skips_llm(self, llm_finds_nothing):
+        """A short list made up only of known skills is answered by keyword match."""
+        skills, error = TechnicalSkillsExtractor.extract_skills("Python, React, Azure, Jenkins")
+
+        assert error is None
+        assert [skill.name for skill in skills] == ["Python", "React", "Azure", "Jenkins"]
+        assert llm_finds_nothing == []
+
+    def test_list_with_unknown_item_uses_llm(self, llm_finds_nothing):
+        """A list with any unknown item goes to the LLM."""
+        TechnicalSkillsExtractor.extract_skills("Python, React, Elixir")
+
+        assert len(llm_finds_nothing) == 1
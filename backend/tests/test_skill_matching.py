@@ -100,3 +100,35 @@ class TestSkillMatcher:
         assert len(extra) == 1
         assert extra[0].name == "JavaScript"
 
+
+    def test_find_matches_prefers_exact_over_earlier_synonym(self):
+        """An exact match wins over a synonym that appears earlier in the resume."""
+        resume_skills = [
+            Skill(name="JS", category=SkillCategory.PROGRAMMING_LANGUAGES),
+            Skill(name="JavaScript", category=SkillCategory.PROGRAMMING_LANGUAGES),
+        ]
+        jd_skills = [
+            Skill(name="javascript", category=SkillCategory.PROGRAMMING_LANGUAGES),
+            Skill(name="ECMAScript", category=SkillCategory.PROGRAMMING_LANGUAGES),
+        ]
+        
+        matches = SkillMatcher.find_matches(resume_skills, jd_skills)
+        assert [(m.skill.name, m.match_type) for m in matches] == [
+            ("JavaScript", "exact"),
+            ("JS", "synonym"),
+        ]
+
+    def test_find_matches_does_not_let_earlier_jd_skill_steal(self):
+        """A resume skill goes to the JD skill that has no other candidate."""
+        pytest.importorskip("scipy")
+        resume_skills = [
+            Skill(name="NoSQL", category=SkillCategory.DATABASES),
+            Skill(name="SQL", category=SkillCategory.DATABASES),
+        ]
+        jd_skills = [
+            Skill(name="MySQL", category=SkillCategory.DATABASES),
+            Skill(name="PL/SQL", category=SkillCategory.DATABASES),
+        ]
+        
+        matches = SkillMatcher.find_matches(resume_skills, jd_skills)
+        assert [m.skill.name for m in matches] == ["NoSQL", "SQL"]
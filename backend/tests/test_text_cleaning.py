@@ -0,0 +1,47 @@
+"""
+Unit tests for text cleaning utilities.
+"""
+import pytest
+from app.utils.text_cleaning import (
+    clean_extracted_text,
+    clean_text,
+    normalize_whitespace,
+    remove_encoding_issues,
+)
+
+
+SAMPLES = [
+    "",
+    "   ",
+    "Python, Java & C++",
+    "Senior Engineer — 5–7 years…",
+    "“Led” the team’s ‘migration’",
+    "Line one\r\nLine two\r\rLine three\n\n\n\nLine four",
+    "Skills:\t\tDocker • Kubernetes • AWS",
+    "  Emoji \U0001F680 and © symbols  ",
+    "email@example.com | (555) 123-4567 | 50% <b>",
+]
+
+
+class TestCleanExtractedText:
+    """Test cases for the fused cleaning pass."""
+
+    @pytest.mark.parametrize("text", SAMPLES)
+    def test_matches_three_pass_pipeline(self, text):
+        """Fused cleaning gives the same output as the three helpers in sequence."""
+        expected = clean_text(normalize_whitespace(remove_encoding_issues(text)))
+        assert clean_extracted_text(text) == expected
+
+    def test_fixes_encoding_and_whitespace(self):
+        """Smart punctuation is replaced and whitespace collapsed."""
+        text = "“Hello” —\n\n\nworld…"
+        assert clean_extracted_text(text) == '"Hello" -- world...'
+
+
+class TestCleanText:
+    """Test cases for clean_text."""
+
+    @pytest.mark.parametrize("text", SAMPLES)
+    def test_subsumes_normalize_whitespace(self, text):
+        """A prior normalize_whitespace pass does not change the result."""
+        assert clean_text(text) == clean_text(normalize_whitespace(text))